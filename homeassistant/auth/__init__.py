@@ -3,12 +3,13 @@ import asyncio
 from collections import OrderedDict
 from datetime import timedelta
 import logging
+import time
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 import jwt
 
 from homeassistant import data_entry_flow
-from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
+from homeassistant.auth.const import ACCESS_TOKEN_CACHE_SIZE, ACCESS_TOKEN_EXPIRATION
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
@@ -146,6 +147,9 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Validated access tokens with their refresh token and expiration
+        self._access_tokens: "OrderedDict[str, Tuple[models.RefreshToken, int]]"
+        self._access_tokens = OrderedDict()
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -279,6 +283,7 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(user=user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -305,6 +310,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_forget_access_tokens(user=user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -431,6 +437,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(refresh_token=refresh_token)
 
     @callback
     def async_create_access_token(
@@ -453,7 +460,19 @@ class AuthManager:
     async def async_validate_access_token(
         self, token: str
     ) -> Optional[models.RefreshToken]:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        Valid tokens are remembered until they expire, they are not decoded
+        again for every request.
+        """
+        cached = self._access_tokens.get(token)
+        if cached is not None:
+            refresh_token, expiration = cached
+            if time.time() < expiration and refresh_token.user.is_active:
+                self._access_tokens.move_to_end(token)
+                return refresh_token
+            del self._access_tokens[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -471,15 +490,35 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if "exp" in claims:
+            self._access_tokens[token] = (refresh_token, claims["exp"])
+            if len(self._access_tokens) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_tokens.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_forget_access_tokens(
+        self,
+        user: Optional[models.User] = None,
+        refresh_token: Optional[models.RefreshToken] = None,
+    ) -> None:
+        """Forget the validated access tokens of a user or refresh token."""
+        for token, (cached_refresh_token, _) in list(self._access_tokens.items()):
+            if cached_refresh_token is refresh_token:
+                del self._access_tokens[token]
+            elif user is not None and cached_refresh_token.user is user:
+                del self._access_tokens[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
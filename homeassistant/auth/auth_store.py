@@ -7,7 +7,12 @@ from logging import getLogger
 from typing import Any, Dict, List, Optional
 
 from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    async_entries_for_device,
+)
 from homeassistant.util import dt as dt_util
 
 from . import models
@@ -36,6 +41,8 @@ class AuthStore:
         self.hass = hass
         self._users: Optional[Dict[str, models.User]] = None
         self._groups: Optional[Dict[str, models.Group]] = None
+        # Index of the refresh tokens of all users by id
+        self._refresh_tokens: Dict[str, models.RefreshToken] = {}
         self._perm_lookup: Optional[PermissionLookup] = None
         self._store = hass.helpers.storage.Store(
             STORAGE_VERSION, STORAGE_KEY, private=True
@@ -141,6 +148,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for token_id in user.refresh_tokens:
+            self._refresh_tokens.pop(token_id, None)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -223,6 +232,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens[refresh_token.id] = refresh_token
 
         self._async_schedule_save()
         return refresh_token
@@ -235,10 +245,10 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        found = self._refresh_tokens.pop(refresh_token.id, None)
+        if found is not None:
+            found.user.refresh_tokens.pop(found.id, None)
+            self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -248,12 +258,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -302,6 +307,12 @@ class AuthStore:
             return
 
         self._perm_lookup = perm_lookup = PermissionLookup(ent_reg, dev_reg)
+        self.hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+        self.hass.bus.async_listen(
+            EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+        )
 
         if data is None:
             self._set_defaults()
@@ -474,6 +485,35 @@ class AuthStore:
 
         self._groups = groups
         self._users = users
+        self._refresh_tokens = {
+            token.id: token
+            for user in users.values()
+            for token in user.refresh_tokens.values()
+        }
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Forget the permission checks of an updated entity."""
+        assert self._perm_lookup is not None
+        entity_ids = [event.data["entity_id"]]
+        if "old_entity_id" in event.data:
+            entity_ids.append(event.data["old_entity_id"])
+        self._perm_lookup.invalidate_entities(entity_ids)
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Forget the permission checks of the entities of an updated device.
+
+        The area of an entity is the area of its device, removing an area
+        updates its devices.
+        """
+        assert self._perm_lookup is not None
+        self._perm_lookup.invalidate_entities(
+            entry.entity_id
+            for entry in async_entries_for_device(
+                self._perm_lookup.entity_registry, event.data["device_id"]
+            )
+        )
 
     @callback
     def _async_schedule_save(self) -> None:
@@ -1,11 +1,16 @@
 """Permissions for Home Assistant."""
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 import voluptuous as vol
 
 from .const import CAT_ENTITIES
-from .entities import ENTITY_POLICY_SCHEMA, compile_entities
+from .entities import (
+    ENTITY_AREAS,
+    ENTITY_DEVICE_IDS,
+    ENTITY_POLICY_SCHEMA,
+    compile_entities,
+)
 from .merge import merge_policies  # noqa: F401
 from .models import PermissionLookup
 from .types import PolicyType
@@ -46,6 +51,36 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        # Results of the entity checks by key and entity id
+        self._entity_checks: Dict[str, Dict[str, bool]] = {}
+
+        # Area and device policies depend on the registries
+        entities_policy = policy.get(CAT_ENTITIES)
+        if perm_lookup is not None and isinstance(entities_policy, dict):
+            if ENTITY_AREAS in entities_policy or ENTITY_DEVICE_IDS in entities_policy:
+                perm_lookup.add_registry_permissions(self)
+
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity.
+
+        The result is remembered until the entity or its device is updated
+        in the registries.
+        """
+        checks = self._entity_checks.get(key)
+        if checks is None:
+            checks = self._entity_checks[key] = {}
+
+        allowed = checks.get(entity_id)
+        if allowed is None:
+            allowed = checks[entity_id] = super().check_entity(entity_id, key)
+
+        return allowed
+
+    def invalidate_entities(self, entity_ids: Iterable[str]) -> None:
+        """Forget the remembered checks of entities."""
+        for checks in self._entity_checks.values():
+            for entity_id in entity_ids:
+                checks.pop(entity_id, None)
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
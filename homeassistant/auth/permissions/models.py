@@ -1,5 +1,6 @@
 """Models for permissions."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
+import weakref
 
 import attr
 
@@ -8,6 +9,8 @@ if TYPE_CHECKING:
     from homeassistant.helpers import entity_registry as ent_reg  # noqa: F401
     from homeassistant.helpers import device_registry as dev_reg  # noqa: F401
 
+    from . import PolicyPermissions  # noqa: F401
+
 
 @attr.s(slots=True)
 class PermissionLookup:
@@ -15,3 +18,21 @@ class PermissionLookup:
 
     entity_registry = attr.ib(type="ent_reg.EntityRegistry")
     device_registry = attr.ib(type="dev_reg.DeviceRegistry")
+    # Permissions with remembered entity checks that depend on the registries
+    _registry_permissions = attr.ib(
+        type="weakref.WeakValueDictionary[int, PolicyPermissions]",
+        factory=weakref.WeakValueDictionary,
+        init=False,
+        eq=False,
+        repr=False,
+    )
+
+    def add_registry_permissions(self, permissions: "PolicyPermissions") -> None:
+        """Add permissions that remember entity checks using the registries."""
+        self._registry_permissions[id(permissions)] = permissions
+
+    def invalidate_entities(self, entity_ids: Iterable[str]) -> None:
+        """Forget the remembered checks of entities after a registry update."""
+        entity_ids = list(entity_ids)
+        for permissions in list(self._registry_permissions.values()):
+            permissions.invalidate_entities(entity_ids)
@@ -20,7 +20,11 @@ from homeassistant.const import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.setup import DATA_SETUP, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP,
+    async_get_setup_timings,
+    async_setup_component,
+)
 from homeassistant.util.logging import async_activate_log_queue_handler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
@@ -423,3 +427,19 @@ async def _async_set_up_integrations(
 
     # Wrap up startup
     await hass.async_block_till_done()
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Integration import and setup times:\n%s",
+            _format_setup_timings(async_get_setup_timings(hass)),
+        )
+
+
+def _format_setup_timings(timings: Dict[str, Dict[str, float]]) -> str:
+    """Format the import and setup times, slowest integrations first."""
+    return "\n".join(
+        f"{domain}: import {timing['import']:.3f}s, setup {timing['setup']:.3f}s"
+        for domain, timing in sorted(
+            timings.items(), key=lambda item: -sum(item[1].values())
+        )
+    )
@@ -4,7 +4,7 @@ import json
 import logging
 
 from aiohttp import web
-from aiohttp.web_exceptions import HTTPBadRequest
+from aiohttp.web_exceptions import HTTPBadRequest, HTTPInternalServerError
 import async_timeout
 import voluptuous as vol
 
@@ -12,6 +12,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
@@ -225,7 +226,7 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        return _states_json_response(states)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -243,7 +244,7 @@ class APIEntityStateView(HomeAssistantView):
 
         state = request.app["hass"].states.get(entity_id)
         if state:
-            return self.json(state)
+            return _state_json_response(state)
         return self.json_message("Entity not found.", HTTP_NOT_FOUND)
 
     async def post(self, request, entity_id):
@@ -273,7 +274,7 @@ class APIEntityStateView(HomeAssistantView):
 
         # Read the state back for our response
         status_code = HTTP_CREATED if is_new_state else HTTP_OK
-        resp = self.json(hass.states.get(entity_id), status_code)
+        resp = _state_json_response(hass.states.get(entity_id), status_code)
 
         resp.headers.add("Location", f"/api/states/{entity_id}")
 
@@ -426,6 +427,35 @@ class APIErrorLog(HomeAssistantView):
         return web.FileResponse(request.app["hass"].data[DATA_LOGGING])
 
 
+def _state_json_response(state, status_code=HTTP_OK):
+    """Return a JSON response with the cached JSON of a state."""
+    try:
+        body = state.as_json()
+    except (ValueError, TypeError) as err:
+        _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, state)
+        raise HTTPInternalServerError
+    return _json_response(body, status_code)
+
+
+def _states_json_response(states):
+    """Return a JSON response with the cached JSON of states."""
+    try:
+        body = f"[{', '.join(state.as_json() for state in states)}]"
+    except (ValueError, TypeError) as err:
+        _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, states)
+        raise HTTPInternalServerError
+    return _json_response(body, HTTP_OK)
+
+
+def _json_response(body, status_code):
+    """Return a compressed response with an encoded JSON body."""
+    response = web.Response(
+        body=body.encode("UTF-8"), content_type=CONTENT_TYPE_JSON, status=status_code
+    )
+    response.enable_compression()
+    return response
+
+
 async def async_services_json(hass):
     """Generate services data to JSONify."""
     descriptions = await async_get_all_descriptions(hass)
@@ -1,10 +1,11 @@
 """Offer event listening automation rules."""
 import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import voluptuous as vol
 
 from homeassistant.const import CONF_PLATFORM
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 
 # mypy: allow-untyped-defs
@@ -12,6 +13,12 @@ from homeassistant.helpers import config_validation as cv
 CONF_EVENT_TYPE = "event_type"
 CONF_EVENT_DATA = "event_data"
 
+DATA_EVENT_TRIGGERS = "automation_event_triggers"
+
+# Event data keys that tell apart the devices and entities firing an event,
+# preferred when indexing the triggers of an event type.
+DISCRIMINATING_KEYS = ("device_ieee", "unique_id", "device_id", "entity_id")
+
 _LOGGER = logging.getLogger(__name__)
 
 TRIGGER_SCHEMA = vol.Schema(
@@ -53,4 +60,106 @@ async def async_attach_trigger(
             )
         )
 
-    return hass.bus.async_listen(event_type, handle_event)
+    item = _discriminating_item(config.get(CONF_EVENT_DATA))
+
+    return _async_track_event_trigger(hass, event_type, item, handle_event)
+
+
+class _EventTriggers:
+    """Triggers of an event type indexed by a discriminating event data item."""
+
+    __slots__ = ("unindexed", "indexed", "remove_listener")
+
+    def __init__(self) -> None:
+        """Initialize the triggers."""
+        self.unindexed: List[Callable[[Event], None]] = []
+        self.indexed: Dict[str, Dict[str, List[Callable[[Event], None]]]] = {}
+        self.remove_listener: Optional[CALLBACK_TYPE] = None
+
+    def __bool__(self) -> bool:
+        """Return if there are triggers left."""
+        return bool(self.unindexed or self.indexed)
+
+
+def _discriminating_item(event_data: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+    """Return the event data item to index a trigger with event_data by.
+
+    Only text values are used, they match an event by equality.
+    """
+    if not event_data:
+        return None
+
+    keys = [key for key in DISCRIMINATING_KEYS if key in event_data]
+    keys.extend(sorted(key for key in event_data if isinstance(key, str)))
+
+    for key in keys:
+        if isinstance(event_data[key], str):
+            return key, event_data[key]
+
+    return None
+
+
+@callback
+def _async_track_event_trigger(
+    hass: HomeAssistant,
+    event_type: str,
+    item: Optional[Tuple],
+    handler: Callable[[Event], None],
+) -> CALLBACK_TYPE:
+    """Call handler for events of event_type that have the event data item.
+
+    All triggers of an event type share one bus listener, which only calls
+    the handlers of the triggers that can match the event data.
+    """
+    all_triggers = hass.data.setdefault(DATA_EVENT_TRIGGERS, {})
+    triggers = all_triggers.get(event_type)
+
+    if triggers is None:
+        triggers = all_triggers[event_type] = _EventTriggers()
+
+        @callback
+        def _async_event_trigger_dispatcher(event: Event) -> None:
+            """Dispatch an event to the triggers that can match its data."""
+            handlers = triggers.unindexed[:]
+
+            for key, by_value in triggers.indexed.items():
+                value = event.data.get(key)
+                if isinstance(value, str) and value in by_value:
+                    handlers.extend(by_value[value])
+
+            for job in handlers:
+                try:
+                    hass.async_run_job(job, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error while processing event %s", event_type)
+
+        triggers.remove_listener = hass.bus.async_listen(
+            event_type, _async_event_trigger_dispatcher
+        )
+
+    if item is None:
+        handlers = triggers.unindexed
+    else:
+        key, value = item
+        handlers = triggers.indexed.setdefault(key, {}).setdefault(value, [])
+
+    handlers.append(handler)
+
+    @callback
+    def async_remove() -> None:
+        """Remove the trigger."""
+        handlers.remove(handler)
+
+        if item is not None and not handlers:
+            key, value = item
+            by_value = triggers.indexed[key]
+            del by_value[value]
+            if not by_value:
+                del triggers.indexed[key]
+
+        if not triggers:
+            assert triggers.remove_listener is not None
+            triggers.remove_listener()
+            del all_triggers[event_type]
+
+    return async_remove
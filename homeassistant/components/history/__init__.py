@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from collections import defaultdict
 from datetime import timedelta
-from itertools import groupby
+from itertools import chain, groupby
 import logging
 import time
 
@@ -9,8 +9,12 @@ from sqlalchemy import and_, func
 import voluptuous as vol
 
 from homeassistant.components import recorder
-from homeassistant.components.http import HomeAssistantView
-from homeassistant.components.recorder.models import States
+from homeassistant.components.http import HomeAssistantView, iter_json_array
+from homeassistant.components.recorder.models import States, Statistics
+from homeassistant.components.recorder.statistics import (
+    PERIODS,
+    statistics_during_period,
+)
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     ATTR_HIDDEN,
@@ -68,24 +72,9 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    if significant_changes_only:
-        query = session.query(States).filter(
-            (
-                States.domain.in_(SIGNIFICANT_DOMAINS)
-                | (States.last_changed == States.last_updated)
-            )
-            & (States.last_updated > start_time)
-        )
-    else:
-        query = session.query(States).filter(States.last_updated > start_time)
-
-    if filters:
-        query = filters.apply(query, entity_ids)
-
-    if end_time is not None:
-        query = query.filter(States.last_updated < end_time)
-
-    query = query.order_by(States.last_updated)
+    query = _significant_states_query(
+        session, start_time, end_time, entity_ids, filters, significant_changes_only
+    ).order_by(States.last_updated)
 
     states = (
         state
@@ -108,6 +97,30 @@ def _get_significant_states(
     )
 
 
+def _significant_states_query(
+    session, start_time, end_time, entity_ids, filters, significant_changes_only
+):
+    """Return an unordered query of the states in start_time - end_time."""
+    if significant_changes_only:
+        query = session.query(States).filter(
+            (
+                States.domain.in_(SIGNIFICANT_DOMAINS)
+                | (States.last_changed == States.last_updated)
+            )
+            & (States.last_updated > start_time)
+        )
+    else:
+        query = session.query(States).filter(States.last_updated > start_time)
+
+    if filters:
+        query = filters.apply(query, entity_ids)
+
+    if end_time is not None:
+        query = query.filter(States.last_updated < end_time)
+
+    return query
+
+
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
 
@@ -297,6 +310,27 @@ def _states_to_json(
     return {key: val for key, val in result.items() if val}
 
 
+def _merge_start_states(start_states, states):
+    """Yield the states of each entity, in order of entity_id.
+
+    states must be ordered by entity_id. The state at the start time of an
+    entity comes first, entities without changes get a list of just that.
+    """
+    pending = sorted(start_states, reverse=True)
+
+    for entity_id, group in groupby(states, lambda state: state.entity_id):
+        while pending and pending[-1] < entity_id:
+            yield [start_states[pending.pop()]]
+
+        if pending and pending[-1] == entity_id:
+            yield chain([start_states[pending.pop()]], group)
+        else:
+            yield group
+
+    while pending:
+        yield [start_states[pending.pop()]]
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = list(get_states(hass, utc_point_in_time, (entity_id,), run))
@@ -376,6 +410,32 @@ class HistoryPeriodView(HomeAssistantView):
 
         hass = request.app["hass"]
 
+        resolution = request.query.get("resolution")
+        if resolution is not None:
+            if resolution not in PERIODS:
+                return self.json_message("Invalid resolution", HTTP_BAD_REQUEST)
+
+            return await hass.async_add_executor_job(
+                self._sorted_statistics_json,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                resolution,
+            )
+
+        if "stream" in request.query:
+            return await self.json_stream(
+                request,
+                self._stream_significant_states_json,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+            )
+
         return await hass.async_add_executor_job(
             self._sorted_significant_states_json,
             hass,
@@ -415,20 +475,108 @@ class HistoryPeriodView(HomeAssistantView):
             elapsed = time.perf_counter() - timer_start
             _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
 
-        # Optionally reorder the result to respect the ordering given
-        # by any entities explicitly included in the configuration.
-        if self.use_include_order:
-            sorted_result = []
-            for order_entity in self.filters.included_entities:
-                for state_list in result:
-                    if state_list[0].entity_id == order_entity:
-                        sorted_result.append(state_list)
-                        result.remove(state_list)
-                        break
-            sorted_result.extend(result)
-            result = sorted_result
+        return self.json(self._sort_result(result, lambda state: state.entity_id))
 
-        return self.json(result)
+    def _stream_significant_states_json(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+    ):
+        """Generate significant states from the database as JSON fragments.
+
+        States are read in batches ordered by entity, only the states at
+        start_time are held in memory. The lists are in order of entity_id,
+        use_include_order is not applied.
+        """
+        with session_scope(hass=hass) as session:
+            start_states = {}
+            if include_start_time_state:
+                run = recorder.run_information_from_instance(hass, start_time)
+                for state in _get_states_with_session(
+                    session, start_time, entity_ids, run=run, filters=self.filters
+                ):
+                    state.last_changed = start_time
+                    state.last_updated = start_time
+                    start_states[state.entity_id] = state
+
+            query = _significant_states_query(
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                significant_changes_only,
+            ).order_by(States.entity_id, States.last_updated)
+
+            states = (
+                state
+                for state in (row.to_native() for row in query.yield_per(500))
+                if state is not None
+                and _is_significant(state)
+                and not state.attributes.get(ATTR_HIDDEN, False)
+            )
+
+            yield "["
+            for index, entity_states in enumerate(
+                _merge_start_states(start_states, states)
+            ):
+                if index:
+                    yield ","
+                yield from iter_json_array(entity_states)
+            yield "]"
+
+    def _sorted_statistics_json(self, hass, start_time, end_time, entity_ids, period):
+        """Fetch statistics of a resolution from the database as json.
+
+        The number of rows scales with the number of periods instead of
+        the number of recorded states.
+        """
+        timer_start = time.perf_counter()
+
+        with session_scope(hass=hass) as session:
+            query = statistics_during_period(
+                session, start_time, end_time, period=period
+            )
+            query = self.filters.apply(query, entity_ids, Statistics)
+            result = [
+                list(group)
+                for _, group in groupby(
+                    execute(query), lambda statistic: statistic["entity_id"]
+                )
+            ]
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug(
+                "Extracted %d statistics in %fs", sum(map(len, result)), elapsed
+            )
+
+        return self.json(
+            self._sort_result(result, lambda statistic: statistic["entity_id"])
+        )
+
+    def _sort_result(self, result, get_entity_id):
+        """Optionally reorder the result.
+
+        Respects the ordering given by any entities explicitly included in
+        the configuration.
+        """
+        if not self.use_include_order:
+            return result
+
+        sorted_result = []
+        for order_entity in self.filters.included_entities:
+            for item_list in result:
+                if get_entity_id(item_list[0]) == order_entity:
+                    sorted_result.append(item_list)
+                    result.remove(item_list)
+                    break
+        sorted_result.extend(result)
+        return sorted_result
 
 
 class Filters:
@@ -441,9 +589,12 @@ class Filters:
         self.included_entities = []
         self.included_domains = []
 
-    def apply(self, query, entity_ids=None):
+    def apply(self, query, entity_ids=None, model=States):
         """Apply the include/exclude filter on domains and entities on query.
 
+        The model is the queried table, it needs a domain and an entity_id
+        column.
+
         Following rules apply:
         * only the include section is configured - just query the specified
           entities or domains.
@@ -455,43 +606,43 @@ class Filters:
 
         # specific entities requested - do not in/exclude anything
         if entity_ids is not None:
-            return query.filter(States.entity_id.in_(entity_ids))
-        query = query.filter(~States.domain.in_(IGNORE_DOMAINS))
+            return query.filter(model.entity_id.in_(entity_ids))
+        query = query.filter(~model.domain.in_(IGNORE_DOMAINS))
 
         filter_query = None
         # filter if only excluded domain is configured
         if self.excluded_domains and not self.included_domains:
-            filter_query = ~States.domain.in_(self.excluded_domains)
+            filter_query = ~model.domain.in_(self.excluded_domains)
             if self.included_entities:
-                filter_query &= States.entity_id.in_(self.included_entities)
+                filter_query &= model.entity_id.in_(self.included_entities)
         # filter if only included domain is configured
         elif not self.excluded_domains and self.included_domains:
-            filter_query = States.domain.in_(self.included_domains)
+            filter_query = model.domain.in_(self.included_domains)
             if self.included_entities:
-                filter_query |= States.entity_id.in_(self.included_entities)
+                filter_query |= model.entity_id.in_(self.included_entities)
         # filter if included and excluded domain is configured
         elif self.excluded_domains and self.included_domains:
-            filter_query = ~States.domain.in_(self.excluded_domains)
+            filter_query = ~model.domain.in_(self.excluded_domains)
             if self.included_entities:
-                filter_query &= States.domain.in_(
+                filter_query &= model.domain.in_(
                     self.included_domains
-                ) | States.entity_id.in_(self.included_entities)
+                ) | model.entity_id.in_(self.included_entities)
             else:
-                filter_query &= States.domain.in_(
+                filter_query &= model.domain.in_(
                     self.included_domains
-                ) & ~States.domain.in_(self.excluded_domains)
+                ) & ~model.domain.in_(self.excluded_domains)
         # no domain filter just included entities
         elif (
             not self.excluded_domains
             and not self.included_domains
             and self.included_entities
         ):
-            filter_query = States.entity_id.in_(self.included_entities)
+            filter_query = model.entity_id.in_(self.included_entities)
         if filter_query is not None:
             query = query.filter(filter_query)
         # finally apply excluded entities filter if configured
         if self.excluded_entities:
-            query = query.filter(~States.entity_id.in_(self.excluded_entities))
+            query = query.filter(~model.entity_id.in_(self.excluded_entities))
         return query
 
 
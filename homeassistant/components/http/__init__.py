@@ -28,7 +28,7 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_HASS_USER, KEY_REAL_IP  # no
 from .cors import setup_cors
 from .real_ip import setup_real_ip
 from .static import CACHE_HEADERS, CachingStaticResource
-from .view import HomeAssistantView  # noqa: F401
+from .view import HomeAssistantView, iter_json_array  # noqa: F401
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -2,7 +2,8 @@
 import asyncio
 import json
 import logging
-from typing import List, Optional
+import threading
+from typing import Iterable, Iterator, List, Optional
 
 from aiohttp import web
 from aiohttp.web_exceptions import (
@@ -21,6 +22,11 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_REAL_IP
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size in bytes of the chunks a streamed JSON response is written in
+STREAM_CHUNK_SIZE = 64 * 1024
+# Number of chunks that can wait to be written before the worker pauses
+STREAM_MAX_PENDING_CHUNKS = 4
+
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -62,6 +68,79 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    async def json_stream(self, request, generate, *args, status_code=HTTP_OK):
+        """Return a chunked JSON response that is written while it is built.
+
+        generate is called with args in the executor and yields the JSON
+        document as text fragments, see iter_json_array. At most
+        STREAM_MAX_PENDING_CHUNKS chunks are kept in memory, the worker
+        waits for the client to catch up before it continues.
+        """
+        hass = request.app[KEY_HASS]
+        queue: asyncio.Queue = asyncio.Queue(STREAM_MAX_PENDING_CHUNKS)
+        cancelled = threading.Event()
+
+        def put(chunk):
+            """Hand a chunk to the event loop, waiting until there is room."""
+            if cancelled.is_set():
+                raise _StreamCancelled
+            asyncio.run_coroutine_threadsafe(queue.put(chunk), hass.loop).result()
+
+        def produce():
+            """Join the fragments into chunks of about STREAM_CHUNK_SIZE."""
+            fragments = []
+            size = 0
+            try:
+                for fragment in generate(*args):
+                    fragments.append(fragment)
+                    size += len(fragment)
+                    if size >= STREAM_CHUNK_SIZE:
+                        put("".join(fragments).encode("UTF-8"))
+                        fragments.clear()
+                        size = 0
+                if fragments:
+                    put("".join(fragments).encode("UTF-8"))
+            except _StreamCancelled:
+                pass
+            finally:
+                if not cancelled.is_set():
+                    put(None)
+
+        producer = hass.async_add_executor_job(produce)
+        response = None
+
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                if response is None:
+                    response = web.StreamResponse(status=status_code)
+                    response.content_type = CONTENT_TYPE_JSON
+                    response.enable_compression()
+                    await response.prepare(request)
+                await response.write(chunk)
+
+            try:
+                await producer
+            except (ValueError, TypeError) as err:
+                _LOGGER.error("Unable to serialize to JSON: %s", err)
+                if response is None:
+                    raise HTTPInternalServerError
+                # Headers are sent, abort instead of ending the body cleanly
+                raise
+
+        finally:
+            # Stop the worker and release it if it waits for room in the queue
+            cancelled.set()
+            while not queue.empty():
+                queue.get_nowait()
+
+        if response is None:
+            return self.json([], status_code)
+
+        return response
+
     def json_message(
         self, message, status_code=HTTP_OK, message_code=None, headers=None
     ):
@@ -95,6 +174,23 @@ class HomeAssistantView:
             app["allow_cors"](route)
 
 
+class _StreamCancelled(Exception):
+    """Raised in the worker when a streamed response is aborted."""
+
+
+def iter_json_array(items: Iterable) -> Iterator[str]:
+    """Yield a JSON array of items as text fragments, one item at a time."""
+    yield "["
+    first = True
+    for item in items:
+        if first:
+            first = False
+        else:
+            yield ","
+        yield json.dumps(item, sort_keys=True, cls=JSONEncoder, allow_nan=False)
+    yield "]"
+
+
 def request_handler_factory(view, handler):
     """Wrap the handler classes."""
     assert asyncio.iscoroutinefunction(handler) or is_callback(
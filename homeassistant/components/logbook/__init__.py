@@ -8,7 +8,7 @@ from sqlalchemy.exc import SQLAlchemyError
 import voluptuous as vol
 
 from homeassistant.components import sun
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import HomeAssistantView, iter_json_array
 from homeassistant.components.recorder.models import Events, States
 from homeassistant.components.recorder.util import (
     QUERY_RETRY_WAIT,
@@ -177,6 +177,17 @@ class LogbookView(HomeAssistantView):
         end_day = start_day + timedelta(days=period)
         hass = request.app["hass"]
 
+        if "stream" in request.query:
+            return await self.json_stream(
+                request,
+                _stream_events_json,
+                hass,
+                self.config,
+                start_day,
+                end_day,
+                entity_id,
+            )
+
         def json_events():
             """Fetch events and generate JSON."""
             return self.json(
@@ -387,39 +398,85 @@ def _generate_filter_from_config(config):
 
 def _get_events(hass, config, start_day, end_day, entity_id=None):
     """Get events for a period of time."""
-    entities_filter = _generate_filter_from_config(config)
+    with session_scope(hass=hass) as session:
+        return list(
+            humanify(
+                hass,
+                _yield_events(hass, session, config, start_day, end_day, entity_id),
+            )
+        )
+
 
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(500):
-            event = row.to_native()
-            if _keep_event(hass, event, entities_filter):
-                yield event
+def _stream_events_json(hass, config, start_day, end_day, entity_id=None):
+    """Generate the entries of a period of time as JSON text fragments.
 
+    Events are read in batches, only the events of the current
+    GROUP_BY_MINUTES window are held in memory.
+    """
     with session_scope(hass=hass) as session:
-        if entity_id is not None:
-            entity_ids = [entity_id.lower()]
-        else:
-            entity_ids = _get_related_entity_ids(session, entities_filter)
-
-        query = (
-            session.query(Events)
-            .order_by(Events.time_fired)
-            .outerjoin(States, (Events.event_id == States.event_id))
-            .filter(
-                Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
+        yield from iter_json_array(
+            humanify(
+                hass,
+                _yield_events(hass, session, config, start_day, end_day, entity_id),
             )
-            .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
-            .filter(
-                (
-                    (States.last_updated == States.last_changed)
-                    & States.entity_id.in_(entity_ids)
-                )
-                | (States.state_id.is_(None))
+        )
+
+
+def _yield_events(hass, session, config, start_day, end_day, entity_id=None):
+    """Yield the events of a period of time that are not filtered away."""
+    entities_filter = _generate_filter_from_config(config)
+
+    if entity_id is not None:
+        entity_ids = [entity_id.lower()]
+    else:
+        entity_ids = _get_related_entity_ids(session, entities_filter)
+
+    query = (
+        session.query(Events, States)
+        .order_by(Events.time_fired)
+        .outerjoin(States, (Events.event_id == States.event_id))
+        .filter(
+            Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
+        )
+        .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
+        .filter(
+            (
+                (States.last_updated == States.last_changed)
+                & States.entity_id.in_(entity_ids)
             )
+            | (States.state_id.is_(None))
         )
+    )
+
+    for event_row, state_row in query.yield_per(500):
+        event = _event_from_row(event_row, state_row)
+        if event is not None and _keep_event(hass, event, entities_filter):
+            yield event
+
+
+def _event_from_row(event_row, state_row):
+    """Convert a row to an event, with the new state of a state change.
 
-        return list(humanify(hass, yield_events(query)))
+    The recorder does not store the states with a state_changed event, the
+    new state is rebuilt from the state that was stored with it.
+    """
+    event = event_row.to_native()
+    if (
+        event is None
+        or event.event_type != EVENT_STATE_CHANGED
+        or "new_state" in event.data
+    ):
+        return event
+
+    if state_row is None:
+        return None
+
+    state = state_row.to_native()
+    if state is None:
+        return None
+
+    event.data["new_state"] = state.as_dict()
+    return event
 
 
 def _keep_event(hass, event, entities_filter):
@@ -432,8 +489,7 @@ def _keep_event(hass, event, entities_filter):
             return False
 
         # Do not report on new entities
-        old_state = event.data.get("old_state")
-        if old_state is None:
+        if "old_state" in event.data and event.data["old_state"] is None:
             return False
 
         # Do not report on entity removal
@@ -441,8 +497,12 @@ def _keep_event(hass, event, entities_filter):
         if new_state is None:
             return False
 
-        # Do not report on only attribute changes
-        if new_state.get("state") == old_state.get("state"):
+        # Do not report on only attribute changes. The old state is not
+        # stored anymore, those states are filtered by the query instead.
+        old_state = event.data.get("old_state")
+        if old_state is not None and new_state.get("state") == old_state.get(
+            "state"
+        ):
             return False
 
         domain = split_entity_id(entity_id)[0]
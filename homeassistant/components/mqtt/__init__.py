@@ -1,5 +1,7 @@
 """Support for MQTT message handling."""
 import asyncio
+from collections import deque
+from datetime import datetime, timedelta
 from functools import partial, wraps
 import inspect
 from itertools import groupby
@@ -9,7 +11,8 @@ from operator import attrgetter
 import os
 import ssl
 import sys
-from typing import Any, Callable, List, Optional, Union
+import threading
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import attr
 import requests.certs
@@ -84,6 +87,7 @@ CONF_TLS_INSECURE = "tls_insecure"
 CONF_TLS_VERSION = "tls_version"
 
 CONF_BIRTH_MESSAGE = "birth_message"
+CONF_COALESCE = "coalesce"
 CONF_WILL_MESSAGE = "will_message"
 
 CONF_COMMAND_TOPIC = "command_topic"
@@ -108,6 +112,7 @@ PROTOCOL_31 = "3.1"
 
 DEFAULT_PORT = 1883
 DEFAULT_KEEPALIVE = 60
+DEFAULT_ENCODING = "utf-8"
 DEFAULT_RETAIN = False
 DEFAULT_PROTOCOL = PROTOCOL_311
 DEFAULT_DISCOVERY_PREFIX = "homeassistant"
@@ -251,6 +256,12 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_WILL_MESSAGE): MQTT_WILL_BIRTH_SCHEMA,
                 vol.Optional(CONF_BIRTH_MESSAGE): MQTT_WILL_BIRTH_SCHEMA,
                 vol.Optional(CONF_DISCOVERY, default=DEFAULT_DISCOVERY): cv.boolean,
+                # Topics of which only the latest message in a window is handled
+                vol.Optional(CONF_COALESCE, default={}): {
+                    valid_subscribe_topic: vol.All(
+                        cv.time_period, cv.positive_timedelta
+                    )
+                },
                 # discovery_prefix must be a valid publish topic because if no
                 # state topic is specified, it will be created with the given prefix.
                 vol.Optional(
@@ -647,6 +658,7 @@ async def async_setup_entry(hass, entry):
         will_message=will_message,
         birth_message=birth_message,
         tls_version=tls_version,
+        coalesce=conf.get(CONF_COALESCE),
     )
 
     result: str = await hass.data[DATA_MQTT].async_connect()
@@ -761,18 +773,39 @@ class MQTT:
         will_message: Optional[Message],
         birth_message: Optional[Message],
         tls_version: Optional[int],
+        coalesce: Optional[Dict[str, timedelta]] = None,
     ) -> None:
-        """Initialize Home Assistant MQTT client."""
+        """Initialize Home Assistant MQTT client.
+
+        coalesce maps topic filters to a window in which only the latest
+        message of a topic is handled.
+        """
         # We don't import them on the top because some integrations
         # should be able to optionally rely on MQTT.
         # pylint: disable=import-outside-toplevel
         import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.broker = broker
         self.port = port
         self.keepalive = keepalive
         self.subscriptions: List[Subscription] = []
+        # Topic trie of the subscriptions, maps each subscribed topic filter
+        # to its subscriptions.
+        self._matcher = MQTTMatcher()
+        # Messages received by the paho thread, handled by the loop in batches
+        self._ingest: Deque[Tuple[Any, Optional[str]]] = deque()
+        self._ingest_lock = threading.Lock()
+        self._ingest_scheduled = False
+        # Topic filters that are coalesced, the latest message of a topic in
+        # its window and the timer that ends the window
+        self._coalesce = MQTTMatcher()
+        for topic, window in (coalesce or {}).items():
+            self._coalesce[topic] = window.total_seconds()
+        self._coalesce_enabled = bool(coalesce)
+        self._coalesced: Dict[str, Tuple[Any, Optional[str], datetime]] = {}
+        self._coalesce_timers: Dict[str, asyncio.TimerHandle] = {}
         self.birth_message = birth_message
         self.connected = False
         self._mqttc: mqtt.Client = None
@@ -847,6 +880,10 @@ class MQTT:
 
     async def async_disconnect(self):
         """Stop the MQTT client."""
+        for timer in self._coalesce_timers.values():
+            timer.cancel()
+        self._coalesce_timers.clear()
+        self._coalesced.clear()
 
         def stop():
             """Stop the MQTT client."""
@@ -871,6 +908,10 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        try:
+            self._matcher[topic].append(subscription)
+        except KeyError:
+            self._matcher[topic] = [subscription]
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -883,10 +924,14 @@ class MQTT:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            topic_subscriptions = self._matcher[topic]
+            topic_subscriptions.remove(subscription)
+            if topic_subscriptions:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
+            del self._matcher[topic]
+
             # Only unsubscribe if currently connected.
             if self.connected:
                 self.hass.async_create_task(self._async_unsubscribe(topic))
@@ -953,11 +998,39 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Runs in the paho thread. The payload is decoded with the default
+        encoding here, the loop handles the messages received since it last
+        ran in one go.
+        """
+        try:
+            payload: Optional[str] = msg.payload.decode(DEFAULT_ENCODING)
+        except (AttributeError, UnicodeDecodeError):
+            payload = None
+
+        self._ingest.append((msg, payload))
+
+        with self._ingest_lock:
+            if self._ingest_scheduled:
+                return
+            self._ingest_scheduled = True
+
+        self.hass.loop.call_soon_threadsafe(self._mqtt_handle_ingested)
 
     @callback
-    def _mqtt_handle_message(self, msg) -> None:
+    def _mqtt_handle_ingested(self) -> None:
+        """Handle the messages received by the paho thread."""
+        with self._ingest_lock:
+            self._ingest_scheduled = False
+
+        while self._ingest:
+            msg, payload = self._ingest.popleft()
+            self._mqtt_handle_message(msg, payload)
+
+    @callback
+    def _mqtt_handle_message(self, msg, payload: Optional[str] = None) -> None:
+        """Handle a message, payload is the payload in the default encoding."""
         _LOGGER.debug(
             "Received message on %s%s: %s",
             msg.topic,
@@ -966,20 +1039,69 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
+        if self._coalesce_enabled:
+            window = next(self._coalesce.iter_match(msg.topic), None)
+
+            if window is not None:
+                if msg.topic in self._coalesce_timers:
+                    # Latest message wins, it is handled when the window ends
+                    self._coalesced[msg.topic] = (msg, payload, timestamp)
+                    return
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+                self._coalesce_timers[msg.topic] = self.hass.loop.call_later(
+                    window, self._mqtt_end_coalesce_window, msg.topic, window
+                )
+
+        self._mqtt_dispatch_message(msg, payload, timestamp)
+
+    @callback
+    def _mqtt_end_coalesce_window(self, topic: str, window: float) -> None:
+        """Handle the latest message of a coalesced topic."""
+        coalesced = self._coalesced.pop(topic, None)
+
+        if coalesced is None:
+            del self._coalesce_timers[topic]
+            return
+
+        # Keep coalescing while messages keep coming
+        self._coalesce_timers[topic] = self.hass.loop.call_later(
+            window, self._mqtt_end_coalesce_window, topic, window
+        )
+        self._mqtt_dispatch_message(*coalesced)
+
+    @callback
+    def _mqtt_dispatch_message(
+        self, msg, payload: Optional[str], timestamp: datetime
+    ) -> None:
+        """Run the callbacks of the subscriptions that match a message."""
+        # Payloads decoded per encoding, shared by the subscriptions
+        payloads: Dict[str, SubscribePayloadType] = {}
+        if payload is not None:
+            payloads[DEFAULT_ENCODING] = payload
+
+        # Callbacks may subscribe or unsubscribe while we dispatch
+        subscriptions = [
+            subscription
+            for topic_subscriptions in self._matcher.iter_match(msg.topic)
+            for subscription in topic_subscriptions
+        ]
+
+        for subscription in subscriptions:
+            sub_payload: SubscribePayloadType = msg.payload
+            encoding = subscription.encoding
+
+            if encoding is not None:
+                sub_payload = payloads.get(encoding)
+
+            if encoding is not None and sub_payload is None:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    sub_payload = payloads[encoding] = msg.payload.decode(encoding)
                 except (AttributeError, UnicodeDecodeError):
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload,
                         msg.topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.callback,
                     )
                     continue
@@ -988,7 +1110,7 @@ class MQTT:
                 subscription.callback,
                 Message(
                     msg.topic,
-                    payload,
+                    sub_payload,
                     msg.qos,
                     msg.retain,
                     subscription.topic,
@@ -1013,20 +1135,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
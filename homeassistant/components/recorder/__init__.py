@@ -1,13 +1,13 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
 from datetime import datetime
 import logging
 import queue
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -17,6 +17,7 @@ import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_NOW,
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
@@ -33,9 +34,9 @@ from homeassistant.helpers.entityfilter import generate_filter
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
-from . import migration, purge
+from . import migration, purge, statistics
 from .const import DATA_INSTANCE
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +60,8 @@ DEFAULT_DB_FILE = "home-assistant_v2.db"
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 KEEPALIVE_TIME = 30
+MAX_BATCH_SIZE = 1000
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
@@ -198,7 +201,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return await instance.async_db_ready
 
 
-PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
+PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack", "progress"])
 
 
 class Recorder(threading.Thread):
@@ -242,6 +245,13 @@ class Recorder(threading.Thread):
 
         self._timechanges_seen = 0
         self._keepalive_count = 0
+        self._pending_event_count = 0
+        self._pending_states: List[
+            Tuple[Events, States, Optional[StateAttributes]]
+        ] = []
+        self._pending_state_attributes: Dict[str, StateAttributes] = {}
+        self._state_attributes_ids: "OrderedDict[str, int]" = OrderedDict()
+        self._statistics = statistics.StatisticsCollector()
         self.event_session = None
         self.get_session = None
 
@@ -255,7 +265,7 @@ class Recorder(threading.Thread):
         keep_days = kwargs.get(ATTR_KEEP_DAYS, self.keep_days)
         repack = kwargs.get(ATTR_REPACK)
 
-        self.queue.put(PurgeTask(keep_days, repack))
+        self.queue.put(PurgeTask(keep_days, repack, purge.PurgeProgress()))
 
     def run(self):
         """Start processing events to save."""
@@ -337,7 +347,9 @@ class Recorder(threading.Thread):
             @callback
             def async_purge(now):
                 """Trigger the purge."""
-                self.queue.put(PurgeTask(self.keep_days, repack=False))
+                self.queue.put(
+                    PurgeTask(self.keep_days, False, purge.PurgeProgress())
+                )
 
             # Purge every night at 4:12am
             self.hass.helpers.event.track_time_change(
@@ -348,6 +360,9 @@ class Recorder(threading.Thread):
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed.  This reduces the disk io.
+        # Without a commit interval, events that are
+        # already waiting in the queue are written as
+        # one batch.
         while True:
             event = self.queue.get()
             if event is None:
@@ -355,62 +370,142 @@ class Recorder(threading.Thread):
                 self._close_connection()
                 self.queue.task_done()
                 return
-            if isinstance(event, PurgeTask):
-                purge.purge_old_data(self, event.keep_days, event.repack)
-                self.queue.task_done()
-                continue
-            if event.event_type == EVENT_TIME_CHANGED:
-                self.queue.task_done()
-                self._keepalive_count += 1
-                if self._keepalive_count >= KEEPALIVE_TIME:
-                    self._keepalive_count = 0
-                    self._send_keep_alive()
+
+            self._process_one_event(event)
+
+            # Write the batch once the queue is drained. If they do
+            # not have a commit interval than we commit right away
+            if self._pending_event_count and (
+                self.queue.empty() or self._pending_event_count >= MAX_BATCH_SIZE
+            ):
                 if self.commit_interval:
-                    self._timechanges_seen += 1
-                    if self._timechanges_seen >= self.commit_interval:
-                        self._timechanges_seen = 0
-                        self._commit_event_session_or_retry()
-                continue
-            if event.event_type in self.exclude_t:
-                self.queue.task_done()
-                continue
+                    self._flush_pending_batch()
+                else:
+                    self._commit_event_session_or_retry()
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    self.queue.task_done()
-                    continue
+            self.queue.task_done()
 
+    def _process_one_event(self, event):
+        """Process one event from the queue."""
+        if isinstance(event, PurgeTask):
+            # Pending states may refer to attributes the purge deletes, they
+            # have to be committed first.
+            self._commit_event_session_or_retry()
+            # Purge in batches and queue the next batch behind the
+            # events that arrived in the meantime.
+            if not purge.purge_old_data(
+                self, event.keep_days, event.repack, event.progress
+            ):
+                self.queue.put(event)
+            return
+        if event.event_type == EVENT_TIME_CHANGED:
+            now = event.data[ATTR_NOW]
+            if self._statistics.period_ended(now):
+                self._compile_statistics(now)
+            self._keepalive_count += 1
+            if self._keepalive_count >= KEEPALIVE_TIME:
+                self._keepalive_count = 0
+                self._send_keep_alive()
+            if self.commit_interval:
+                self._timechanges_seen += 1
+                if self._timechanges_seen >= self.commit_interval:
+                    self._timechanges_seen = 0
+                    self._commit_event_session_or_retry()
+            return
+        if event.event_type in self.exclude_t:
+            return
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        if entity_id is not None:
+            if not self.entity_filter(entity_id):
+                return
+
+        try:
+            dbevent = Events.from_event(event)
+            self.event_session.add(dbevent)
+            self._pending_event_count += 1
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding event: %s", err)
+            return
+
+        if event.event_type == EVENT_STATE_CHANGED:
+            self._statistics.add_state_change(event)
             try:
-                dbevent = Events.from_event(event)
-                self.event_session.add(dbevent)
-                self.event_session.flush()
+                dbstate = States.from_event(event)
+                dbattributes = self._get_state_attributes(dbstate, event)
+                # The event and attribute ids are resolved when
+                # the batch is flushed
+                self._pending_states.append((dbevent, dbstate, dbattributes))
             except (TypeError, ValueError):
-                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s", event.data.get("new_state"),
+                )
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
-                _LOGGER.exception("Error adding event: %s", err)
-
-            if dbevent and event.event_type == EVENT_STATE_CHANGED:
-                try:
-                    dbstate = States.from_event(event)
-                    dbstate.event_id = dbevent.event_id
-                    self.event_session.add(dbstate)
-                except (TypeError, ValueError):
-                    _LOGGER.warning(
-                        "State is not JSON serializable: %s",
-                        event.data.get("new_state"),
-                    )
-                except Exception as err:  # pylint: disable=broad-except
-                    # Must catch the exception to prevent the loop from collapsing
-                    _LOGGER.exception("Error adding state change: %s", err)
+                _LOGGER.exception("Error adding state change: %s", err)
 
-            # If they do not have a commit interval
-            # than we commit right away
-            if not self.commit_interval:
-                self._commit_event_session_or_retry()
+    def _compile_statistics(self, now):
+        """Write the statistics of the period that ended."""
+        try:
+            self._statistics.compile(self.event_session, now)
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error compiling statistics: %s", err)
+            return
 
-            self.queue.task_done()
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _get_state_attributes(self, dbstate, event):
+        """Link the state to its shared attributes.
+
+        Returns the new attributes row if the attributes have not been
+        stored before.
+        """
+        dbattributes = StateAttributes.from_event(event)
+        shared_attrs = dbattributes.shared_attrs
+        dbstate.attributes = None
+
+        pending_attributes = self._pending_state_attributes.get(shared_attrs)
+        if pending_attributes is not None:
+            return pending_attributes
+
+        attributes_id = self._state_attributes_ids.get(shared_attrs)
+        if attributes_id is None:
+            with self.event_session.no_autoflush:
+                attributes_id = (
+                    self.event_session.query(StateAttributes.attributes_id)
+                    .filter(StateAttributes.hash == dbattributes.hash)
+                    .filter(StateAttributes.shared_attrs == shared_attrs)
+                    .scalar()
+                )
+
+        if attributes_id is not None:
+            dbstate.attributes_id = attributes_id
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+            return None
+
+        self.event_session.add(dbattributes)
+        self._pending_state_attributes[shared_attrs] = dbattributes
+        return dbattributes
+
+    def _cache_state_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the id of stored attributes."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        self._state_attributes_ids.move_to_end(shared_attrs)
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def clear_state_attributes_cache(self):
+        """Forget the ids of stored attributes.
+
+        Needed after a purge or a rollback, the ids may no longer exist.
+        """
+        self._state_attributes_ids.clear()
 
     def _send_keep_alive(self):
         try:
@@ -462,6 +557,13 @@ class Recorder(threading.Thread):
         self._reopen_event_session()
 
     def _reopen_event_session(self):
+        self._pending_event_count = 0
+        self._pending_states = []
+        self._pending_state_attributes = {}
+
+        # Ids of attributes that were not committed are no longer valid
+        self.clear_state_attributes_cache()
+
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -480,14 +582,53 @@ class Recorder(threading.Thread):
             # Must catch the exception to prevent the loop from collapsing
             _LOGGER.exception("Error while creating new event session: %s", err)
 
+    def _flush_pending_batch(self):
+        try:
+            self._flush_pending_states()
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error writing batch: %s", err)
+            self._reopen_event_session()
+
     def _commit_event_session(self):
         try:
+            self._flush_pending_states()
             self.event_session.commit()
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
+            self.clear_state_attributes_cache()
             self.event_session.rollback()
             raise
 
+    def _flush_pending_states(self):
+        """Write the pending states of this batch.
+
+        A single flush assigns the ids of all pending events. The states
+        that reference them are then written with one bulk insert instead
+        of a flush per state change.
+        """
+        pending_states = self._pending_states
+        self._pending_event_count = 0
+        self._pending_states = []
+        self._pending_state_attributes = {}
+
+        self.event_session.flush()
+
+        if not pending_states:
+            return
+
+        for dbevent, dbstate, dbattributes in pending_states:
+            dbstate.event_id = dbevent.event_id
+            if dbattributes is not None:
+                dbstate.attributes_id = dbattributes.attributes_id
+                self._cache_state_attributes_id(
+                    dbattributes.shared_attrs, dbattributes.attributes_id
+                )
+
+        self.event_session.bulk_save_objects(
+            [dbstate for _, dbstate, _ in pending_states]
+        )
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
@@ -1,11 +1,14 @@
 """Models for SQLAlchemy."""
 import json
 import logging
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -14,8 +17,10 @@ from sqlalchemy import (
     distinct,
 )
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -24,11 +29,45 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 9
 
 _LOGGER = logging.getLogger(__name__)
 
 
+STATE_CHANGED_DATA_KEYS = {"entity_id", "old_state", "new_state"}
+
+
+def _attributes_json(state):
+    """Return the attributes of a state as JSON.
+
+    Reuses the JSON the state caches, which is strict. Attributes that are
+    not valid strict JSON (NaN, infinity) are encoded like before.
+    """
+    try:
+        return state.attributes_json()
+    except ValueError:
+        return json.dumps(dict(state.attributes), cls=JSONEncoder)
+
+
+def _event_data_json(event):
+    """Return the data of an event as JSON.
+
+    The states of a state_changed event are stored in the states table, only
+    the entity_id is kept. A state that is missing because the entity was
+    added or removed is kept as null.
+    """
+    if event.event_type != EVENT_STATE_CHANGED or (
+        event.data.keys() != STATE_CHANGED_DATA_KEYS
+    ):
+        return json.dumps(event.data, cls=JSONEncoder)
+
+    data = {"entity_id": event.data["entity_id"]}
+    for key in ("old_state", "new_state"):
+        if event.data[key] is None:
+            data[key] = None
+    return json.dumps(data)
+
+
 class Events(Base):  # type: ignore
     """Event history data."""
 
@@ -48,7 +87,7 @@ class Events(Base):  # type: ignore
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=_event_data_json(event),
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -83,6 +122,9 @@ class States(Base):  # type: ignore
     state = Column(String(255))
     attributes = Column(Text)
     event_id = Column(Integer, ForeignKey("events.event_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     last_changed = Column(DateTime(timezone=True), default=dt_util.utcnow)
     last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
     created = Column(DateTime(timezone=True), default=dt_util.utcnow)
@@ -96,6 +138,9 @@ class States(Base):  # type: ignore
         Index("ix_states_entity_id_last_updated", "entity_id", "last_updated"),
     )
 
+    # Attributes are shared between states, load them with the state.
+    state_attributes = relationship("StateAttributes", lazy="joined")
+
     @staticmethod
     def from_event(event):
         """Create object from a state_changed event."""
@@ -119,7 +164,7 @@ class States(Base):  # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+            dbstate.attributes = _attributes_json(state)
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -129,10 +174,14 @@ class States(Base):  # type: ignore
         """Convert to an HA state object."""
         context = Context(id=self.context_id, user_id=self.context_user_id)
         try:
+            if self.state_attributes is not None:
+                attributes = self.state_attributes.to_native()
+            else:
+                attributes = json.loads(self.attributes)
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                attributes,
                 _process_timestamp(self.last_changed),
                 _process_timestamp(self.last_updated),
                 context=context,
@@ -140,12 +189,85 @@ class States(Base):  # type: ignore
                 # Remove with 1.0 or in 2020.
                 temp_invalid_id_bypass=True,
             )
-        except ValueError:
-            # When json.loads fails
+        except (TypeError, ValueError):
+            # When json.loads fails or the attributes are missing
             _LOGGER.exception("Error converting row to state: %s", self)
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history.
+
+    Identical attributes are stored once and shared by all states that
+    reference them.
+    """
+
+    __tablename__ = "state_attributes"
+    attributes_id = Column(Integer, primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text)
+
+    # Decoded shared_attrs, not stored in the database
+    _native = None
+
+    @staticmethod
+    def from_event(event):
+        """Create object from a state_changed event."""
+        state = event.data.get("new_state")
+        if state is None:
+            shared_attrs = "{}"
+        else:
+            shared_attrs = _attributes_json(state)
+        return StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash of json encoded shared attributes."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    def to_native(self):
+        """Convert to the attributes of an HA state object.
+
+        The decoded attributes are kept as the row is shared by many states.
+        """
+        if self._native is None:
+            self._native = json.loads(self.shared_attrs)
+        return self._native
+
+
+class Statistics(Base):  # type: ignore
+    """Long-term statistics of a numeric entity over a period."""
+
+    __tablename__ = "statistics"
+    id = Column(Integer, primary_key=True)
+    domain = Column(String(64))
+    entity_id = Column(String(255))
+    period = Column(String(16))
+    start = Column(DateTime(timezone=True))
+    mean = Column(Float)
+    min = Column(Float)
+    max = Column(Float)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+
+    __table_args__ = (
+        # Used for fetching the statistics of entities over a period
+        Index("ix_statistics_entity_id_period_start", "entity_id", "period", "start"),
+    )
+
+    def to_native(self):
+        """Convert to a JSON friendly dict."""
+        return {
+            "entity_id": self.entity_id,
+            "start": _process_timestamp(self.start),
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
@@ -1,37 +1,105 @@
 """Purge old data helper."""
 from datetime import timedelta
 import logging
+import time
 
+import attr
 from sqlalchemy.exc import SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, States
+from .const import EVENT_RECORDER_PURGE_PROGRESS
+from .models import Events, StateAttributes, States
+from .statistics import purge_short_term_statistics
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of states and of events deleted in one batch
+MAX_ROWS_TO_PURGE = 1000
 
-def purge_old_data(instance, purge_days, repack):
-    """Purge events and states older than purge_days ago."""
+
+@attr.s(slots=True)
+class PurgeProgress:
+    """Progress of a purge that runs in batches."""
+
+    started = attr.ib(type=float, factory=time.monotonic)
+    batches = attr.ib(type=int, default=0)
+    states_deleted = attr.ib(type=int, default=0)
+    events_deleted = attr.ib(type=int, default=0)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of rows deleted per second."""
+        elapsed = time.monotonic() - self.started
+        if not elapsed:
+            return 0.0
+        return (self.states_deleted + self.events_deleted) / elapsed
+
+    def as_dict(self) -> dict:
+        """Return a dictionary representation of the progress."""
+        return {
+            "batches": self.batches,
+            "states_deleted": self.states_deleted,
+            "events_deleted": self.events_deleted,
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def purge_old_data(instance, purge_days, repack, progress=None):
+    """Purge events and states older than purge_days ago.
+
+    Deletes at most MAX_ROWS_TO_PURGE states and events, oldest first, so
+    the recorder can write new events in between batches. Returns True
+    when there is nothing left to purge.
+    """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging events before %s", purge_before)
 
+    if progress is None:
+        progress = PurgeProgress()
+
     try:
         with session_scope(session=instance.get_session()) as session:
-            deleted_rows = (
-                session.query(States)
-                .filter(States.last_updated < purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s states", deleted_rows)
+            states_deleted = _purge_states(session, purge_before)
+            _LOGGER.debug("Deleted %s states", states_deleted)
 
-            deleted_rows = (
-                session.query(Events)
-                .filter(Events.time_fired < purge_before)
-                .delete(synchronize_session=False)
+            events_deleted = _purge_events(session, purge_before)
+            _LOGGER.debug("Deleted %s events", events_deleted)
+
+            finished = (
+                states_deleted < MAX_ROWS_TO_PURGE
+                and events_deleted < MAX_ROWS_TO_PURGE
             )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
+
+            if finished:
+                attributes_deleted = _purge_state_attributes(session)
+                _LOGGER.debug("Deleted %s shared state attributes", attributes_deleted)
+
+                statistics_deleted = purge_short_term_statistics(session, purge_before)
+                _LOGGER.debug("Deleted %s short-term statistics", statistics_deleted)
+
+        progress.batches += 1
+        progress.states_deleted += states_deleted
+        progress.events_deleted += events_deleted
+        instance.hass.bus.fire(
+            EVENT_RECORDER_PURGE_PROGRESS,
+            {"keep_days": purge_days, "finished": finished, **progress.as_dict()},
+        )
+
+        if not finished:
+            return False
+
+        # Attribute ids that are remembered may have been deleted
+        instance.clear_state_attributes_cache()
+
+        _LOGGER.info(
+            "Purged %s states and %s events in %s batches (%.1f rows/s)",
+            progress.states_deleted,
+            progress.events_deleted,
+            progress.batches,
+            progress.rows_per_second,
+        )
 
         # Execute sqlite vacuum command to free up space on disk
         if repack and instance.engine.driver in ("pysqlite", "postgresql"):
@@ -40,3 +108,56 @@ def purge_old_data(instance, purge_days, repack):
 
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s.", err)
+
+    return True
+
+
+def _purge_states(session, purge_before):
+    """Delete the oldest batch of states older than purge_before."""
+    last_state_id = (
+        session.query(States.state_id)
+        .filter(States.last_updated < purge_before)
+        .order_by(States.state_id)
+        .offset(MAX_ROWS_TO_PURGE - 1)
+        .limit(1)
+        .scalar()
+    )
+
+    query = session.query(States).filter(States.last_updated < purge_before)
+    if last_state_id is not None:
+        query = query.filter(States.state_id <= last_state_id)
+
+    return query.delete(synchronize_session=False)
+
+
+def _purge_events(session, purge_before):
+    """Delete the oldest batch of events older than purge_before."""
+    last_event_id = (
+        session.query(Events.event_id)
+        .filter(Events.time_fired < purge_before)
+        .order_by(Events.event_id)
+        .offset(MAX_ROWS_TO_PURGE - 1)
+        .limit(1)
+        .scalar()
+    )
+
+    query = session.query(Events).filter(Events.time_fired < purge_before)
+    if last_event_id is not None:
+        query = query.filter(Events.event_id <= last_event_id)
+
+    return query.delete(synchronize_session=False)
+
+
+def _purge_state_attributes(session):
+    """Delete shared attributes no state refers to anymore."""
+    return (
+        session.query(StateAttributes)
+        .filter(
+            ~StateAttributes.attributes_id.in_(
+                session.query(States.attributes_id)
+                .filter(States.attributes_id.isnot(None))
+                .distinct()
+            )
+        )
+        .delete(synchronize_session=False)
+    )
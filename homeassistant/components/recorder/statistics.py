@@ -0,0 +1,209 @@
+"""Long-term statistics of numeric entities."""
+from datetime import datetime, timedelta
+import logging
+from typing import Dict, Optional
+
+import attr
+from sqlalchemy import func
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import split_entity_id
+
+from .models import Statistics
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+
+PERIODS = {
+    PERIOD_5MINUTE: timedelta(minutes=5),
+    PERIOD_HOUR: timedelta(hours=1),
+}
+
+
+def statistics_during_period(
+    session, start_time, end_time=None, entity_ids=None, period=PERIOD_HOUR
+):
+    """Return the statistics of the periods that start in start_time - end_time.
+
+    Returns a query, a filter on entity_ids is applied if given.
+    """
+    query = session.query(Statistics).filter(
+        (Statistics.period == period) & (Statistics.start >= start_time)
+    )
+
+    if end_time is not None:
+        query = query.filter(Statistics.start < end_time)
+
+    if entity_ids is not None:
+        query = query.filter(Statistics.entity_id.in_(entity_ids))
+
+    return query.order_by(Statistics.entity_id, Statistics.start)
+
+
+def _period_start(point_in_time: datetime) -> datetime:
+    """Return the start of the 5 minute period point_in_time is in."""
+    return point_in_time.replace(
+        minute=point_in_time.minute - point_in_time.minute % 5,
+        second=0,
+        microsecond=0,
+    )
+
+
+def _numeric_value(state) -> Optional[float]:
+    """Return the value of a numeric state with a unit of measurement."""
+    if state is None or ATTR_UNIT_OF_MEASUREMENT not in state.attributes:
+        return None
+
+    try:
+        return float(state.state)
+    except ValueError:
+        return None
+
+
+@attr.s(slots=True)
+class _EntityStatistics:
+    """Time weighted statistics of one entity in the current period."""
+
+    value = attr.ib(type=float)
+    since = attr.ib(type=datetime)
+    start = attr.ib(type=datetime)
+    min = attr.ib(type=float)
+    max = attr.ib(type=float)
+    weighted_sum = attr.ib(type=float, default=0.0)
+
+    def update(self, value: float, point_in_time: datetime) -> None:
+        """Record a new value."""
+        point_in_time = max(point_in_time, self.since)
+        self.weighted_sum += self.value * (point_in_time - self.since).total_seconds()
+        self.value = value
+        self.since = point_in_time
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def close(self, end: datetime) -> float:
+        """Return the mean up to end and start a new period with the last value."""
+        self.update(self.value, end)
+        duration = (self.since - self.start).total_seconds()
+        mean = self.weighted_sum / duration if duration else self.value
+        self.start = self.since
+        self.weighted_sum = 0.0
+        self.min = self.max = self.value
+        return mean
+
+
+class StatisticsCollector:
+    """Compile 5 minute and hourly statistics of numeric entities.
+
+    Runs in the recorder thread. Samples are collected from the recorded
+    state changes and a row per entity is written when a period ends.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self._entities: Dict[str, _EntityStatistics] = {}
+        self._period_end: Optional[datetime] = None
+
+    def add_state_change(self, event) -> None:
+        """Collect a sample from a state_changed event."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        value = _numeric_value(new_state)
+
+        if value is None:
+            self._entities.pop(entity_id, None)
+            return
+
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            since = new_state.last_updated
+            self._entities[entity_id] = _EntityStatistics(
+                value, since, since, value, value
+            )
+        else:
+            entity.update(value, new_state.last_updated)
+
+    def period_ended(self, now: datetime) -> bool:
+        """Return if a period ended before now."""
+        if self._period_end is None:
+            self._period_end = _period_start(now) + PERIODS[PERIOD_5MINUTE]
+            return False
+
+        return now >= self._period_end
+
+    def compile(self, session, now: datetime) -> None:
+        """Add the statistics of the period that ended to the session."""
+        end = self._period_end
+        start = end - PERIODS[PERIOD_5MINUTE]
+        self._period_end = _period_start(now) + PERIODS[PERIOD_5MINUTE]
+
+        for entity_id, entity in self._entities.items():
+            entity_min = entity.min
+            entity_max = entity.max
+            mean = entity.close(end)
+            session.add(
+                Statistics(
+                    domain=split_entity_id(entity_id)[0],
+                    entity_id=entity_id,
+                    period=PERIOD_5MINUTE,
+                    start=start,
+                    mean=mean,
+                    min=entity_min,
+                    max=entity_max,
+                )
+            )
+
+        _LOGGER.debug(
+            "Compiled %s statistics for %s", PERIOD_5MINUTE, len(self._entities)
+        )
+
+        if end.minute == 0:
+            self._compile_hour(session, end - PERIODS[PERIOD_HOUR])
+
+    @staticmethod
+    def _compile_hour(session, start: datetime) -> None:
+        """Add hourly statistics rolled up from the 5 minute statistics."""
+        rows = (
+            session.query(
+                Statistics.domain,
+                Statistics.entity_id,
+                func.avg(Statistics.mean),
+                func.min(Statistics.min),
+                func.max(Statistics.max),
+            )
+            .filter(
+                (Statistics.period == PERIOD_5MINUTE)
+                & (Statistics.start >= start)
+                & (Statistics.start < start + PERIODS[PERIOD_HOUR])
+            )
+            .group_by(Statistics.domain, Statistics.entity_id)
+        )
+
+        for domain, entity_id, mean, entity_min, entity_max in rows:
+            session.add(
+                Statistics(
+                    domain=domain,
+                    entity_id=entity_id,
+                    period=PERIOD_HOUR,
+                    start=start,
+                    mean=mean,
+                    min=entity_min,
+                    max=entity_max,
+                )
+            )
+
+
+def purge_short_term_statistics(session, purge_before: datetime) -> int:
+    """Delete 5 minute statistics older than purge_before.
+
+    Hourly statistics are kept, they are the long-term history.
+    """
+    return (
+        session.query(Statistics)
+        .filter(
+            (Statistics.period == PERIOD_5MINUTE) & (Statistics.start < purge_before)
+        )
+        .delete(synchronize_session=False)
+    )
+
@@ -8,19 +8,28 @@ from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_A
 from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceNotFound, Unauthorized
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.entity_platform import async_get_poll_stats
+from homeassistant.helpers.event import (
+    async_track_state_change,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_chrome_trace, async_get_setup_timeline
 
 from . import const, decorators, messages
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 
+# Seconds changes of subscribed entities are collected before they are sent
+ENTITY_CHANGES_DELAY = 0.1
+
 
 @callback
 def async_register_commands(hass, async_reg):
     """Register commands."""
     async_reg(hass, handle_subscribe_events)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_get_states)
@@ -30,6 +39,9 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_setup_timeline)
+    async_reg(hass, handle_connection_lag)
+    async_reg(hass, handle_poll_stats)
 
 
 def pong_message(iden):
@@ -65,7 +77,7 @@ def handle_subscribe_events(hass, connection, msg):
             ):
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event))
+            connection.send_event(msg["id"], event)
 
     else:
 
@@ -75,7 +87,7 @@ def handle_subscribe_events(hass, connection, msg):
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+            connection.send_event(msg["id"], event)
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         event_type, forward_events
@@ -84,6 +96,103 @@ def handle_subscribe_events(hass, connection, msg):
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Required("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(hass, connection, msg):
+    """Handle subscribe entities command.
+
+    Permissions are checked once, entities the user can't read are left out.
+    The current states are sent first, after that only the fields that
+    changed. Changes within ENTITY_CHANGES_DELAY are sent together and
+    multiple changes of an entity are merged into one.
+    """
+    entity_ids = [
+        entity_id
+        for entity_id in dict.fromkeys(msg["entity_ids"])
+        if connection.user.permissions.check_entity(entity_id, POLICY_READ)
+    ]
+
+    # The states the client knows about
+    sent_states = {}
+    pending = {}
+    timer = None
+
+    @callback
+    def send_changes():
+        """Send the changes collected since the last message."""
+        nonlocal timer
+        timer = None
+        added = {}
+        changed = {}
+        removed = []
+
+        for entity_id, new_state in pending.items():
+            old_state = sent_states.get(entity_id)
+
+            if new_state is None:
+                if old_state is not None:
+                    removed.append(entity_id)
+                    del sent_states[entity_id]
+                continue
+
+            sent_states[entity_id] = new_state
+
+            if old_state is None:
+                added[entity_id] = messages.compressed_state_dict_add(new_state)
+                continue
+
+            diff = messages.compressed_state_diff(old_state, new_state)
+            if diff is not None:
+                changed[entity_id] = diff
+
+        pending.clear()
+        event = {}
+        if added:
+            event[messages.ENTITY_EVENT_ADD] = added
+        if changed:
+            event[messages.ENTITY_EVENT_CHANGE] = changed
+        if removed:
+            event[messages.ENTITY_EVENT_REMOVE] = removed
+        if event:
+            connection.send_message(messages.event_message(msg["id"], event))
+
+    @callback
+    def collect_changes(event):
+        """Collect the changes of the subscribed entities."""
+        nonlocal timer
+        pending[event.data["entity_id"]] = event.data["new_state"]
+        if timer is None:
+            timer = hass.loop.call_later(ENTITY_CHANGES_DELAY, send_changes)
+
+    unsub_track = async_track_state_change_event(hass, entity_ids, collect_changes)
+
+    @callback
+    def unsubscribe():
+        """Stop tracking the entities."""
+        unsub_track()
+        if timer is not None:
+            timer.cancel()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_message(messages.result_message(msg["id"]))
+
+    added = {}
+    for entity_id in entity_ids:
+        state = hass.states.get(entity_id)
+        if state is not None:
+            sent_states[entity_id] = state
+            added[entity_id] = messages.compressed_state_dict_add(state)
+
+    connection.send_message(
+        messages.event_message(msg["id"], {messages.ENTITY_EVENT_ADD: added})
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -171,7 +280,10 @@ def handle_get_states(hass, connection, msg):
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    connection.send_big_message(
+        messages.result_message(msg["id"], states),
+        messages.states_result_message_json,
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -179,7 +291,7 @@ def handle_get_states(hass, connection, msg):
 async def handle_get_services(hass, connection, msg):
     """Handle get services command."""
     descriptions = await async_get_all_descriptions(hass)
-    connection.send_message(messages.result_message(msg["id"], descriptions))
+    connection.send_big_message(messages.result_message(msg["id"], descriptions))
 
 
 @callback
@@ -219,6 +331,24 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "integration/setup_timeline",
+        vol.Optional("format", default="timeline"): vol.In(
+            ["timeline", "chrome_trace"]
+        ),
+    }
+)
+def handle_setup_timeline(hass, connection, msg):
+    """Handle setup timeline command."""
+    if msg["format"] == "chrome_trace":
+        connection.send_result(msg["id"], async_get_setup_chrome_trace(hass))
+    else:
+        connection.send_result(msg["id"], async_get_setup_timeline(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
@@ -263,3 +393,25 @@ def handle_render_template(hass, connection, msg):
 
     connection.send_result(msg["id"])
     state_listener()
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "websocket/connection_lag"})
+def handle_connection_lag(hass, connection, msg):
+    """Handle the lag metrics of the connections command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"user_id": conn.user.id, **queue.as_dict()}
+            for conn, queue in hass.data.get(const.DATA_OUTBOUND_QUEUES, {}).items()
+        ],
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "entity/poll_stats"})
+def handle_poll_stats(hass, connection, msg):
+    """Handle the poll statistics of the entity platforms command."""
+    connection.send_result(msg["id"], async_get_poll_stats(hass))
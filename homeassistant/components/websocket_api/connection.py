@@ -4,7 +4,8 @@ from typing import Any, Callable, Dict, Hashable, Optional
 
 import voluptuous as vol
 
-from homeassistant.core import Context, callback
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, callback
 from homeassistant.exceptions import Unauthorized
 
 from . import const, messages
@@ -43,10 +44,32 @@ class ActiveConnection:
 
     async def send_big_result(self, msg_id, result):
         """Send a result message that would be expensive to JSON serialize."""
-        content = await self.hass.async_add_executor_job(
-            const.JSON_DUMP, messages.result_message(msg_id, result)
+        self.send_big_message(messages.result_message(msg_id, result))
+
+    @callback
+    def send_big_message(self, message, encode=const.JSON_DUMP):
+        """Send a message that is encoded in the executor.
+
+        The message keeps its place between the other messages of the
+        connection, the writer waits until it is encoded.
+        """
+        self.send_message(
+            self.hass.async_add_executor_job(messages.encode_message, encode, message)
         )
-        self.send_message(content)
+
+    @callback
+    def send_event(self, msg_id: int, event: Event) -> None:
+        """Send an event message, encoded once for all connections.
+
+        A state change replaces the pending state change of the same entity
+        and subscription, if the client is behind.
+        """
+        message = messages.cached_event_message(msg_id, event)
+
+        if event.event_type == EVENT_STATE_CHANGED:
+            self.send_message(message, (msg_id, event.data["entity_id"]))
+        else:
+            self.send_message(message)
 
     @callback
     def send_error(self, msg_id: int, code: str, message: str) -> None:
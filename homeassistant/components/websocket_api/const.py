@@ -43,4 +43,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS = f"{DOMAIN}.connections"
 
+# Data used to store the outbound queue of each connection
+DATA_OUTBOUND_QUEUES = f"{DOMAIN}.outbound_queues"
+
 JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
@@ -20,6 +20,7 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    DATA_OUTBOUND_QUEUES,
     ERR_UNKNOWN_ERROR,
     JSON_DUMP,
     MAX_PENDING_MSG,
@@ -31,6 +32,7 @@ from .const import (
 )
 from .error import Disconnect
 from .messages import error_message
+from .outbound import OutboundQueue
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 
@@ -55,7 +57,8 @@ class WebSocketHandler:
         self.hass = hass
         self.request = request
         self.wsock: Optional[web.WebSocketResponse] = None
-        self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
+        self._to_write = OutboundQueue()
+        self._sent_at_peak = 0
         self._handle_task = None
         self._writer_task = None
         self._logger = logging.getLogger("{}.connection.{}".format(__name__, id(self)))
@@ -70,6 +73,10 @@ class WebSocketHandler:
                 if message is None:
                     break
 
+                # Big messages are encoded in the executor
+                if isinstance(message, asyncio.Future):
+                    message = await message
+
                 self._logger.debug("Sending %s", message)
 
                 if isinstance(message, str):
@@ -100,16 +107,17 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message):
+    def _send_message(self, message, coalesce_key=None):
         """Send a message to the client.
 
-        Closes connection if the client is not reading the messages.
+        A message with a coalesce key replaces the pending message with the
+        same key. Closes connection if the client is not reading the messages.
 
         Async friendly.
         """
-        try:
-            self._to_write.put_nowait(message)
-        except asyncio.QueueFull:
+        self._to_write.put_nowait(message, coalesce_key)
+
+        if self._to_write.qsize() > MAX_PENDING_MSG:
             self._logger.error(
                 "Client exceeded max pending messages [2]: %s", MAX_PENDING_MSG
             )
@@ -123,18 +131,34 @@ class WebSocketHandler:
             return
 
         if self._peak_checker_unsub is None:
-            self._peak_checker_unsub = async_call_later(
-                self.hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
-            )
+            self._schedule_peak_check()
+
+    @callback
+    def _schedule_peak_check(self):
+        """Check the pending messages after PENDING_MSG_PEAK_TIME."""
+        self._sent_at_peak = self._to_write.sent
+        self._peak_checker_unsub = async_call_later(
+            self.hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
+        )
 
     @callback
     def _check_write_peak(self, _):
-        """Check that we are no longer above the write peak."""
+        """Check that we are no longer above the write peak.
+
+        A client that is behind but still reading is given more time.
+        """
         self._peak_checker_unsub = None
 
         if self._to_write.qsize() < PENDING_MSG_PEAK:
             return
 
+        if self._to_write.sent > self._sent_at_peak:
+            self._logger.debug(
+                "Client is behind on pending messages: %s", self._to_write.as_dict()
+            )
+            self._schedule_peak_check()
+            return
+
         self._logger.error(
             "Client unable to keep up with pending messages. Stayed over %s for %s seconds",
             PENDING_MSG_PEAK,
@@ -197,6 +221,9 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self.hass.data.setdefault(DATA_OUTBOUND_QUEUES, {})[
+                connection
+            ] = self._to_write
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -238,18 +265,19 @@ class WebSocketHandler:
 
             if connection is not None:
                 connection.async_close()
+                self.hass.data[DATA_OUTBOUND_QUEUES].pop(connection)
 
-            try:
+            if self._to_write.qsize() < MAX_PENDING_MSG:
                 self._to_write.put_nowait(None)
                 # Make sure all error messages are written before closing
                 await self._writer_task
-            except asyncio.QueueFull:
+            else:
                 self._writer_task.cancel()
 
             await wsock.close()
 
             if disconnect_warn is None:
-                self._logger.debug("Disconnected")
+                self._logger.debug("Disconnected: %s", self._to_write.as_dict())
             else:
                 self._logger.warning("Disconnected: %s", disconnect_warn)
 
@@ -1,7 +1,7 @@
 """Message templates for websocket commands."""
-
 import voluptuous as vol
 
+from homeassistant.core import State
 from homeassistant.helpers import config_validation as cv
 
 from . import const
@@ -14,6 +14,20 @@ MINIMAL_MESSAGE_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+# Keys of the compressed states of entity subscriptions
+COMPRESSED_STATE_STATE = "s"
+COMPRESSED_STATE_ATTRIBUTES = "a"
+COMPRESSED_STATE_CONTEXT = "c"
+COMPRESSED_STATE_LAST_CHANGED = "lc"
+COMPRESSED_STATE_LAST_UPDATED = "lu"
+
+# Keys of the entity subscription events
+ENTITY_EVENT_ADD = "a"
+ENTITY_EVENT_CHANGE = "c"
+ENTITY_EVENT_REMOVE = "r"
+
+_MISSING = object()
+
 # Base schema to extend by message handlers
 BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({vol.Required("id"): cv.positive_int})
 
@@ -36,3 +50,110 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def encode_message(encode, message):
+    """Encode a message, return it as is if it can't be encoded.
+
+    The writer of the connection reports the data that can't be encoded.
+    """
+    try:
+        return encode(message)
+    except (ValueError, TypeError):
+        return message
+
+
+def states_result_message_json(message):
+    """Encode a result message of states with the JSON cached by the states."""
+    states = ", ".join(state.as_json() for state in message["result"])
+    return (
+        f'{{"id": {message["id"]}, "type": "{const.TYPE_RESULT}", '
+        f'"success": true, "result": [{states}]}}'
+    )
+
+
+def cached_event_message(iden, event):
+    """Return an encoded event message.
+
+    The event caches its JSON, it is encoded once for all connections that
+    forward it. Returns the message unencoded if the event can't be encoded,
+    the connection reports it.
+    """
+    try:
+        event_json = event.as_json()
+    except (ValueError, TypeError):
+        return event_message(iden, event)
+
+    return f'{{"id": {iden}, "type": "event", "event": {event_json}}}'
+
+
+def _compressed_context(state: State):
+    """Return the context of a state, only the id if it has no origin."""
+    context = state.context
+    if context.parent_id is None and context.user_id is None:
+        return context.id
+    return {
+        "id": context.id,
+        "parent_id": context.parent_id,
+        "user_id": context.user_id,
+    }
+
+
+def compressed_state_dict_add(state: State):
+    """Return the compressed form of a state for an entity subscription.
+
+    The last updated time is only included if it differs from the last
+    changed time.
+    """
+    compressed = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: state.attributes,
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_changed != state.last_updated:
+        compressed[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed
+
+
+def compressed_state_diff(old_state: State, new_state: State):
+    """Return the fields of new_state that differ from old_state.
+
+    Changed fields are listed under "+", attributes that were removed under
+    "-". Returns None if nothing changed.
+    """
+    additions = {}
+    diff = {}
+
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+
+    if old_state.context.id != new_state.context.id:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state)
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+
+    # Attributes are shared between states while they do not change
+    if old_attributes is not new_attributes:
+        changed = {
+            key: value
+            for key, value in new_attributes.items()
+            if old_attributes.get(key, _MISSING) != value
+        }
+        if changed:
+            additions[COMPRESSED_STATE_ATTRIBUTES] = changed
+
+        removed = [key for key in old_attributes if key not in new_attributes]
+        if removed:
+            diff["-"] = {COMPRESSED_STATE_ATTRIBUTES: removed}
+
+    if additions:
+        diff["+"] = additions
+
+    return diff or None
@@ -0,0 +1,112 @@
+"""Queue of the messages that are waiting to be sent to a client."""
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Any, Deque, Dict, Hashable, Optional
+
+import attr
+
+# mypy: allow-untyped-defs
+
+
+@attr.s(slots=True)
+class _Entry:
+    """A message in the queue."""
+
+    message = attr.ib(type=Any)
+    queued = attr.ib(type=float)
+    coalesce_key = attr.ib(type=Optional[Hashable])
+    superseded = attr.ib(type=bool, default=False)
+
+
+class OutboundQueue:
+    """Queue of the messages that are waiting to be sent to a client.
+
+    A message with a coalesce key replaces the pending message with the same
+    key, it goes to the back of the queue. While the client is behind it only
+    gets the latest state of an entity instead of every state in between.
+
+    Has the methods of asyncio.Queue the websocket handler uses, the size is
+    the number of messages that will be sent.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._entries: Deque[_Entry] = deque()
+        self._coalescable: Dict[Hashable, _Entry] = {}
+        self._waiter: Optional[asyncio.Future] = None
+        self._pending = 0
+        self.peak = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.lag = 0.0
+
+    def qsize(self) -> int:
+        """Return the number of messages that will be sent."""
+        return self._pending
+
+    def put_nowait(self, message: Any, coalesce_key: Optional[Hashable] = None) -> None:
+        """Add a message, replacing the pending message with the same key."""
+        entry = _Entry(message, monotonic(), coalesce_key)
+
+        if coalesce_key is not None:
+            superseded = self._coalescable.get(coalesce_key)
+            if superseded is not None:
+                superseded.superseded = True
+                self._pending -= 1
+                self.coalesced += 1
+            self._coalescable[coalesce_key] = entry
+
+        self._entries.append(entry)
+        self._pending += 1
+
+        # Drop the superseded messages once they are the majority
+        if len(self._entries) > 2 * self._pending:
+            self._entries = deque(
+                queued for queued in self._entries if not queued.superseded
+            )
+
+        self.peak = max(self.peak, self._pending)
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def get(self) -> Any:
+        """Remove and return the next message, wait for one if needed."""
+        while True:
+            while not self._entries:
+                self._waiter = asyncio.get_running_loop().create_future()
+                try:
+                    await self._waiter
+                finally:
+                    self._waiter = None
+
+            entry = self._entries.popleft()
+            if entry.superseded:
+                continue
+
+            if entry.coalesce_key is not None:
+                del self._coalescable[entry.coalesce_key]
+
+            self._pending -= 1
+            self.sent += 1
+            self.lag = monotonic() - entry.queued
+            return entry.message
+
+    def oldest_age(self) -> float:
+        """Return the seconds the oldest pending message has been waiting."""
+        for entry in self._entries:
+            if not entry.superseded:
+                return monotonic() - entry.queued
+        return 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the lag metrics of the connection."""
+        return {
+            "pending": self._pending,
+            "peak": self.peak,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "lag": round(self.lag, 3),
+            "oldest_pending_age": round(self.oldest_age(), 3),
+        }
@@ -35,7 +35,6 @@ from typing import (
 import uuid
 
 from async_timeout import timeout
-import attr
 import voluptuous as vol
 import yarl
 
@@ -74,6 +73,7 @@ from homeassistant.exceptions import (
 from homeassistant.util import location, network
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.thread import fix_threading_exception_logging
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 
@@ -200,6 +200,8 @@ class HomeAssistant:
         # This is a dictionary that any component can store any data on.
         self.data: dict = {}
         self.state = CoreState.not_running
+        # Set while the timer fires time_changed events
+        self.timer_running = False
         self.exit_code = 0
         # If not None, use to signal end-of-loop
         self._stopped: Optional[asyncio.Event] = None
@@ -462,18 +464,66 @@ class HomeAssistant:
             self.loop.stop()
 
 
-@attr.s(slots=True, frozen=True)
 class Context:
-    """The context that triggered something."""
+    """The context that triggered something.
 
-    user_id = attr.ib(type=str, default=None)
-    parent_id = attr.ib(type=Optional[str], default=None)
-    id = attr.ib(type=str, default=attr.Factory(lambda: uuid.uuid4().hex))
+    The id is generated when it is used for the first time, most contexts
+    of states and events are never looked at.
+    """
+
+    __slots__ = ["user_id", "parent_id", "_id"]
+
+    def __init__(
+        self,
+        user_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        id: Optional[str] = None,  # pylint: disable=redefined-builtin
+    ) -> None:
+        """Initialize a new context."""
+        self.user_id = user_id
+        self.parent_id = parent_id
+        self._id = id
+
+    @property
+    def id(self) -> str:  # pylint: disable=invalid-name
+        """Return the id of the context."""
+        if self._id is None:
+            self._id = uuid.uuid4().hex
+        return self._id
 
     def as_dict(self) -> dict:
         """Return a dictionary representation of the context."""
         return {"id": self.id, "parent_id": self.parent_id, "user_id": self.user_id}
 
+    def __eq__(self, other: Any) -> bool:
+        """Return the comparison."""
+        return (  # type: ignore
+            self.__class__ == other.__class__
+            and self.user_id == other.user_id
+            and self.parent_id == other.parent_id
+            and self.id == other.id
+        )
+
+    def __hash__(self) -> int:
+        """Return the hash of the context."""
+        return hash((self.user_id, self.parent_id, self.id))
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return (
+            f"Context(user_id={self.user_id!r}, parent_id={self.parent_id!r}, "
+            f"id={self.id!r})"
+        )
+
+
+def _json_encode(obj: Any) -> str:
+    """Encode obj as strict JSON with the encoder of the helpers."""
+    # Imported here, the helpers import the core
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.json import JSONEncoder
+
+    return JSONEncoder(allow_nan=False).encode(obj)
+
 
 class EventOrigin(enum.Enum):
     """Represent the origin of an event."""
@@ -489,7 +539,7 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = ["event_type", "data", "origin", "time_fired", "context", "_as_json"]
 
     def __init__(
         self,
@@ -505,6 +555,7 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_json: Optional[str] = None
 
     def as_dict(self) -> Dict:
         """Create a dict representation of this Event.
@@ -519,6 +570,18 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    def as_json(self) -> str:
+        """Return the JSON representation of as_dict.
+
+        Async friendly.
+
+        Encoded once, raises ValueError or TypeError when the event can't be
+        represented as strict JSON.
+        """
+        if self._as_json is None:
+            self._as_json = _json_encode(self.as_dict())
+        return self._as_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         # pylint: disable=maybe-no-member
@@ -711,6 +774,9 @@ class State:
     last_changed: last time the state was changed, not the attributes.
     last_updated: last time this object was updated.
     context: Context in which it was created
+
+    A state is not changed after it is created, its dictionary and JSON
+    representations are cached.
     """
 
     __slots__ = [
@@ -720,6 +786,9 @@ class State:
         "last_changed",
         "last_updated",
         "context",
+        "_as_dict",
+        "_as_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -751,10 +820,18 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        # Attributes that did not change are shared with the previous state
+        self.attributes = (
+            attributes
+            if isinstance(attributes, ReadOnlyDict)
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
+        self._as_dict: Optional[ReadOnlyDict] = None
+        self._as_json: Optional[str] = None
+        self._attributes_json: Optional[str] = None
 
     @property
     def domain(self) -> str:
@@ -781,14 +858,49 @@ class State:
         To be used for JSON serialization.
         Ensures: state == State.from_dict(state.as_dict())
         """
-        return {
-            "entity_id": self.entity_id,
-            "state": self.state,
-            "attributes": dict(self.attributes),
-            "last_changed": self.last_changed,
-            "last_updated": self.last_updated,
-            "context": self.context.as_dict(),
-        }
+        if self._as_dict is None:
+            self._as_dict = ReadOnlyDict(
+                {
+                    "entity_id": self.entity_id,
+                    "state": self.state,
+                    "attributes": self.attributes,
+                    "last_changed": self.last_changed,
+                    "last_updated": self.last_updated,
+                    "context": ReadOnlyDict(self.context.as_dict()),
+                }
+            )
+        return self._as_dict
+
+    def as_json(self) -> str:
+        """Return the JSON representation of as_dict.
+
+        Async friendly.
+
+        Encoded once, raises ValueError or TypeError when the state can't be
+        represented as strict JSON.
+        """
+        if self._as_json is None:
+            as_dict = self.as_dict()
+            self._as_json = (
+                f'{{"entity_id": {_json_encode(self.entity_id)}, '
+                f'"state": {_json_encode(self.state)}, '
+                f'"attributes": {self.attributes_json()}, '
+                f'"last_changed": {_json_encode(self.last_changed)}, '
+                f'"last_updated": {_json_encode(self.last_updated)}, '
+                f'"context": {_json_encode(as_dict["context"])}}}'
+            )
+        return self._as_json
+
+    def attributes_json(self) -> str:
+        """Return the JSON representation of the attributes.
+
+        Async friendly.
+
+        Encoded once, raises like as_json.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = _json_encode(self.attributes)
+        return self._attributes_json
 
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
@@ -988,12 +1100,19 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == MappingProxyType(attributes)
+            # Entities pass the attributes of the previous state if unchanged
+            same_attr = (
+                attributes is old_state.attributes
+                or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
             return
 
+        if same_attr:
+            attributes = old_state.attributes  # type: ignore
+
         if context is None:
             context = Context()
 
@@ -1551,10 +1670,12 @@ def _async_create_timer(hass: HomeAssistant) -> None:
     @callback
     def stop_timer(_: Event) -> None:
         """Stop the timer."""
+        hass.timer_running = False
         if handle is not None:
             handle.cancel()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_timer)
 
     _LOGGER.info("Timer:starting")
+    hass.timer_running = True
     schedule_tick(dt_util.utcnow())
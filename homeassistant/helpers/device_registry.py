@@ -1,13 +1,23 @@
 """Provide a way to connect entities belonging to one device."""
-from collections import OrderedDict
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 import uuid
 
 import attr
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import Event, callback
+from homeassistant.util.indexed_dict import IndexedDict
 
 from .debounce import Debouncer
 from .singleton import singleton
@@ -32,6 +42,11 @@ CONNECTION_NETWORK_MAC = "mac"
 CONNECTION_UPNP = "upnp"
 CONNECTION_ZIGBEE = "zigbee"
 
+INDEX_AREA_ID = "area_id"
+INDEX_CONFIG_ENTRY = "config_entry"
+INDEX_CONNECTION = "connection"
+INDEX_IDENTIFIER = "identifier"
+
 
 @attr.s(slots=True, frozen=True)
 class DeviceEntry:
@@ -77,10 +92,25 @@ def format_mac(mac: str) -> str:
     return mac
 
 
+class DeviceRegistryItems(IndexedDict):
+    """Devices by id, indexed by identifier, connection, area and config entry."""
+
+    def _index_keys(self, value: DeviceEntry) -> Iterable[Tuple[str, Hashable]]:
+        """Return the (index, key) pairs to index a device under."""
+        for identifier in value.identifiers:
+            yield INDEX_IDENTIFIER, identifier
+        for connection in value.connections:
+            yield INDEX_CONNECTION, connection
+        for config_entry_id in value.config_entries:
+            yield INDEX_CONFIG_ENTRY, config_entry_id
+        if value.area_id is not None:
+            yield INDEX_AREA_ID, value.area_id
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: Dict[str, DeviceEntry]
+    devices: DeviceRegistryItems
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
@@ -97,11 +127,14 @@ class DeviceRegistry:
         self, identifiers: set, connections: set
     ) -> Optional[DeviceEntry]:
         """Check if device is registered."""
-        for device in self.devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
+        for index, keys in (
+            (INDEX_IDENTIFIER, identifiers),
+            (INDEX_CONNECTION, connections),
+        ):
+            for key in keys:
+                device_ids = self.devices.get_keys(index, key)
+                if device_ids:
+                    return self.devices[device_ids[0]]
         return None
 
     @callback
@@ -295,7 +328,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices = OrderedDict()
+        devices = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
@@ -355,15 +388,14 @@ class DeviceRegistry:
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for device_id in self.devices.get_keys(INDEX_CONFIG_ENTRY, config_entry_id):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in self.devices.get_keys(INDEX_AREA_ID, area_id):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @singleton(DATA_REGISTRY)
@@ -377,7 +409,7 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_values(INDEX_AREA_ID, area_id)
 
 
 @callback
@@ -385,11 +417,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_values(INDEX_CONFIG_ENTRY, config_entry_id)
 
 
 @callback
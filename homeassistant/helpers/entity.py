@@ -32,8 +32,10 @@ from homeassistant.helpers.entity_registry import (
     EVENT_ENTITY_REGISTRY_UPDATED,
     RegistryEntry,
 )
+from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -109,6 +111,12 @@ class Entity(ABC):
     # Process updates in parallel
     parallel_updates: Optional[asyncio.Semaphore] = None
 
+    # Limit the updates in the executor across platforms
+    executor_budget: Optional[asyncio.Semaphore] = None
+
+    # Seconds the last update took, not counting the wait for its turn
+    update_latency: Optional[float] = None
+
     # Entry in the entity registry
     registry_entry: Optional[RegistryEntry] = None
 
@@ -119,6 +127,11 @@ class Entity(ABC):
     _context: Optional[Context] = None
     _context_set: Optional[datetime] = None
 
+    # Attributes that are not state specific, with customizations applied
+    _static_attributes: Optional[ReadOnlyDict] = None
+    _static_attributes_customize: Optional[EntityValues] = None
+    _static_attributes_key: Optional[tuple] = None
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -309,10 +322,12 @@ class Entity(ABC):
                 )
             return
 
+        if self.platform is not None and self.should_poll:
+            self.platform.async_start_polling(self)
+
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        attr = dict(self.capability_attributes or {})
 
         if not self.available:
             state = STATE_UNAVAILABLE
@@ -323,39 +338,12 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.device_state_attributes or {})
 
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
-
-        entity_picture = self.entity_picture
-        if entity_picture is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        hidden = self.hidden
-        if hidden:
-            attr[ATTR_HIDDEN] = hidden
-
-        assumed_state = self.assumed_state
-        if assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
+        static_attributes = self._async_static_attributes()
+        if attr:
+            attr.update(static_attributes)
+        else:
+            # Shared with the previous state if nothing changed
+            attr = static_attributes
 
         end = timer()
 
@@ -382,10 +370,6 @@ class Entity(ABC):
                 extra,
             )
 
-        # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
-
         # Convert temperature if we detect one
         try:
             unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
@@ -397,7 +381,7 @@ class Entity(ABC):
                 prec = len(state) - state.index(".") - 1 if "." in state else 0
                 temp = units.temperature(float(state), unit_of_measure)
                 state = str(round(temp) if prec == 0 else round(temp, prec))
-                attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
+                attr = {**attr, ATTR_UNIT_OF_MEASUREMENT: units.temperature_unit}
         except ValueError:
             # Could not convert state to float
             pass
@@ -413,6 +397,75 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_static_attributes(self) -> ReadOnlyDict:
+        """Return the attributes that are not state specific.
+
+        Customizations from the config file are applied. The result is cached
+        until the registry entry or the customizations change. Of the
+        properties only the ones the entity overrides can change, the others
+        are not evaluated to check the cache.
+        """
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        cls = type(self)
+        key = (self.entity_id,) + tuple(
+            getattr(self, name)
+            for name, default in _STATIC_ATTRIBUTE_PROPERTIES.items()
+            if getattr(cls, name) is not default
+        )
+        if (
+            self._static_attributes is not None
+            and customize is self._static_attributes_customize
+            and key == self._static_attributes_key
+        ):
+            return self._static_attributes
+
+        entry = self.registry_entry
+        unit_of_measurement = self.unit_of_measurement
+        # pylint: disable=consider-using-ternary
+        name = (entry and entry.name) or self.name
+        icon = (entry and entry.icon) or self.icon
+        entity_picture = self.entity_picture
+        hidden = self.hidden
+        assumed_state = self.assumed_state
+        supported_features = self.supported_features
+        device_class = self.device_class
+
+        attr: Dict[str, Any] = {}
+
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        if entity_picture is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        if hidden:
+            attr[ATTR_HIDDEN] = hidden
+
+        if assumed_state:
+            attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        # Overwrite properties that have been set in the config file.
+        if customize is not None:
+            attr.update(customize.get(self.entity_id))
+
+        self._static_attributes_customize = customize
+        self._static_attributes_key = key
+        self._static_attributes = ReadOnlyDict(attr)
+        return self._static_attributes
+
     def schedule_update_ha_state(self, force_refresh=False):
         """Schedule an update ha state change task.
 
@@ -464,13 +517,22 @@ class Entity(ABC):
                 SLOW_UPDATE_WARNING,
             )
 
+        start = timer()
         try:
             # pylint: disable=no-member
             if hasattr(self, "async_update"):
                 await self.async_update()
             elif hasattr(self, "update"):
-                await self.hass.async_add_executor_job(self.update)
+                if self.executor_budget is None:
+                    await self.hass.async_add_executor_job(self.update)
+                else:
+                    # Taken after the platform's turn, waiting for the
+                    # platform does not hold up other platforms
+                    async with self.executor_budget:
+                        start = timer()
+                        await self.hass.async_add_executor_job(self.update)
         finally:
+            self.update_latency = timer() - start
             self._update_staged = False
             if warning:
                 update_warn.cancel()
@@ -550,6 +612,7 @@ class Entity(ABC):
         ent_reg = await self.hass.helpers.entity_registry.async_get_registry()
         old = self.registry_entry
         self.registry_entry = ent_reg.async_get(data["entity_id"])
+        self._static_attributes = None
 
         if self.registry_entry.disabled_by is not None:
             await self.async_remove()
@@ -600,6 +663,23 @@ class Entity(ABC):
                 self.parallel_updates.release()
 
 
+# Properties of the attributes that are not state specific, the default ones
+# of Entity are constant
+_STATIC_ATTRIBUTE_PROPERTIES = {
+    name: getattr(Entity, name)
+    for name in (
+        "unit_of_measurement",
+        "name",
+        "icon",
+        "entity_picture",
+        "hidden",
+        "assumed_state",
+        "supported_features",
+        "device_class",
+    )
+}
+
+
 class ToggleEntity(Entity):
     """An abstract class for entities that can be turned on and off."""
 
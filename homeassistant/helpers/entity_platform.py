@@ -4,17 +4,21 @@ from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger
 from types import ModuleType
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, cast
+from zlib import crc32
+
+import attr
 
 from homeassistant.const import DEVICE_DEFAULT_NAME
 from homeassistant.core import CALLBACK_TYPE, callback, split_entity_id, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later, async_track_point_in_utc_time
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -25,6 +29,63 @@ SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 60
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_DOMAIN_ENTITIES = "domain_entities"
+DATA_POLL_BUDGET = "entity_platform_poll_budget"
+
+# Number of updates of entities without async_update, which update in the
+# executor, that run at the same time across all platforms.
+EXECUTOR_POLL_BUDGET = 8
+
+
+@attr.s(slots=True)
+class PollStats:
+    """Latency of the polls of the entities of a platform."""
+
+    polls: int = attr.ib(default=0)
+    retries: int = attr.ib(default=0)
+    total_latency: float = attr.ib(default=0.0)
+    max_latency: float = attr.ib(default=0.0)
+    last_latency: float = attr.ib(default=0.0)
+
+    def add(self, latency: float) -> None:
+        """Record the latency of a poll in seconds."""
+        self.polls += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.last_latency = latency
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary representation of the stats."""
+        return {
+            "polls": self.polls,
+            "retries": self.retries,
+            "mean_latency": self.total_latency / self.polls if self.polls else 0.0,
+            "max_latency": self.max_latency,
+            "last_latency": self.last_latency,
+        }
+
+
+@callback
+def async_get_poll_stats(hass: HomeAssistantType) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the poll stats of the platforms that poll by platform name."""
+    return {
+        platform_name: [
+            {"domain": platform.domain, **platform.poll_stats.as_dict()}
+            for platform in platforms
+            if platform.poll_stats.polls
+        ]
+        for platform_name, platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).items()
+        if any(platform.poll_stats.polls for platform in platforms)
+    }
+
+
+@callback
+def _async_get_poll_budget(hass: HomeAssistantType) -> asyncio.Semaphore:
+    """Return the semaphore that limits the updates running in the executor."""
+    budget: Optional[asyncio.Semaphore] = hass.data.get(DATA_POLL_BUDGET)
+    if budget is None:
+        budget = hass.data[DATA_POLL_BUDGET] = asyncio.Semaphore(EXECUTOR_POLL_BUDGET)
+    return budget
 
 
 class EntityPlatform:
@@ -50,13 +111,21 @@ class EntityPlatform:
         self.scan_interval = scan_interval
         self.entity_namespace = entity_namespace
         self.config_entry = None
+        # Entities of this platform by entity_id
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
+        # Entities of all platforms of the domain by entity_id
+        self.domain_entities: Dict[str, Entity] = hass.data.setdefault(
+            DATA_DOMAIN_ENTITIES, {}
+        ).setdefault(domain, {})
         self._tasks: List[asyncio.Future] = []
-        # Method to cancel the state change listener
-        self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
+        # Methods to cancel the next poll of an entity by entity_id
+        self._poll_jobs: Dict[str, CALLBACK_TYPE] = {}
+        # Entities that are being polled and the ones to poll again after
+        self._polling: Set[str] = set()
+        self._poll_retries: Set[str] = set()
+        self.poll_stats = PollStats()
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -294,15 +363,6 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None or not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            return
-
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass, self._update_entity_states, self.scan_interval,
-        )
-
     async def _async_add_entity(
         self, entity, update_before_add, entity_registry, device_registry
     ):
@@ -315,6 +375,8 @@ class EntityPlatform:
         entity.parallel_updates = self._get_parallel_updates_semaphore(
             hasattr(entity, "async_update")
         )
+        if not hasattr(entity, "async_update"):
+            entity.executor_budget = _async_get_poll_budget(self.hass)
 
         # Update properties before we generate the entity_id
         if update_before_add:
@@ -438,11 +500,23 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        self.domain_entities[entity_id] = entity
+
+        @callback
+        def remove_entity_cb() -> None:
+            """Remove entity from entities and domain entities."""
+            self.entities.pop(entity_id)
+            self.domain_entities.pop(entity_id)
+            cancel_poll = self._poll_jobs.pop(entity_id, None)
+            if cancel_poll is not None:
+                cancel_poll()
+
+        entity.async_on_remove(remove_entity_cb)
 
         await entity.async_internal_added_to_hass()
         await entity.async_added_to_hass()
 
+        # Schedules the polls of a polling entity
         entity.async_write_ha_state()
 
     async def async_reset(self) -> None:
@@ -461,10 +535,6 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
 
@@ -477,13 +547,6 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_extract_from_service(self, service_call, expand_group=True):
         """Extract all known and available entities from a service call.
 
@@ -521,34 +584,92 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
+    @callback
+    def async_start_polling(self, entity: "Entity") -> None:
+        """Start polling an entity of the platform if it is not polled yet.
+
+        Called when the state of an entity that should poll is written, an
+        entity that starts polling after it was added is picked up then.
+        """
+        entity_id = entity.entity_id
+        if entity_id not in self._poll_jobs and self.entities.get(entity_id) is entity:
+            self._async_schedule_first_poll(entity_id)
+
+    @callback
+    def _async_schedule_first_poll(self, entity_id: str) -> None:
+        """Schedule the first poll of an entity at its phase of the interval.
+
+        The phase is derived from the entity_id, so the polls of the entities
+        of a platform are spread over the scan interval instead of all
+        running at the same time. It is never later than one scan interval.
+        """
+        phase = (crc32(entity_id.encode()) % 1000 + 1) / 1000
+        self._async_schedule_poll(entity_id, self.scan_interval * phase)
+
+    @callback
+    def _async_schedule_poll(self, entity_id: str, delay: timedelta) -> None:
+        """Schedule the next poll of an entity."""
+
+        @callback
+        def poll_due(now: datetime) -> None:
+            """Poll the entity once it is due."""
+            self._async_poll_due(entity_id)
+
+        self._poll_jobs[entity_id] = async_track_point_in_utc_time(
+            self.hass, poll_due, dt_util.utcnow() + delay
+        )
+
+    @callback
+    def _async_poll_due(self, entity_id: str) -> None:
+        """Poll an entity and schedule its next poll.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        An entity that is still updating from its previous poll is polled
+        again as soon as that update is done, other entities are not held up.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
+        entity = self.entities[entity_id]
+        if not entity.should_poll:
+            # Polling starts again when the entity writes its state
+            del self._poll_jobs[entity_id]
+            return
+
+        self._async_schedule_poll(entity_id, self.scan_interval)
+
+        if entity_id in self._polling:
             self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
+                "Updating %s took longer than the scheduled update interval %s",
+                entity_id,
                 self.scan_interval,
             )
+            self._poll_retries.add(entity_id)
+            self.poll_stats.retries += 1
             return
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))  # type: ignore
+        self._polling.add(entity_id)
+        self.hass.async_create_task(self._async_poll_entity(entity_id, entity))
+
+    async def _async_poll_entity(self, entity_id: str, entity: "Entity") -> None:
+        """Update the state of a polling entity.
 
-            if tasks:
-                await asyncio.gather(*tasks)
+        The latency of the poll does not include the time the entity waited
+        for its turn to update.
+        """
+        try:
+            while True:
+                entity.update_latency = None
+                await entity.async_update_ha_state(True)
+                if entity.update_latency is not None:
+                    self.poll_stats.add(entity.update_latency)
+
+                if entity_id not in self._poll_retries:
+                    break
+                self._poll_retries.discard(entity_id)
+                if self.entities.get(entity_id) is not entity:
+                    break
+        finally:
+            self._polling.discard(entity_id)
+            self._poll_retries.discard(entity_id)
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
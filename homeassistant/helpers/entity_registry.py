@@ -7,13 +7,13 @@ The Entity Registry will persist itself 10 seconds after a new entity is
 registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
-from collections import OrderedDict
 import logging
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -35,6 +35,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, callback, split_entity_id, valid_entity_id
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.util import slugify
+from homeassistant.util.indexed_dict import IndexedDict
 from homeassistant.util.yaml import load_yaml
 
 from .singleton import singleton
@@ -61,6 +62,10 @@ ATTR_RESTORED = "restored"
 STORAGE_VERSION = 1
 STORAGE_KEY = "core.entity_registry"
 
+INDEX_CONFIG_ENTRY = "config_entry"
+INDEX_DEVICE = "device"
+INDEX_UNIQUE_ID = "unique_id"
+
 # Attributes relevant to describing entity
 # to external services.
 ENTITY_DESCRIBING_ATTRIBUTES = {
@@ -118,13 +123,25 @@ class RegistryEntry:
         return self.disabled_by is not None
 
 
+class EntityRegistryItems(IndexedDict):
+    """Entries by entity_id, indexed by unique id, device and config entry."""
+
+    def _index_keys(self, value: RegistryEntry) -> Iterable[Tuple[str, Hashable]]:
+        """Return the (index, key) pairs to index an entry under."""
+        yield INDEX_UNIQUE_ID, (value.domain, value.platform, value.unique_id)
+        if value.device_id is not None:
+            yield INDEX_DEVICE, value.device_id
+        if value.config_entry_id is not None:
+            yield INDEX_CONFIG_ENTRY, value.config_entry_id
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
     def __init__(self, hass: HomeAssistantType):
         """Initialize the registry."""
         self.hass = hass
-        self.entities: Dict[str, RegistryEntry]
+        self.entities: EntityRegistryItems
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
@@ -161,13 +178,11 @@ class EntityRegistry:
         self, domain: str, platform: str, unique_id: str
     ) -> Optional[str]:
         """Check if an entity_id is currently registered."""
-        for entity in self.entities.values():
-            if (
-                entity.domain == domain
-                and entity.platform == platform
-                and entity.unique_id == unique_id
-            ):
-                return entity.entity_id
+        entity_ids = self.entities.get_keys(
+            INDEX_UNIQUE_ID, (domain, platform, unique_id)
+        )
+        if entity_ids:
+            return cast(str, entity_ids[0])
         return None
 
     @callback
@@ -381,20 +396,13 @@ class EntityRegistry:
             entity_id = changes["entity_id"] = new_entity_id
 
         if new_unique_id is not _UNDEF:
-            conflict = next(
-                (
-                    entity
-                    for entity in self.entities.values()
-                    if entity.unique_id == new_unique_id
-                    and entity.domain == old.domain
-                    and entity.platform == old.platform
-                ),
-                None,
+            conflict_entity_id = self.async_get_entity_id(
+                old.domain, old.platform, new_unique_id
             )
-            if conflict:
+            if conflict_entity_id:
                 raise ValueError(
                     f"Unique id '{new_unique_id}' is already in use by "
-                    f"'{conflict.entity_id}'"
+                    f"'{conflict_entity_id}'"
                 )
             changes["unique_id"] = new_unique_id
 
@@ -424,7 +432,7 @@ class EntityRegistry:
             old_conf_load_func=load_yaml,
             old_conf_migrate_func=_async_migrate,
         )
-        entities: Dict[str, RegistryEntry] = OrderedDict()
+        entities = EntityRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -488,11 +496,7 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in self.entities.get_keys(INDEX_CONFIG_ENTRY, config_entry):
             self.async_remove(entity_id)
 
 
@@ -509,9 +513,7 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
-    ]
+    return registry.entities.get_values(INDEX_DEVICE, device_id)
 
 
 @callback
@@ -519,11 +521,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_values(INDEX_CONFIG_ENTRY, config_entry_id)
 
 
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
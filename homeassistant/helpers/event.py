@@ -1,13 +1,29 @@
 """Helpers for listening to events."""
+import asyncio
 from datetime import datetime, timedelta
 import functools as ft
-from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union, cast
+from heapq import heapify, heappop, heappush
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import attr
 
 from homeassistant.const import (
     ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     EVENT_TIME_CHANGED,
     MATCH_ALL,
@@ -15,12 +31,23 @@ from homeassistant.const import (
     SUN_EVENT_SUNSET,
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.sun import get_astral_event_next
 from homeassistant.helpers.template import Template
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
+TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
+TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
+TRACK_TIME_SCHEDULER = "track_time_scheduler"
+
+# Rebuild the heaps of the time scheduler when they hold this many more
+# cancelled jobs than active ones
+COMPACT_CANCELLED_JOBS = 100
+
+_LOGGER = logging.getLogger(__name__)
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -81,12 +108,6 @@ def async_track_state_change(
     @callback
     def state_change_listener(event: Event) -> None:
         """Handle specific state changes."""
-        if (
-            entity_ids != MATCH_ALL
-            and cast(str, event.data.get("entity_id")) not in entity_ids
-        ):
-            return
-
         old_state = event.data.get("old_state")
         if old_state is not None:
             old_state = old_state.state
@@ -103,12 +124,109 @@ def async_track_state_change(
                 event.data.get("new_state"),
             )
 
+    if entity_ids != MATCH_ALL:
+        # If we have a list of entity ids we use
+        # async_track_state_change_event to route
+        # by entity_id to avoid iterating though state change
+        # events and creating a jobs where the most
+        # common outcome is to return right away because
+        # the entity_id does not match since usually
+        # only one or two listeners want that specific
+        # entity_id.
+        return async_track_state_change_event(hass, entity_ids, state_change_listener)
+
     return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
 
 
+@callback
+@bind_hass
+def async_track_state_change_event(
+    hass: HomeAssistant,
+    entity_ids: Union[str, Iterable[str]],
+    action: Callable[[Event], Any],
+) -> CALLBACK_TYPE:
+    """Track specific state change events indexed by entity_id.
+
+    Unlike async_track_state_change, async_track_state_change_event
+    passes the full event to the callback.
+
+    In order to avoid having to iterate a long list
+    of EVENT_STATE_CHANGED and fire and create a job
+    for each one, we keep a dict of entity ids that
+    care about the state change events so we can
+    do a fast dict lookup to route events.
+    """
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids.lower()]
+    else:
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+    if not entity_ids:
+        return _remove_empty_listener
+
+    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
+
+    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
+
+        @callback
+        def _async_state_change_dispatcher(event: Event) -> None:
+            """Dispatch state changes by entity_id."""
+            entity_id = event.data.get("entity_id")
+
+            if entity_id not in entity_callbacks:
+                return
+
+            for job in entity_callbacks[entity_id][:]:
+                try:
+                    hass.async_run_job(job, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error while processing state changed for %s", entity_id
+                    )
+
+        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, _async_state_change_dispatcher
+        )
+
+    for entity_id in entity_ids:
+        entity_callbacks.setdefault(entity_id, []).append(action)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove state change listener."""
+        _async_remove_state_change_listeners(hass, entity_ids, action)
+
+    return remove_listener
+
+
+track_state_change_event = threaded_listener_factory(async_track_state_change_event)
+
+
+@callback
+def _remove_empty_listener() -> None:
+    """Remove a listener that does nothing."""
+
+
+@callback
+def _async_remove_state_change_listeners(
+    hass: HomeAssistant, entity_ids: Iterable[str], action: Callable[[Event], Any]
+) -> None:
+    """Remove a listener."""
+    entity_callbacks = hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+
+    for entity_id in entity_ids:
+        entity_callbacks[entity_id].remove(action)
+        if len(entity_callbacks[entity_id]) == 0:
+            del entity_callbacks[entity_id]
+
+    if not entity_callbacks:
+        hass.data[TRACK_STATE_CHANGE_LISTENER]()
+        del hass.data[TRACK_STATE_CHANGE_LISTENER]
+
+
 @callback
 @bind_hass
 def async_track_template(
@@ -117,28 +235,108 @@ def async_track_template(
     action: Callable[[str, State, State], None],
     variables: Optional[Dict[str, Any]] = None,
 ) -> CALLBACK_TYPE:
-    """Add a listener that track state changes with template condition."""
-    from . import condition  # pylint: disable=import-outside-toplevel
+    """Add a listener that track state changes with template condition.
+
+    Every render collects the entities and domains the template reads. The
+    template is rendered again when one of those entities changes or when
+    an entity of those domains is added or removed. A template that reads
+    no states or fails to render is rendered on every state change.
+    """
+    if template.is_static:
+        return _remove_empty_listener
 
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
+    info = template.async_render_to_info(variables)
+
+    track_all = False
+    track_lifecycle = False
+    entities: FrozenSet[str] = frozenset()
+    unsub_entities: Optional[CALLBACK_TYPE] = None
+    unsub_lifecycle: Optional[CALLBACK_TYPE] = None
 
     @callback
-    def template_condition_listener(entity_id: str, from_s: State, to_s: State) -> None:
+    def template_condition_listener(event: Event) -> None:
         """Check if condition is correct and run action."""
-        nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+        nonlocal already_triggered, info
+        info = template.async_render_to_info(variables)
+
+        try:
+            template_result = info.result.lower() == "true"
+        except TemplateError as ex:
+            _LOGGER.error("Error during template condition: %s", ex)
+            template_result = False
+
+        update_listeners()
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(
+                action,
+                event.data.get("entity_id"),
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
-    )
+    @callback
+    def lifecycle_listener(event: Event) -> None:
+        """Render the template if an entity of a tracked domain comes or goes."""
+        entity_id = event.data["entity_id"]
+        added_or_removed = (
+            event.data.get("old_state") is None or event.data.get("new_state") is None
+        )
+
+        if track_all or (
+            added_or_removed
+            and entity_id not in entities
+            and info.filter_lifecycle(entity_id)
+        ):
+            template_condition_listener(event)
+
+    @callback
+    def update_listeners() -> None:
+        """Listen to the state changes the last render depends on."""
+        nonlocal track_all, track_lifecycle, entities, unsub_entities, unsub_lifecycle
+
+        track_all = info.exception is not None or not (
+            info.entities or info.domains or info.all_states
+        )
+        new_entities = frozenset() if track_all else info.entities
+
+        if new_entities != entities:
+            if unsub_entities is not None:
+                unsub_entities()
+            entities = new_entities
+            unsub_entities = async_track_state_change_event(
+                hass, entities, template_condition_listener
+            )
+
+        new_track_lifecycle = track_all or bool(info.domains) or info.all_states
+
+        if new_track_lifecycle != track_lifecycle:
+            track_lifecycle = new_track_lifecycle
+            if track_lifecycle:
+                unsub_lifecycle = hass.bus.async_listen(
+                    EVENT_STATE_CHANGED, lifecycle_listener
+                )
+            else:
+                unsub_lifecycle()  # type: ignore
+                unsub_lifecycle = None
+
+    @callback
+    def remove_listener() -> None:
+        """Remove the listeners of the template."""
+        if unsub_entities is not None:
+            unsub_entities()
+        if unsub_lifecycle is not None:
+            unsub_lifecycle()
+
+    update_listeners()
+
+    return remove_listener
 
 
 track_template = threaded_listener_factory(async_track_template)
@@ -203,6 +401,207 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+@attr.s(slots=True, eq=False)
+class _ScheduledJob:
+    """A job of the time scheduler that runs once."""
+
+    deadline: datetime = attr.ib()
+    when: float = attr.ib()
+    action: Callable[[datetime], None] = attr.ib()
+    reference: datetime = attr.ib()
+    rollback: Optional[Callable[[datetime], None]] = attr.ib(default=None)
+    active: bool = attr.ib(default=True)
+
+
+class _TimeScheduler:
+    """Run the jobs of the time tracking helpers from one loop timer.
+
+    Jobs are kept in a heap by UTC deadline and in a heap by loop time.
+    While the timer of hass runs, a single loop.call_at is armed for the
+    earliest job. One time_changed listener runs the jobs whose deadline
+    the event passed, so jumps of the clock keep working without a
+    listener per job.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._by_deadline: List[Tuple[datetime, int, _ScheduledJob]] = []
+        self._by_when: List[Tuple[float, int, _ScheduledJob]] = []
+        self._sequence = 0
+        self._active = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._armed_when = 0.0
+        self._last_now: Optional[datetime] = None
+        self._rollback_jobs: Set[_ScheduledJob] = set()
+        self._unseen_jobs: Set[_ScheduledJob] = set()
+
+        hass.bus.async_listen(EVENT_TIME_CHANGED, self._async_time_changed)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def async_schedule(
+        self,
+        deadline: datetime,
+        action: Callable[[datetime], None],
+        reference: Optional[datetime] = None,
+        rollback: Optional[Callable[[datetime], None]] = None,
+        rescheduled: bool = False,
+    ) -> _ScheduledJob:
+        """Schedule action to be called with the time once deadline passed.
+
+        The loop timer is armed relative to reference, the current time by
+        default. A job with a rollback callback is cancelled and rollback is
+        called with the time of the first time_changed event that is not at
+        reference, and of every event that goes back in time. A job that is
+        rescheduled by the action of its previous run already is at the time
+        it ran, it is only recalculated when the time goes back.
+        """
+        if reference is None:
+            reference = dt_util.utcnow()
+
+        when = self.hass.loop.time() + (deadline - reference).total_seconds()
+        job = _ScheduledJob(deadline, when, action, reference, rollback)
+
+        self._sequence += 1
+        heappush(self._by_deadline, (deadline, self._sequence, job))
+        heappush(self._by_when, (when, self._sequence, job))
+        self._active += 1
+
+        if rollback is not None:
+            self._rollback_jobs.add(job)
+            if not rescheduled and reference != self._last_now:
+                self._unseen_jobs.add(job)
+
+        self._async_arm()
+        return job
+
+    @callback
+    def async_cancel(self, job: _ScheduledJob) -> None:
+        """Cancel a job that has not run yet."""
+        if not job.active:
+            return
+
+        self._async_deactivate(job)
+
+        queued = max(len(self._by_deadline), len(self._by_when))
+        if queued > 2 * self._active + COMPACT_CANCELLED_JOBS:
+            self._by_deadline = [item for item in self._by_deadline if item[2].active]
+            self._by_when = [item for item in self._by_when if item[2].active]
+            heapify(self._by_deadline)
+            heapify(self._by_when)
+
+    @callback
+    def _async_deactivate(self, job: _ScheduledJob) -> None:
+        """Mark a job as done, it is dropped from the heaps lazily."""
+        job.active = False
+        self._active -= 1
+        if job.rollback is not None:
+            self._rollback_jobs.discard(job)
+            self._unseen_jobs.discard(job)
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the loop timer for the earliest active job."""
+        by_when = self._by_when
+        while by_when and not by_when[0][2].active:
+            heappop(by_when)
+
+        # Jobs only run on time_changed events until the timer started
+        if not by_when or not self.hass.timer_running:
+            return
+
+        when = by_when[0][0]
+        if self._handle is not None:
+            if self._armed_when <= when:
+                return
+            self._handle.cancel()
+
+        self._armed_when = when
+        self._handle = self.hass.loop.call_at(when, self._async_timer_fired)
+
+    @callback
+    def _async_timer_fired(self) -> None:
+        """Run the jobs that are due by the loop time."""
+        self._handle = None
+        loop_now = self.hass.loop.time()
+        by_when = self._by_when
+        due = []
+
+        while by_when and by_when[0][0] <= loop_now:
+            job = heappop(by_when)[2]
+            if job.active:
+                due.append(job)
+
+        if due:
+            now = dt_util.utcnow()
+            for job in due:
+                # Never report a time before the deadline, the loop clock
+                # can be slightly ahead of the wall clock.
+                self._async_run(job, max(now, job.deadline))
+
+        self._async_arm()
+
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Run the jobs whose deadline passed by the time of the event."""
+        now = event.data[ATTR_NOW]
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=dt_util.UTC)
+
+        if self._last_now is not None and now < self._last_now:
+            # Time rolled back
+            recalculate = list(self._rollback_jobs)
+        else:
+            recalculate = list(self._unseen_jobs)
+        self._unseen_jobs.clear()
+        self._last_now = now
+
+        for job in recalculate:
+            rollback = job.rollback
+            assert rollback is not None
+            self.async_cancel(job)
+            rollback(now)
+
+        by_deadline = self._by_deadline
+        due = []
+
+        while by_deadline and by_deadline[0][0] <= now:
+            job = heappop(by_deadline)[2]
+            if job.active:
+                due.append(job)
+
+        for job in due:
+            self._async_run(job, now)
+
+        self._async_arm()
+
+    @callback
+    def _async_run(self, job: _ScheduledJob, now: datetime) -> None:
+        """Run a job unless an earlier job cancelled it."""
+        if not job.active:
+            return
+
+        self._async_deactivate(job)
+        job.action(now)
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """Stop the loop timer, like the time_changed events stop."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
+@callback
+def _async_get_time_scheduler(hass: HomeAssistant) -> _TimeScheduler:
+    """Return the time scheduler of hass."""
+    scheduler: Optional[_TimeScheduler] = hass.data.get(TRACK_TIME_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_SCHEDULER] = _TimeScheduler(hass)
+    return scheduler
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -232,26 +631,14 @@ def async_track_point_in_utc_time(
     point_in_time = dt_util.as_utc(point_in_time)
 
     @callback
-    def point_in_time_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        now = event.data[ATTR_NOW]
-
-        if now < point_in_time or hasattr(point_in_time_listener, "run"):
-            return
-
-        # Set variable so that we will never run twice.
-        # Because the event bus might have to wait till a thread comes
-        # available to execute this listener it might occur that the
-        # listener gets lined up twice to be executed. This will make
-        # sure the second time it does nothing.
-        setattr(point_in_time_listener, "run", True)
-        async_unsub()
-
+    def point_in_time_listener(now: datetime) -> None:
+        """Run the action once the point in time passed."""
         hass.async_run_job(action, now)
 
-    async_unsub = hass.bus.async_listen(EVENT_TIME_CHANGED, point_in_time_listener)
+    scheduler = _async_get_time_scheduler(hass)
+    job = scheduler.async_schedule(point_in_time, point_in_time_listener)
 
-    return async_unsub
+    return ft.partial(scheduler.async_cancel, job)
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -418,42 +805,49 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
+    scheduler = _async_get_time_scheduler(hass)
+    job: Optional[_ScheduledJob] = None
+
+    @callback
+    def schedule_next(now: datetime, after: Optional[datetime] = None) -> None:
+        """Schedule the next time the pattern matches, at or after after.
 
-    def calculate_next(now: datetime) -> None:
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
+        After is given when the pattern matched at now, the job is
+        rescheduled from its own run.
+        """
+        nonlocal job
 
-        localized_now = dt_util.as_local(now) if local else now
+        rescheduled = after is not None
+        after = after or now
+        localized_after = dt_util.as_local(after) if local else after
         next_time = dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
+            localized_after, matching_seconds, matching_minutes, matching_hours
+        )
+        # Rolling back the clock before now calculates the next time again,
+        # so it doesn't prevent the timer from triggering.
+        job = scheduler.async_schedule(
+            dt_util.as_utc(next_time),
+            pattern_time_change_listener,
+            now,
+            schedule_next,
+            rescheduled=rescheduled,
         )
-
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now: Optional[datetime] = None
 
     @callback
-    def pattern_time_change_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
-
-        now = event.data[ATTR_NOW]
-
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
-            calculate_next(now)
+    def pattern_time_change_listener(now: datetime) -> None:
+        """Run the action, the time matched the pattern."""
+        schedule_next(now, now + timedelta(seconds=1))
+        hass.async_run_job(action, dt_util.as_local(now) if local else now)
 
-        last_now = now
+    @callback
+    def remove_listener() -> None:
+        """Remove the pattern listener."""
+        assert job is not None
+        scheduler.async_cancel(job)
 
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
-            calculate_next(now + timedelta(seconds=1))
+    schedule_next(dt_util.utcnow())
 
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED, pattern_time_change_listener)
+    return remove_listener
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -338,7 +338,8 @@ def async_set_service_schema(
 async def entity_service_call(hass, platforms, func, call, required_features=None):
     """Handle an entity service call.
 
-    Calls all platforms simultaneously.
+    Platforms is an iterable of entity platforms or a dictionary of all
+    entities of the domain by entity_id. Calls all entities simultaneously.
     """
     if call.context.user_id:
         user = await hass.auth.async_get_user(call.context.user_id)
@@ -365,56 +366,51 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
     else:
         data = call
 
+    # Entities are resolved against the entity_id maps of the platforms, or
+    # the map of all entities of the domain, instead of scanning them all.
+    if isinstance(platforms, dict):
+        entity_maps = [platforms]
+    else:
+        entity_maps = [platform.entities for platform in platforms]
+
     # Check the permissions
 
     # A list with entities to call the service on.
     entity_candidates = []
 
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
-                entity_candidates.extend(platform.entities.values())
+    if target_all_entities:
+        for entity_map in entity_maps:
+            if entity_perms is None:
+                entity_candidates.extend(entity_map.values())
             else:
+                # If we target all entities, we will select all entities the
+                # user is allowed to control.
                 entity_candidates.extend(
                     [
                         entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in entity_ids
+                        for entity in entity_map.values()
+                        if entity_perms(entity.entity_id, POLICY_CONTROL)
                     ]
                 )
 
-    elif target_all_entities:
-        # If we target all entities, we will select all entities the user
-        # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
-
     else:
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in entity_ids:
+        for entity_map in entity_maps:
+            for entity_id in entity_ids:
+                entity = entity_map.get(entity_id)
+                if entity is None:
                     continue
 
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                if entity_perms is not None and not entity_perms(
+                    entity_id, POLICY_CONTROL
+                ):
                     raise Unauthorized(
                         context=call.context,
-                        entity_id=entity.entity_id,
+                        entity_id=entity_id,
                         permission=POLICY_CONTROL,
                     )
 
-                platform_entities.append(entity)
-
-            entity_candidates.extend(platform_entities)
+                entity_candidates.append(entity)
 
-    if not target_all_entities:
         for entity in entity_candidates:
             entity_ids.remove(entity.entity_id)
 
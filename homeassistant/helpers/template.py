@@ -2,13 +2,13 @@
 import base64
 import collections.abc
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 import json
 import logging
 import math
 import random
 import re
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -117,6 +117,16 @@ def extract_entities(
     return MATCH_ALL
 
 
+@lru_cache(maxsize=128)
+def _json_loads(value: Any) -> Any:
+    """Decode a JSON value once for all templates rendered with it.
+
+    Templates can't modify the values they are rendered with, so the
+    decoded value is shared.
+    """
+    return json.loads(value)
+
+
 def _true(arg: Any) -> bool:
     return True
 
@@ -146,6 +156,26 @@ class RenderInfo:
             or entity_id in self._entities
         )
 
+    @property
+    def entities(self) -> FrozenSet[str]:
+        """Return the entities the template accessed."""
+        return frozenset(self._entities)
+
+    @property
+    def domains(self) -> FrozenSet[str]:
+        """Return the domains the template iterated over."""
+        return frozenset(getattr(self, "_domains", ()))
+
+    @property
+    def all_states(self) -> bool:
+        """Return if the template iterated over all states."""
+        return self._all_states
+
+    @property
+    def exception(self) -> Optional[TemplateError]:
+        """Return the exception the template raised."""
+        return self._exception
+
     @property
     def result(self) -> str:
         """Results of the template computation."""
@@ -188,6 +218,11 @@ class Template:
             ret = self.hass.data[_ENVIRONMENT] = TemplateEnvironment(self.hass)
         return ret
 
+    @property
+    def is_static(self) -> bool:
+        """Return if the template is plain text without Jinja."""
+        return _RE_JINJA_DELIMITERS.search(self.template) is None
+
     def ensure_valid(self):
         """Return if template is valid."""
         if self._compiled_code is not None:
@@ -275,7 +310,7 @@ class Template:
         variables["value"] = value
 
         try:
-            variables["value_json"] = json.loads(value)
+            variables["value_json"] = _json_loads(value)
         except (ValueError, TypeError):
             pass
 
@@ -11,6 +11,7 @@ import json
 import logging
 import pathlib
 import sys
+from time import monotonic
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -38,8 +39,11 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "integration_import_times"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
+MANIFEST_INDEX = "homeassistant.generated.manifests"
 CUSTOM_WARNING = (
     "You are using a custom integration for %s which has not "
     "been tested by Home Assistant. This component might "
@@ -172,6 +176,27 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_index(
+        cls,
+        hass: "HomeAssistant",
+        root_module: ModuleType,
+        manifests: Dict[str, Dict[str, Any]],
+        domain: str,
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifest index."""
+        manifest = manifests.get(domain)
+
+        if manifest is None:
+            return None
+
+        return cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            pathlib.Path(cast(str, root_module.__file__)).parent / domain,
+            dict(manifest),
+        )
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -261,19 +286,65 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import(self.domain, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
+    async def async_get_component(self) -> ModuleType:
+        """Return the component, importing it in the executor if needed.
+
+        Integrations that are set up together are imported in parallel and
+        slow imports do not block the event loop.
+        """
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        if self.domain in cache:
+            return cache[self.domain]  # type: ignore
+        return await self._async_import_in_executor(self.get_component)
+
     def get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = importlib.import_module(
-                f"{self.pkg_path}.{platform_name}"
+            cache[full_name] = self._import(
+                full_name, f"{self.pkg_path}.{platform_name}"
             )
         return cache[full_name]  # type: ignore
 
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration, importing it in the executor."""
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        full_name = f"{self.domain}.{platform_name}"
+        if full_name in cache:
+            return cache[full_name]  # type: ignore
+        return await self._async_import_in_executor(self.get_platform, platform_name)
+
+    async def _async_import_in_executor(
+        self, target: Callable[..., ModuleType], *args: Any
+    ) -> ModuleType:
+        """Run an import in the executor."""
+        try:
+            return await self.hass.async_add_executor_job(target, *args)
+        except ImportError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # Some modules create asyncio primitives when they are imported,
+            # which needs the event loop thread.
+            _LOGGER.debug(
+                "Unable to import %s in the executor, importing in the event loop",
+                self.pkg_path,
+                exc_info=True,
+            )
+            return target(*args)
+
+    def _import(self, cache_key: str, name: str) -> ModuleType:
+        """Import a module of the integration and record the import time."""
+        start = monotonic()
+        module = importlib.import_module(name)
+        self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[cache_key] = (
+            monotonic() - start
+        )
+        return module
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -315,9 +386,15 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    manifests = await _async_get_manifest_index(hass)
+    integration = Integration.resolve_from_index(hass, components, manifests, domain)
+
+    # Integrations that are not in the index yet, like a new integration
+    # in a development checkout, are resolved from their manifest.json.
+    if integration is None:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
@@ -339,6 +416,25 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
     return integration
 
 
+async def _async_get_manifest_index(
+    hass: "HomeAssistant",
+) -> Dict[str, Dict[str, Any]]:
+    """Return the manifests of the built-in integrations.
+
+    The generated index replaces reading and parsing a manifest.json file
+    for every built-in integration. It is imported in the executor once.
+    """
+    manifests = hass.data.get(DATA_MANIFEST_INDEX)
+
+    if manifests is None:
+        module = await hass.async_add_executor_job(
+            importlib.import_module, MANIFEST_INDEX
+        )
+        manifests = hass.data[DATA_MANIFEST_INDEX] = module.MANIFESTS
+
+    return cast(Dict[str, Dict[str, Any]], manifests)
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
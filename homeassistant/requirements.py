@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Union, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -13,6 +13,10 @@ import homeassistant.util.package as pkg_util
 DATA_PIP_LOCK = "pip_lock"
 DATA_PKG_CACHE = "pkg_cache"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
+DATA_REQUIREMENTS_CACHE = "requirements_cache"
+STORAGE_KEY = "core.requirements"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
 CONSTRAINT_FILE = "package_constraints.txt"
 PROGRESS_FILE = ".pip_progress"
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +27,52 @@ DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
 _UNDEF = object()
 
 
+class RequirementsCache:
+    """Requirements that are satisfied by the installed packages.
+
+    The cache is stored together with a fingerprint of the installed
+    packages. It is only used when the packages did not change since, so
+    an unchanged install does not check its requirements on every start.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self.satisfied: Set[str] = set()
+        self._environment: Optional[str] = None
+
+    async def async_load(self, hass: HomeAssistant) -> None:
+        """Load the requirements that are satisfied."""
+        data, self._environment = await asyncio.gather(
+            self._store.async_load(),
+            hass.async_add_executor_job(pkg_util.environment_fingerprint),
+        )
+
+        if data is not None and data["environment"] == self._environment:
+            self.satisfied = set(data["satisfied"])
+
+    @callback
+    def async_add(self, requirement: str) -> None:
+        """Add a requirement that is satisfied."""
+        self.satisfied.add(requirement)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_installed(self, requirement: str) -> None:
+        """Add a requirement that was installed.
+
+        Installing can change the versions of packages that satisfied other
+        requirements, the next start checks all requirements again.
+        """
+        self._environment = None
+        self.async_add(requirement)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return data of the cache to store in a file."""
+        return {"environment": self._environment, "satisfied": sorted(self.satisfied)}
+
+
 class RequirementsNotFound(HomeAssistantError):
     """Raised when a component is not found."""
 
@@ -120,8 +170,18 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
+        cache = hass.data.get(DATA_REQUIREMENTS_CACHE)
+        if cache is None:
+            cache = RequirementsCache(hass)
+            await cache.async_load(hass)
+            hass.data[DATA_REQUIREMENTS_CACHE] = cache
+
         for req in requirements:
-            if pkg_util.is_installed(req):
+            if req in cache.satisfied:
+                continue
+
+            if await hass.async_add_executor_job(pkg_util.is_installed, req):
+                cache.async_add(req)
                 continue
 
             ret = await hass.async_add_executor_job(_install, hass, req, kwargs)
@@ -129,6 +189,8 @@ async def async_process_requirements(
             if not ret:
                 raise RequirementsNotFound(name, [req])
 
+            cache.async_installed(req)
+
 
 def _install(hass: HomeAssistant, req: str, kwargs: Dict) -> bool:
     """Install requirement."""
@@ -2,8 +2,9 @@
 import argparse
 import asyncio
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import os
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
@@ -96,10 +97,57 @@ async def time_changed_helper(hass):
             event.set()
 
     hass.helpers.event.async_track_time_change(listener, minute=0, second=0)
-    event_data = {ATTR_NOW: datetime(2017, 10, 10, 15, 0, 0, tzinfo=dt_util.UTC)}
+    start_time = datetime(2017, 10, 10, 15, 0, 0, tzinfo=dt_util.UTC)
 
-    for _ in range(10 ** 6):
-        hass.bus.async_fire(EVENT_TIME_CHANGED, event_data)
+    # Every event is a new hour, a repeated time does not match twice
+    for hour in range(10 ** 6):
+        hass.bus.async_fire(
+            EVENT_TIME_CHANGED, {ATTR_NOW: start_time + timedelta(hours=hour)}
+        )
+
+    start = timer()
+
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def time_changed_idle(hass):
+    """Run ten thousand idle seconds with a thousand time trackers.
+
+    Half of the trackers wait an hour, half match on the hour. The timer
+    ticks do not run the trackers that are not due, so the runtime should
+    barely depend on the number of trackers.
+    """
+    count = 0
+    event = asyncio.Event()
+    ticks = 10 ** 4
+
+    @core.callback
+    def tracker(_):
+        """Handle a tracker that is due."""
+
+    @core.callback
+    def tick_listener(_):
+        """Count the timer ticks."""
+        nonlocal count
+        count += 1
+
+        if count == ticks:
+            event.set()
+
+    for _ in range(500):
+        hass.helpers.event.async_call_later(3600, tracker)
+        hass.helpers.event.async_track_time_change(tracker, minute=0, second=0)
+
+    hass.bus.async_listen(EVENT_TIME_CHANGED, tick_listener)
+    start_time = datetime(2017, 10, 10, 15, 0, 1, tzinfo=dt_util.UTC)
+
+    for second in range(ticks):
+        hass.bus.async_fire(
+            EVENT_TIME_CHANGED, {ATTR_NOW: start_time + timedelta(seconds=second)}
+        )
 
     start = timer()
 
@@ -141,6 +189,63 @@ async def state_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_event_helper(hass):
+    """Run a million events through state changed event helper."""
+    return await _state_changed_event_helper(hass, 1)
+
+
+@benchmark
+async def state_changed_event_helper_1000(hass):
+    """Run a million events through state changed event helper.
+
+    A thousand other entities are tracked at the same time. The runtime
+    should match state_changed_event_helper as dispatch is indexed by
+    entity_id.
+    """
+    return await _state_changed_event_helper(hass, 1000)
+
+
+async def _state_changed_event_helper(hass, tracked_entities):
+    count = 0
+    entity_id = "light.kitchen"
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 6:
+            event.set()
+
+    @core.callback
+    def other_listener(*args):
+        """Handle event for an entity that never changes."""
+
+    hass.helpers.event.async_track_state_change_event(entity_id, listener)
+    for idx in range(1, tracked_entities):
+        hass.helpers.event.async_track_state_change_event(
+            f"light.kitchen_{idx}", other_listener
+        )
+
+    event_data = {
+        "entity_id": entity_id,
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    for _ in range(10 ** 6):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    start = timer()
+
+    await event.wait()
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -208,3 +313,433 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def websocket_state_changed_clients(hass):
+    """Forward ten thousand state changes to 1, 8 and 32 websocket clients.
+
+    Prints the loop time per state change for each number of clients, the
+    state is encoded once however many clients get it.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import User
+    from homeassistant.components.websocket_api import commands, connection
+
+    logger = logging.getLogger(__name__)
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    changes = 10 ** 4
+    total = 0
+    subscribe_msg = {"id": 1, "type": "subscribe_events", "event_type": "state_changed"}
+
+    for clients in (1, 8, 32):
+        sent = 0
+        event = asyncio.Event()
+
+        @core.callback
+        def send_message(message, coalesce_key=None):
+            """Frame a message like the websocket writer does."""
+            nonlocal sent
+            if not isinstance(message, str):
+                message = JSON_DUMP(message)
+            sent += 1
+
+            if sent == changes * clients:
+                event.set()
+
+        connections = [
+            connection.ActiveConnection(logger, hass, send_message, user, None)
+            for _ in range(clients)
+        ]
+        for conn in connections:
+            commands.handle_subscribe_events(hass, conn, subscribe_msg)
+        await hass.async_block_till_done()
+        sent = 0
+
+        start = timer()
+
+        for value in range(changes):
+            hass.states.async_set("sensor.power", value, {"unit_of_measurement": "W"})
+
+        await event.wait()
+        runtime = timer() - start
+        total += runtime
+        per_change = runtime / changes * 10 ** 6
+        print(f"{clients} clients: {per_change:.0f}µs per state change")
+
+        for conn in connections:
+            conn.async_close()
+
+    return total
+
+
+@benchmark
+async def websocket_get_states_reconnect(hass):
+    """Reconnect 32 websocket clients that each get 4000 states at once.
+
+    Prints the longest event loop iteration while the states are sent, the
+    states are encoded in the executor so the loop stays responsive.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import User
+    from homeassistant.components.websocket_api import commands, connection
+
+    logger = logging.getLogger(__name__)
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    clients = 32
+    pending = []
+    longest = 0
+    done = False
+
+    for index in range(4000):
+        hass.states.async_set(
+            f"sensor.power_{index}",
+            index,
+            {"unit_of_measurement": "W", "friendly_name": f"Power {index}"},
+        )
+
+    @core.callback
+    def send_message(message):
+        """Collect the messages for the writer."""
+        pending.append(message)
+
+    async def measure_loop():
+        """Measure the longest event loop iteration."""
+        nonlocal longest
+        while not done:
+            before = timer()
+            await asyncio.sleep(0)
+            longest = max(longest, timer() - before)
+
+    measure_task = hass.loop.create_task(measure_loop())
+    start = timer()
+
+    for iden in range(clients):
+        conn = connection.ActiveConnection(logger, hass, send_message, user, None)
+        commands.handle_get_states(hass, conn, {"id": iden, "type": "get_states"})
+
+    for message in pending:
+        if isinstance(message, asyncio.Future):
+            await message
+
+    runtime = timer() - start
+    done = True
+    await measure_task
+    print(f"Longest event loop iteration: {longest * 1000:.1f}ms")
+    return runtime
+
+
+@benchmark
+async def websocket_state_changed_users(hass):
+    """Forward ten thousand state changes to 20 non-admin tablet users.
+
+    Each user may read the entities in the area of their tablet, the
+    permissions are checked for every state change.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import Group, User
+    from homeassistant.auth.permissions import PermissionLookup
+    from homeassistant.components.websocket_api import commands, connection
+    from homeassistant.helpers import device_registry, entity_registry
+
+    logger = logging.getLogger(__name__)
+    users = 20
+    entities = 1000
+    changes = 10 ** 4
+    sent = 0
+    event = asyncio.Event()
+    subscribe_msg = {"id": 1, "type": "subscribe_events", "event_type": "state_changed"}
+
+    ent_reg = entity_registry.EntityRegistry(hass)
+    ent_reg.entities = entity_registry.EntityRegistryItems()
+    dev_reg = device_registry.DeviceRegistry(hass)
+    dev_reg.devices = device_registry.DeviceRegistryItems()
+
+    for index in range(entities):
+        device_id = f"device_{index}"
+        dev_reg.devices[device_id] = device_registry.DeviceEntry(
+            id=device_id, area_id=f"area_{index % users}"
+        )
+        entity_id = f"sensor.power_{index}"
+        ent_reg.entities[entity_id] = entity_registry.RegistryEntry(
+            entity_id=entity_id,
+            unique_id=str(index),
+            platform="benchmark",
+            device_id=device_id,
+        )
+
+    perm_lookup = PermissionLookup(ent_reg, dev_reg)
+
+    @core.callback
+    def send_message(message, coalesce_key=None):
+        """Frame a message like the websocket writer does."""
+        nonlocal sent
+        if not isinstance(message, str):
+            message = JSON_DUMP(message)
+        sent += 1
+
+        if sent == changes:
+            event.set()
+
+    connections = []
+    for index in range(users):
+        group = Group(
+            name=f"Tablet {index}",
+            policy={"entities": {"area_ids": {f"area_{index}": True}}},
+        )
+        user = User(
+            name=f"Tablet {index}",
+            perm_lookup=perm_lookup,
+            groups=[group],
+            is_active=True,
+        )
+        conn = connection.ActiveConnection(logger, hass, send_message, user, None)
+        commands.handle_subscribe_events(hass, conn, subscribe_msg)
+        connections.append(conn)
+
+    await hass.async_block_till_done()
+    sent = 0
+
+    start = timer()
+
+    for value in range(changes):
+        hass.states.async_set(
+            f"sensor.power_{value % entities}", value, {"unit_of_measurement": "W"}
+        )
+
+    await event.wait()
+    runtime = timer() - start
+    print(f"{runtime / changes * 10 ** 6:.0f}µs per state change")
+
+    for conn in connections:
+        conn.async_close()
+
+    return runtime
+
+
+@benchmark
+async def mqtt_dispatch(hass):
+    """Dispatch fifty thousand MQTT messages to 1500 subscribed entities.
+
+    That is ten seconds of messages at 5000 messages per second, the
+    runtime should stay well below that.
+    """
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant.components import mqtt
+
+    count = 0
+    messages = 5 * 10 ** 4
+    entities = 1500
+    event = asyncio.Event()
+
+    @core.callback
+    def message_received(_):
+        """Handle a message."""
+        nonlocal count
+        count += 1
+
+        if count == messages:
+            event.set()
+
+    client = mqtt.MQTT(
+        hass,
+        "localhost",
+        1883,
+        client_id=None,
+        keepalive=60,
+        username=None,
+        password=None,
+        certificate=None,
+        client_key=None,
+        client_cert=None,
+        tls_insecure=None,
+        protocol=None,
+        will_message=None,
+        birth_message=None,
+        tls_version=None,
+    )
+    for index in range(entities):
+        await client.async_subscribe(
+            f"zigbee2mqtt/device_{index}", message_received, 0
+        )
+        await client.async_subscribe(
+            f"tasmota/+/device_{index}/state", message_received, 0
+        )
+
+    msgs = []
+    for index in range(messages):
+        msg = MQTTMessage(topic=f"zigbee2mqtt/device_{index % entities}".encode())
+        msg.payload = b'{"temperature": 21.5}'
+        msgs.append(msg)
+
+    start = timer()
+
+    for msg in msgs:
+        client._mqtt_handle_message(msg)  # pylint: disable=protected-access
+
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def registry_lookups(hass):
+    """Look up ten thousand entities and their devices in the registries.
+
+    The registries hold ten thousand entities of 2500 devices, lookups by
+    unique id, device, area and config entry do not scan the entries.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import device_registry, entity_registry
+
+    entities = 10 ** 4
+    devices = entities // 4
+    dev_reg = device_registry.DeviceRegistry(hass)
+    dev_reg.devices = device_registry.DeviceRegistryItems()
+    ent_reg = entity_registry.EntityRegistry(hass)
+    ent_reg.entities = entity_registry.EntityRegistryItems()
+
+    for index in range(devices):
+        device = device_registry.DeviceEntry(
+            config_entries={f"entry_{index % 10}"},
+            identifiers={("bench", f"device_{index}")},
+            area_id=f"area_{index % 50}",
+        )
+        dev_reg.devices[device.id] = device
+
+    device_ids = list(dev_reg.devices)
+
+    for index in range(entities):
+        entity = entity_registry.RegistryEntry(
+            entity_id=f"sensor.bench_{index}",
+            unique_id=f"unique_{index}",
+            platform="bench",
+            device_id=device_ids[index % devices],
+            config_entry_id=f"entry_{index % 10}",
+        )
+        ent_reg.entities[entity.entity_id] = entity
+
+    start = timer()
+
+    for index in range(entities):
+        ent_reg.async_get_entity_id("sensor", "bench", f"unique_{index}")
+        identifiers = {("bench", f"device_{index % devices}")}
+        device = dev_reg.async_get_device(identifiers, set())
+        entity_registry.async_entries_for_device(ent_reg, device.id)
+        device_registry.async_entries_for_area(dev_reg, device.area_id)
+
+    for index in range(10):
+        device_registry.async_entries_for_config_entry(dev_reg, f"entry_{index}")
+        entity_registry.async_entries_for_config_entry(ent_reg, f"entry_{index}")
+
+    return timer() - start
+
+
+@benchmark
+async def entity_service_call_domain_size(hass):
+    """Call an entity service on three lights with 10 up to 10000 lights.
+
+    Prints the time per service call for each number of lights, it should
+    not grow with the number of entities in the domain.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import device_registry, entity_registry
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_component import EntityComponent
+
+    class BenchmarkLight(Entity):
+        """Light that does nothing when turned on."""
+
+        should_poll = False
+
+        async def async_turn_on(self):
+            """Turn the light on."""
+
+    # Group expansion of the targeted entities loads the group integration
+    hass.config.config_dir = os.path.dirname(__file__)
+    dev_reg = device_registry.DeviceRegistry(hass)
+    dev_reg.devices = device_registry.DeviceRegistryItems()
+    hass.data[device_registry.DATA_REGISTRY] = dev_reg
+    ent_reg = entity_registry.EntityRegistry(hass)
+    ent_reg.entities = entity_registry.EntityRegistryItems()
+    hass.data[entity_registry.DATA_REGISTRY] = ent_reg
+
+    logger = logging.getLogger(__name__)
+    component = EntityComponent(logger, "light", hass)
+    component.async_register_entity_service("turn_on", {}, "async_turn_on")
+    calls = 1000
+    total = 0
+    lights = 0
+
+    for size in (10, 100, 1000, 10000):
+        entities = []
+        for index in range(lights, size):
+            entity = BenchmarkLight()
+            entity.entity_id = f"light.bench_{index}"
+            entities.append(entity)
+        await component.async_add_entities(entities)
+        lights = size
+        data = {"entity_id": ["light.bench_1", "light.bench_4", "light.bench_7"]}
+
+        start = timer()
+
+        for _ in range(calls):
+            await hass.services.async_call("light", "turn_on", data, blocking=True)
+
+        runtime = timer() - start
+        total += runtime
+        print(f"{size} lights: {runtime / calls * 10 ** 6:.0f}µs per service call")
+
+    return total
+
+
+@benchmark
+async def entity_write_state(hass):
+    """Write the state of a sensor a hundred thousand times.
+
+    Only the state changes between writes, the attributes stay the same.
+    Prints the number of state writes per second.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.config import DATA_CUSTOMIZE
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_registry import RegistryEntry
+    from homeassistant.helpers.entity_values import EntityValues
+
+    class BenchmarkSensor(Entity):
+        """Sensor with a state that changes on every write."""
+
+        should_poll = False
+        name = "Benchmark sensor"
+        icon = "mdi:speedometer"
+        unit_of_measurement = "W"
+        device_class = "power"
+        value = 0
+
+        @property
+        def state(self):
+            """Return the state."""
+            return self.value
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues(
+        {"sensor.bench": {"hidden": False}}, {"sensor": {"attribution": "bench"}}
+    )
+    entity = BenchmarkSensor()
+    entity.hass = hass
+    entity.entity_id = "sensor.bench"
+    entity.registry_entry = RegistryEntry(
+        entity_id="sensor.bench", unique_id="bench", platform="bench", name="Bench"
+    )
+    writes = 10 ** 5
+
+    start = timer()
+
+    for value in range(writes):
+        entity.value = value
+        entity.async_write_ha_state()
+
+    runtime = timer() - start
+    print(f"{writes / runtime:.0f} state writes per second")
+    return runtime
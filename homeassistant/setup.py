@@ -1,9 +1,22 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+import contextlib
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, List, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import attr
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -17,10 +30,63 @@ ATTR_COMPONENT = "component"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
+
+PHASE_DEPENDENCIES = "dependencies"
+PHASE_REQUIREMENTS = "requirements"
+PHASE_IMPORT = "import"
+PHASE_CONFIG = "config"
+PHASE_SETUP = "setup"
+PHASE_SETUP_EXECUTOR = "setup_executor"
+PHASE_CONFIG_ENTRIES = "config_entries"
+
+# Phases that run in the executor
+EXECUTOR_PHASES = {PHASE_REQUIREMENTS, PHASE_IMPORT, PHASE_SETUP_EXECUTOR}
+SETUP_PHASES = {PHASE_SETUP, PHASE_SETUP_EXECUTOR, PHASE_CONFIG_ENTRIES}
 
 SLOW_SETUP_WARNING = 10
 
 
+@attr.s(slots=True)
+class SetupTimeline:
+    """Timeline of setting up an integration."""
+
+    start = attr.ib(type=float)
+    end = attr.ib(type=Optional[float], default=None)
+    # Phase, start and end of each recorded phase
+    phases = attr.ib(type=List[Tuple[str, float, float]], factory=list)
+
+    def duration(self, phases: Iterable[str]) -> float:
+        """Return the time spent in phases."""
+        return sum(end - start for phase, start, end in self.phases if phase in phases)
+
+
+@core.callback
+def _async_get_timeline(
+    hass: core.HomeAssistant, domain: str, start: float
+) -> SetupTimeline:
+    """Return the setup timeline of an integration."""
+    timelines = hass.data.setdefault(DATA_SETUP_TIMELINE, {})
+    timeline = timelines.get(domain)
+    if timeline is None:
+        timeline = timelines[domain] = SetupTimeline(start)
+    return timeline  # type: ignore
+
+
+@contextlib.contextmanager
+def _async_record_phase(
+    hass: core.HomeAssistant, domain: str, phase: str
+) -> Iterator[None]:
+    """Record a phase of setting up an integration in its timeline."""
+    start = timer()
+    try:
+        yield
+    finally:
+        _async_get_timeline(hass, domain, start).phases.append(
+            (phase, start, timer())
+        )
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -43,11 +109,15 @@ async def async_setup_component(
     if domain in setup_tasks:
         return await setup_tasks[domain]  # type: ignore
 
+    timeline = _async_get_timeline(hass, domain, timer())
     task = setup_tasks[domain] = hass.async_create_task(
         _async_setup_component(hass, domain, config)
     )
 
-    return await task  # type: ignore
+    try:
+        return await task  # type: ignore
+    finally:
+        timeline.end = timer()
 
 
 async def _async_process_dependencies(
@@ -134,7 +204,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with _async_record_phase(hass, domain, PHASE_IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -142,9 +213,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with _async_record_phase(hass, domain, PHASE_CONFIG):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -167,13 +239,15 @@ async def _async_setup_component(
 
     try:
         if hasattr(component, "async_setup"):
-            result = await component.async_setup(  # type: ignore
-                hass, processed_config
-            )
+            with _async_record_phase(hass, domain, PHASE_SETUP):
+                result = await component.async_setup(  # type: ignore
+                    hass, processed_config
+                )
         elif hasattr(component, "setup"):
-            result = await hass.async_add_executor_job(
-                component.setup, hass, processed_config  # type: ignore
-            )
+            with _async_record_phase(hass, domain, PHASE_SETUP_EXECUTOR):
+                result = await hass.async_add_executor_job(
+                    component.setup, hass, processed_config  # type: ignore
+                )
         else:
             log_error("No setup function defined.")
             return False
@@ -201,12 +275,13 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
-    )
+    with _async_record_phase(hass, domain, PHASE_CONFIG_ENTRIES):
+        await asyncio.gather(
+            *[
+                entry.async_setup(hass, integration=integration)
+                for entry in hass.config_entries.async_entries(domain)
+            ]
+        )
 
     hass.config.components.add(domain)
 
@@ -248,7 +323,7 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        platform = await integration.async_get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -261,7 +336,7 @@ async def async_prepare_setup_platform(
     # If the integration is not set up yet, and can be set up, set it up.
     if integration.domain not in hass.config.components:
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as exc:
             log_error(f"Unable to import the component ({exc}).")
             return None
@@ -288,15 +363,19 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if integration.dependencies and not await _async_process_dependencies(
-        hass, config, integration.domain, integration.dependencies
-    ):
-        raise HomeAssistantError("Could not set up all dependencies.")
+    if integration.dependencies:
+        with _async_record_phase(hass, integration.domain, PHASE_DEPENDENCIES):
+            dependencies_set_up = await _async_process_dependencies(
+                hass, config, integration.domain, integration.dependencies
+            )
+        if not dependencies_set_up:
+            raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+        with _async_record_phase(hass, integration.domain, PHASE_REQUIREMENTS):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -332,3 +411,102 @@ def async_when_setup(
         await when_setup()
 
     unsub = hass.bus.async_listen(EVENT_COMPONENT_LOADED, loaded_event)
+
+
+@core.callback
+def async_get_setup_timings(hass: core.HomeAssistant) -> Dict[str, Dict[str, float]]:
+    """Return the time spent importing and setting up each integration.
+
+    Import times include the platforms of the integration, setup times
+    include setting up its config entries. Times are in seconds.
+    """
+    timings: Dict[str, Dict[str, float]] = {}
+
+    for module, import_time in hass.data.get(loader.DATA_IMPORT_TIMES, {}).items():
+        timing = timings.setdefault(module.split(".")[0], {"import": 0, "setup": 0})
+        timing["import"] += import_time
+
+    for domain, timeline in hass.data.get(DATA_SETUP_TIMELINE, {}).items():
+        timings.setdefault(domain, {"import": 0, "setup": 0})[
+            "setup"
+        ] = timeline.duration(SETUP_PHASES)
+
+    return timings
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> List[Dict[str, Any]]:
+    """Return the setup timeline of the integrations, in order of setup.
+
+    Times are in seconds since the first integration started setting up.
+    The time spent waiting for dependencies to be set up and the time
+    spent in the executor are included per integration.
+    """
+    timelines: Dict[str, SetupTimeline] = hass.data.get(DATA_SETUP_TIMELINE, {})
+    if not timelines:
+        return []
+
+    base = min(timeline.start for timeline in timelines.values())
+
+    return [
+        {
+            "domain": domain,
+            "start": round(timeline.start - base, 6),
+            "end": None if timeline.end is None else round(timeline.end - base, 6),
+            "dependencies": round(timeline.duration({PHASE_DEPENDENCIES}), 6),
+            "executor": round(timeline.duration(EXECUTOR_PHASES), 6),
+            "phases": [
+                {
+                    "phase": phase,
+                    "start": round(start - base, 6),
+                    "end": round(end - base, 6),
+                }
+                for phase, start, end in timeline.phases
+            ],
+        }
+        for domain, timeline in sorted(
+            timelines.items(), key=lambda item: item[1].start
+        )
+    ]
+
+
+@core.callback
+def async_get_setup_chrome_trace(hass: core.HomeAssistant) -> Dict[str, Any]:
+    """Return the setup timeline in the Chrome trace event format.
+
+    The result can be saved as a JSON file and opened in chrome://tracing
+    or Perfetto. Every integration is shown as a thread with its phases.
+    """
+    events: List[Dict[str, Any]] = []
+
+    for tid, timeline in enumerate(async_get_setup_timeline(hass), 1):
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": timeline["domain"]},
+            }
+        )
+        spans = [(timeline["domain"], timeline["start"], timeline["end"])]
+        spans.extend(
+            (phase["phase"], phase["start"], phase["end"])
+            for phase in timeline["phases"]
+        )
+        for name, start, end in spans:
+            if end is None:
+                continue
+            events.append(
+                {
+                    "name": name,
+                    "cat": "setup",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round(start * 10 ** 6),
+                    "dur": round((end - start) * 10 ** 6),
+                }
+            )
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -0,0 +1,100 @@
+"""Dictionary that maintains secondary indexes of its values."""
+from typing import Any, Dict, Hashable, Iterable, List, Set, Tuple
+
+_MISSING = object()
+
+
+class IndexedDict(dict):
+    """Dictionary that keeps secondary indexes of its values up to date.
+
+    Subclasses implement _index_keys, which returns the (index, key) pairs a
+    value is indexed under. Every mutation keeps the indexes in sync, so
+    lookups by a secondary key do not have to scan all values.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the dictionary."""
+        super().__init__()
+        self._indexes: Dict[str, Dict[Hashable, Dict[Any, None]]] = {}
+        self.update(*args, **kwargs)
+
+    def _index_keys(self, value: Any) -> Iterable[Tuple[str, Hashable]]:
+        """Return the (index, key) pairs to index a value under."""
+        raise NotImplementedError
+
+    def _add_to_index(self, index_keys: Set[Tuple[str, Hashable]], key: Any) -> None:
+        """Add a key to the indexes."""
+        for index, index_key in index_keys:
+            self._indexes.setdefault(index, {}).setdefault(index_key, {})[key] = None
+
+    def _remove_from_index(
+        self, index_keys: Set[Tuple[str, Hashable]], key: Any
+    ) -> None:
+        """Remove a key from the indexes."""
+        for index, index_key in index_keys:
+            keys = self._indexes[index][index_key]
+            del keys[key]
+            if not keys:
+                del self._indexes[index][index_key]
+
+    def get_keys(self, index: str, index_key: Hashable) -> List[Any]:
+        """Return the keys of the values indexed under index_key."""
+        return list(self._indexes.get(index, {}).get(index_key, ()))
+
+    def get_values(self, index: str, index_key: Hashable) -> List[Any]:
+        """Return the values indexed under index_key."""
+        return [self[key] for key in self._indexes.get(index, {}).get(index_key, ())]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Add or replace a value and update the indexes."""
+        new_keys = set(self._index_keys(value))
+        old = dict.get(self, key, _MISSING)
+        if old is _MISSING:
+            self._add_to_index(new_keys, key)
+        else:
+            old_keys = set(self._index_keys(old))
+            self._remove_from_index(old_keys - new_keys, key)
+            self._add_to_index(new_keys - old_keys, key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        """Remove a value and update the indexes."""
+        value = dict.__getitem__(self, key)
+        self._remove_from_index(set(self._index_keys(value)), key)
+        super().__delitem__(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        """Remove a value, update the indexes and return the value."""
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = dict.__getitem__(self, key)
+        del self[key]
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        """Remove the last inserted item and return it."""
+        key, value = super().popitem()
+        self._remove_from_index(set(self._index_keys(value)), key)
+        return key, value
+
+    def clear(self) -> None:
+        """Remove all values and indexes."""
+        super().clear()
+        self._indexes.clear()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """Insert a value if the key is missing and return the value."""
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        """Add or replace values and update the indexes."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __reduce__(self) -> Tuple[type, Tuple[dict]]:
+        """Copy and pickle by rebuilding the indexes from the items."""
+        return (self.__class__, (dict(self),))
@@ -1,5 +1,6 @@
 """Helpers to install PyPi packages."""
 import asyncio
+import hashlib
 import logging
 import os
 from pathlib import Path
@@ -13,6 +14,9 @@ import pkg_resources
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entries of the metadata of installed packages, their names hold the version
+PACKAGE_METADATA_SUFFIXES = (".dist-info", ".egg-info", ".egg-link")
+
 
 def is_virtual_env() -> bool:
     """Return if we run in a virtual environment."""
@@ -46,6 +50,28 @@ def is_installed(package: str) -> bool:
         return False
 
 
+def environment_fingerprint() -> str:
+    """Return a fingerprint of the installed packages.
+
+    Installing, upgrading or removing a package changes the metadata entries
+    of the directory on the Python path it is installed in. Other files on
+    the path, like the ones in the config directory, are not included.
+    """
+    state = [sys.version]
+    for path in sys.path:
+        try:
+            with os.scandir(path or ".") as entries:
+                names = sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(PACKAGE_METADATA_SUFFIXES)
+                )
+        except OSError:
+            continue
+        state.extend(f"{path}:{name}" for name in names)
+    return hashlib.sha1("\n".join(state).encode()).hexdigest()
+
+
 def install_package(
     package: str,
     upgrade: bool = True,
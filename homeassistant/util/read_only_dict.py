@@ -0,0 +1,27 @@
+"""Read only dictionary."""
+from typing import Any, Tuple
+
+
+def _readonly(*args: Any, **kwargs: Any) -> Any:
+    """Raise an exception when a read only dict is modified."""
+    raise RuntimeError("Cannot modify ReadOnlyDict")
+
+
+class ReadOnlyDict(dict):
+    """Read only version of dict that is compatible with dict types.
+
+    Unlike a MappingProxyType it holds the items itself, so no wrapped
+    dictionary is kept alive, and it is JSON serializable as is.
+    """
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    pop = _readonly
+    popitem = _readonly
+    clear = _readonly
+    update = _readonly
+    setdefault = _readonly
+
+    def __reduce__(self) -> Tuple[type, Tuple[dict]]:
+        """Copy and pickle without setting the items one by one."""
+        return (self.__class__, (dict(self),))
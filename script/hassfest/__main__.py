@@ -11,6 +11,7 @@ from . import (
     dependencies,
     json,
     manifest,
+    manifest_index,
     services,
     ssdp,
     translations,
@@ -24,6 +25,7 @@ INTEGRATION_PLUGINS = [
     config_flow,
     dependencies,
     manifest,
+    manifest_index,
     services,
     ssdp,
     translations,
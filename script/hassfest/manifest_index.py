@@ -0,0 +1,77 @@
+"""Generate the manifest index file."""
+import json
+from typing import Any, Dict
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+""".strip()
+
+
+def format_value(value: Any, indent: int = 0) -> str:
+    """Format a manifest value as a Python literal."""
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        pad = " " * (indent + 4)
+        items = "".join(
+            f"{pad}{json.dumps(key)}: {format_value(item, indent + 4)},\n"
+            for key, item in value.items()
+        )
+        return f"{{\n{items}{' ' * indent}}}"
+
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        pad = " " * (indent + 4)
+        items = "".join(f"{pad}{format_value(item, indent + 4)},\n" for item in value)
+        return f"[\n{items}{' ' * indent}]"
+
+    if isinstance(value, bool) or value is None:
+        return repr(value)
+
+    return json.dumps(value)
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate the manifest index."""
+    manifests = {
+        domain: integrations[domain].manifest
+        for domain in sorted(integrations)
+        if integrations[domain].manifest
+    }
+
+    return BASE.format(format_value(manifests))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.py is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
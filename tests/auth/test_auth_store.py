@@ -2,8 +2,10 @@
 import asyncio
 
 from homeassistant.auth import auth_store
+from homeassistant.auth.permissions import PolicyPermissions
 
 from tests.async_mock import patch
+from tests.common import flush_store
 
 
 async def test_loading_no_group_data_format(hass, hass_storage):
@@ -242,3 +244,58 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_index(hass, hass_storage):
+    """Test refresh tokens are found by id after they are added or loaded."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Paulus")
+    token_1 = await store.async_create_refresh_token(user, "http://example.com")
+    token_2 = await store.async_create_refresh_token(user, "http://example.com")
+    assert await store.async_get_refresh_token(token_1.id) is token_1
+
+    await store.async_remove_refresh_token(token_1)
+    assert await store.async_get_refresh_token(token_1.id) is None
+    assert token_1.id not in user.refresh_tokens
+
+    await flush_store(store._store)
+    store_2 = auth_store.AuthStore(hass)
+    loaded = await store_2.async_get_refresh_token(token_2.id)
+    assert loaded.id == token_2.id
+    assert loaded.user.id == user.id
+
+    await store.async_remove_user(user)
+    assert await store.async_get_refresh_token(token_2.id) is None
+
+
+async def test_entity_permissions_follow_registries(hass, hass_storage):
+    """Test remembered entity permissions are updated with the registries."""
+    store = auth_store.AuthStore(hass)
+    await store._async_load()
+    perm_lookup = store._perm_lookup
+    device_registry = perm_lookup.device_registry
+    entity_registry = perm_lookup.entity_registry
+
+    device = device_registry.async_get_or_create(
+        config_entry_id="mock-entry-id", connections={("mac", "12:34:56:ab:cd:ef")}
+    )
+    entry = entity_registry.async_get_or_create(
+        "light", "hue", "1234", device_id=device.id
+    )
+    permissions = PolicyPermissions(
+        {"entities": {"area_ids": {"kitchen": True}}}, perm_lookup
+    )
+    assert not permissions.check_entity(entry.entity_id, "read")
+
+    device_registry.async_update_device(device.id, area_id="kitchen")
+    await hass.async_block_till_done()
+    assert permissions.check_entity(entry.entity_id, "read")
+
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.kitchen")
+    await hass.async_block_till_done()
+    assert not permissions.check_entity(entry.entity_id, "read")
+    assert permissions.check_entity("light.kitchen", "read")
+
+    entity_registry.async_remove("light.kitchen")
+    await hass.async_block_till_done()
+    assert not permissions.check_entity("light.kitchen", "read")
@@ -344,6 +344,51 @@ async def test_cannot_retrieve_expired_access_token(hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_cache(hass):
+    """Test validated access tokens are remembered until they expire."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert (
+            await manager.async_validate_access_token(access_token) is refresh_token
+        )
+    assert not mock_decode.called
+
+    # An expired token is validated again
+    expiration = jwt.decode(access_token, verify=False)["exp"]
+    with patch("homeassistant.auth.time.time", return_value=expiration), patch(
+        "homeassistant.auth.jwt.decode", wraps=jwt.decode
+    ) as mock_decode:
+        assert (
+            await manager.async_validate_access_token(access_token) is refresh_token
+        )
+    assert mock_decode.called
+
+
+async def test_validated_access_token_cache_invalidated(hass):
+    """Test remembered access tokens are forgotten with their user or token."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_deactivate_user(user)
+    assert not manager._access_tokens
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_generating_system_user(hass):
     """Test that we can add a system user."""
     events = []
@@ -49,6 +49,16 @@ async def test_api_get_state(hass, mock_api_client):
     assert data.attributes == state.attributes
 
 
+async def test_api_get_state_invalid_json(hass, mock_api_client):
+    """Test a state that is not valid JSON can't be retrieved."""
+    hass.states.async_set("hello.world", "nice", {"attr": float("nan")})
+    resp = await mock_api_client.get("/api/states/hello.world")
+    assert resp.status == 500
+
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == 500
+
+
 async def test_api_get_non_existing_state(hass, mock_api_client):
     """Test if the debug interface allows us to get a state."""
     resp = await mock_api_client.get("/api/states/does_not_exist")
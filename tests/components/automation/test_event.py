@@ -2,6 +2,7 @@
 import pytest
 
 import homeassistant.components.automation as automation
+from homeassistant.components.automation import event
 from homeassistant.core import Context
 from homeassistant.setup import async_setup_component
 
@@ -166,3 +167,53 @@ async def test_if_not_fires_if_event_data_not_matches(hass, calls):
     hass.bus.async_fire("test_event", {"some_attr": "some_other_value"})
     await hass.async_block_till_done()
     assert len(calls) == 0
+
+
+async def test_event_triggers_indexed_by_event_data(hass, calls):
+    """Test triggers are dispatched by a discriminating event data item."""
+    triggers = [
+        {
+            "platform": "event",
+            "event_type": "zha_event",
+            "event_data": {"device_ieee": ieee, "command": "on"},
+        }
+        for ieee in ("00:11", "00:22")
+    ]
+    triggers.append({"platform": "event", "event_type": "zha_event"})
+    listeners = hass.bus.async_listeners().get("zha_event", 0)
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": trigger,
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"index": index},
+                    },
+                }
+                for index, trigger in enumerate(triggers)
+            ]
+        },
+    )
+
+    assert hass.bus.async_listeners()["zha_event"] == listeners + 1
+    indexed = hass.data[event.DATA_EVENT_TRIGGERS]["zha_event"].indexed
+    assert set(indexed["device_ieee"]) == {"00:11", "00:22"}
+
+    hass.bus.async_fire("zha_event", {"device_ieee": "00:22", "command": "on"})
+    await hass.async_block_till_done()
+    assert sorted(call.data["index"] for call in calls) == [1, 2]
+
+    hass.bus.async_fire("zha_event", {"device_ieee": "00:22", "command": "off"})
+    hass.bus.async_fire("zha_event", {"device_ieee": ["00:11"], "command": "on"})
+    await hass.async_block_till_done()
+    assert sorted(call.data["index"] for call in calls) == [1, 2, 2, 2]
+
+    await common.async_turn_off(hass)
+    await hass.async_block_till_done()
+
+    assert hass.bus.async_listeners().get("zha_event", 0) == listeners
+    assert "zha_event" not in hass.data[event.DATA_EVENT_TRIGGERS]
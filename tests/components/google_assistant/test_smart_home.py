@@ -377,6 +377,8 @@ async def test_execute(hass):
         },
     }
 
+    await hass.async_block_till_done()
+
     assert len(events) == 6
     assert events[0].event_type == EVENT_COMMAND_RECEIVED
     assert events[0].data == {
@@ -1,9 +1,11 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
+from functools import partial
 import unittest
 
 from homeassistant.components import history, recorder
+from homeassistant.components.recorder.models import Statistics
 import homeassistant.core as ha
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
@@ -14,7 +16,7 @@ from tests.common import (
     init_recorder_component,
     mock_state_change_event,
 )
-from tests.components.recorder.common import wait_recording_done
+from tests.components.recorder.common import trigger_db_commit, wait_recording_done
 
 
 class TestComponentHistory(unittest.TestCase):
@@ -686,6 +688,52 @@ async def test_fetch_period_api(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_stream(hass, hass_client):
+    """Test the fetch period view streams the same states per entity."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+
+    hass.states.async_set("switch.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("switch.kitchen", "off")
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    url = f"/api/history/period/{start.isoformat()}"
+
+    response = await client.get(url)
+    assert response.status == 200
+    expected = await response.json()
+
+    with patch("homeassistant.components.http.view.STREAM_CHUNK_SIZE", 10):
+        response = await client.get(url, params={"stream": ""})
+    assert response.status == 200
+    streamed = await response.json()
+
+    assert [states[0]["entity_id"] for states in streamed] == [
+        "light.hall",
+        "light.kitchen",
+        "switch.kitchen",
+    ]
+    assert streamed == sorted(expected, key=lambda states: states[0]["entity_id"])
+
+    # The first state of an entity without changes is the one at start time
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}",
+        params={"stream": "", "filter_entity_id": "light.kitchen"},
+    )
+    assert response.status == 200
+    streamed = await response.json()
+    assert len(streamed) == 1
+    assert [state["state"] for state in streamed[0]] == ["off"]
+
+
 async def test_fetch_period_api_with_include_order(hass, hass_client):
     """Test the fetch period view for history."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -706,3 +754,64 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_fetch_period_api_with_resolution(hass, hass_client):
+    """Test the fetch period view reads statistics for a resolution."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    def _add_statistics():
+        with recorder.session_scope(hass=hass) as session:
+            for entity_id in ("sensor.power", "sensor.energy"):
+                for hour in range(3):
+                    session.add(
+                        Statistics(
+                            domain="sensor",
+                            entity_id=entity_id,
+                            period="hour",
+                            start=start + timedelta(hours=hour),
+                            mean=hour,
+                            min=hour - 1,
+                            max=hour + 1,
+                        )
+                    )
+
+    await hass.async_add_executor_job(_add_statistics)
+    client = await hass_client()
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"resolution": "hour", "filter_entity_id": "sensor.power"},
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert len(response_json) == 1
+    assert [item["mean"] for item in response_json[0]] == [0, 1, 2]
+    assert response_json[0][0]["entity_id"] == "sensor.power"
+    assert response_json[0][0]["min"] == -1
+    assert response_json[0][0]["max"] == 1
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}", params={"resolution": "hour"},
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert [item[0]["entity_id"] for item in response_json] == [
+        "sensor.energy",
+        "sensor.power",
+    ]
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}", params={"resolution": "5minute"},
+    )
+    assert response.status == 200
+    assert await response.json() == []
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}", params={"resolution": "year"},
+    )
+    assert response.status == 400
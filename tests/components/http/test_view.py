@@ -1,4 +1,5 @@
 """Tests for Home Assistant View."""
+from aiohttp import web
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -9,11 +10,12 @@ import voluptuous as vol
 
 from homeassistant.components.http.view import (
     HomeAssistantView,
+    iter_json_array,
     request_handler_factory,
 )
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
 
-from tests.async_mock import AsyncMock, Mock
+from tests.async_mock import AsyncMock, Mock, patch
 
 
 @pytest.fixture
@@ -55,3 +57,53 @@ async def test_handling_service_not_found(mock_request):
             Mock(requires_auth=False),
             AsyncMock(side_effect=ServiceNotFound("test", "test")),
         )(mock_request)
+
+
+def test_iter_json_array():
+    """Test generating a JSON array in fragments."""
+    assert "".join(iter_json_array([])) == "[]"
+    fragments = iter_json_array(iter([1, {"b": 2, "a": 1}]))
+    assert "".join(fragments) == '[1,{"a": 1, "b": 2}]'
+
+
+async def test_json_stream(hass, aiohttp_client):
+    """Test streaming a JSON response in chunks."""
+    view = HomeAssistantView()
+
+    def generate(count):
+        yield from iter_json_array({"index": index} for index in range(count))
+
+    async def handler(request):
+        return await view.json_stream(request, generate, int(request.query["count"]))
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    with patch("homeassistant.components.http.view.STREAM_CHUNK_SIZE", 32):
+        response = await client.get("/", params={"count": 100})
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    assert await response.json() == [{"index": index} for index in range(100)]
+
+    response = await client.get("/", params={"count": 0})
+    assert response.status == 200
+    assert await response.json() == []
+
+
+async def test_json_stream_invalid_json(hass, aiohttp_client, caplog):
+    """Test streaming invalid JSON fails before the response is sent."""
+    view = HomeAssistantView()
+
+    async def handler(request):
+        return await view.json_stream(request, iter_json_array, [1, float("NaN")])
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    response = await client.get("/")
+    assert response.status == 500
+    assert "Unable to serialize to JSON" in caplog.text
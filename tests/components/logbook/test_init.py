@@ -1335,6 +1335,69 @@ async def test_logbook_view_period_entity(hass, hass_client):
     assert json[0]["entity_id"] == entity_id_test
 
 
+async def test_logbook_view_states_from_recorder(hass, hass_client):
+    """Test the logbook rebuilds the states of state changes it reads."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    entity_id = "switch.test"
+    hass.states.async_set(entity_id, STATE_OFF, {"friendly_name": "Test"})
+    hass.states.async_set(entity_id, STATE_ON, {"friendly_name": "Test"})
+    hass.states.async_set(entity_id, STATE_ON, {"friendly_name": "Renamed"})
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == 200
+    json = await response.json()
+    assert len(json) == 1
+    assert json[0]["entity_id"] == entity_id
+    assert json[0]["name"] == "Test"
+    assert json[0]["message"] == "turned on"
+
+
+async def test_logbook_view_stream(hass, hass_client):
+    """Test the logbook view streams the same entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    for index in range(10):
+        hass.states.async_set(f"switch.test_{index}", STATE_OFF)
+        hass.states.async_set(f"switch.test_{index}", STATE_ON)
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == 200
+    expected = await response.json()
+    assert len(expected) == 10
+
+    with patch("homeassistant.components.http.view.STREAM_CHUNK_SIZE", 100):
+        response = await client.get(f"/api/logbook/{start_date.isoformat()}?stream")
+    assert response.status == 200
+    assert await response.json() == expected
+
+    response = await client.get(
+        f"/api/logbook/{start_date.isoformat()}?stream&entity=switch.test_3"
+    )
+    assert response.status == 200
+    json = await response.json()
+    assert len(json) == 1
+    assert json[0]["entity_id"] == "switch.test_3"
+
+
 async def test_humanify_automation_triggered_event(hass):
     """Test humanifying Automation Trigger event."""
     event1, event2 = list(
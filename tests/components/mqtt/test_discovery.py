@@ -400,6 +400,7 @@ ABBREVIATIONS_WHITE_LIST = [
     "CONF_CLIENT_CERT",
     "CONF_CLIENT_ID",
     "CONF_CLIENT_KEY",
+    "CONF_COALESCE",
     "CONF_DISCOVERY",
     "CONF_DISCOVERY_ID",
     "CONF_DISCOVERY_PREFIX",
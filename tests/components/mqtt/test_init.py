@@ -1,9 +1,11 @@
 """The tests for the MQTT component."""
+import asyncio
 from datetime import datetime, timedelta
 import json
 import ssl
 import unittest
 
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
@@ -18,7 +20,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
 )
 from homeassistant.core import callback
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import device_registry
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
@@ -604,6 +606,26 @@ class TestMQTTCallbacks(unittest.TestCase):
         self.hass.block_till_done()
         assert not self.hass.data["mqtt"]._mqttc.unsubscribe.called
 
+    def test_unsubscribe_keeps_other_subscriptions(self):
+        """Test unsubscribing keeps other subscriptions on the topic."""
+        unsub_1 = mqtt.subscribe(self.hass, "test/state", self.record_calls)
+        unsub_2 = mqtt.subscribe(self.hass, "test/state", self.record_calls)
+        mqtt.subscribe(self.hass, "test/+", self.record_calls)
+
+        unsub_1()
+        fire_mqtt_message(self.hass, "test/state", "test-payload")
+        self.hass.block_till_done()
+        assert len(self.calls) == 2
+
+        unsub_2()
+        fire_mqtt_message(self.hass, "test/state", "test-payload")
+        self.hass.block_till_done()
+        assert len(self.calls) == 3
+        assert self.calls[-1][0].subscribed_topic == "test/+"
+
+        with pytest.raises(HomeAssistantError):
+            unsub_2()
+
     def test_restore_subscriptions_on_reconnect(self):
         """Test subscriptions are restored on reconnect."""
         # Fake that the client is connected
@@ -821,6 +843,66 @@ async def test_setup_fails_without_config(hass):
     assert not await async_setup_component(hass, mqtt.DOMAIN, {})
 
 
+async def test_messages_from_paho_thread_handled_in_batch(hass):
+    """Test messages received together are handled in one loop callback."""
+    await async_mock_mqtt_component(hass)
+    calls = []
+
+    @callback
+    def record_calls(msg):
+        """Record calls."""
+        calls.append(msg)
+
+    await mqtt.async_subscribe(hass, "test/state", record_calls)
+    await mqtt.async_subscribe(hass, "test/+", record_calls)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon:
+        for payload in (b"1", b"2", b"3"):
+            msg = MQTTMessage(topic=b"test/state")
+            msg.payload = payload
+            hass.data["mqtt"]._mqtt_on_message(None, None, msg)
+
+        await hass.async_block_till_done()
+
+    assert mock_call_soon.call_count == 1
+    assert [msg.payload for msg in calls] == ["1", "1", "2", "2", "3", "3"]
+    # Decoded once for all subscriptions
+    assert calls[0].payload is calls[1].payload
+
+
+async def test_coalesce_topic(hass):
+    """Test only the latest message of a coalesced topic in a window is handled."""
+    await async_mock_mqtt_component(
+        hass, {mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_COALESCE: {"power/+": 0.01}}
+    )
+    calls = []
+
+    @callback
+    def record_calls(msg):
+        """Record calls."""
+        calls.append(msg.payload)
+
+    await mqtt.async_subscribe(hass, "power/#", record_calls)
+
+    for payload in ("1", "2", "3"):
+        async_fire_mqtt_message(hass, "power/plug", payload)
+    async_fire_mqtt_message(hass, "power/plug/energy", "4")
+    async_fire_mqtt_message(hass, "power/plug/energy", "5")
+    await hass.async_block_till_done()
+
+    assert calls == ["1", "4", "5"]
+
+    await asyncio.sleep(0.05)
+    assert calls == ["1", "4", "5", "3"]
+
+    # The window ended without messages
+    async_fire_mqtt_message(hass, "power/plug", "6")
+    await hass.async_block_till_done()
+    assert calls == ["1", "4", "5", "3", "6"]
+
+
 @pytest.mark.no_fail_on_log_exception
 async def test_message_callback_exception_gets_logged(hass, caplog):
     """Test exception raised by message handler."""
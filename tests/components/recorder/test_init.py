@@ -7,9 +7,14 @@ import pytest
 
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, States
+from homeassistant.components.recorder.models import (
+    Events,
+    StateAttributes,
+    States,
+    Statistics,
+)
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.core import ATTR_NOW, EVENT_TIME_CHANGED, callback
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -146,6 +151,97 @@ def test_saving_state_incl_entities(hass_recorder):
     assert hass.states.get("test2.recorder") == states[0]
 
 
+def test_saving_state_batch(hass_recorder):
+    """Test a burst of state changes is linked to the right events."""
+    hass = hass_recorder({"commit_interval": 0})
+    entity_ids = [f"test.recorder_{idx}" for idx in range(20)]
+    states = _add_entities(hass, entity_ids)
+    assert len(states) == 20
+
+    with session_scope(hass=hass) as session:
+        events = {
+            event.event_id: event.to_native()
+            for event in session.query(Events).filter_by(
+                event_type=EVENT_STATE_CHANGED
+            )
+        }
+        db_states = list(session.query(States))
+        assert len(db_states) == 20
+        for db_state in db_states:
+            event = events[db_state.event_id]
+            assert event.data["entity_id"] == db_state.entity_id
+
+
+def test_saving_state_shared_attributes(hass_recorder):
+    """Test identical attributes are stored once."""
+    hass = hass_recorder()
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.set("test.recorder", "on", attributes)
+    hass.states.set("test.recorder", "off", attributes)
+    hass.states.set("test.other", "on", attributes)
+    wait_recording_done(hass)
+    hass.states.set("test.recorder", "on", {"test_attr": 6})
+    hass.states.set("test.recorder", "off", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_attributes = list(session.query(StateAttributes))
+        assert len(db_attributes) == 2
+
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 5
+        assert all(db_state.attributes is None for db_state in db_states)
+        assert len({db_state.attributes_id for db_state in db_states}) == 2
+
+        states = [db_state.to_native() for db_state in db_states]
+
+    assert states[0].attributes == attributes
+    assert states[3].attributes == {"test_attr": 6}
+    assert states[4] == hass.states.get("test.recorder")
+
+
+def test_saving_state_failed_commit_forgets_attributes(hass_recorder):
+    """Test the ids of attributes that were rolled back are not reused."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    attributes = {"test_attr": 5}
+
+    with patch.object(
+        instance.event_session, "commit", side_effect=ValueError("Commit failed")
+    ):
+        hass.states.set("test.recorder", "on", attributes)
+        wait_recording_done(hass)
+
+    hass.states.set("test.recorder", "off", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].state_attributes is not None
+        assert db_states[0].to_native().attributes == attributes
+
+
+def test_compile_statistics(hass_recorder):
+    """Test the recorder compiles statistics of numeric states."""
+    hass = hass_recorder()
+    hass.states.set("sensor.power", "10", {"unit_of_measurement": "W"})
+    hass.states.set("sensor.text", "10")
+    wait_recording_done(hass)
+
+    hass.bus.fire(
+        EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow() + timedelta(minutes=5)}
+    )
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        statistics = [row.to_native() for row in session.query(Statistics)]
+
+    assert len(statistics) == 1
+    assert statistics[0]["entity_id"] == "sensor.power"
+    assert statistics[0]["mean"] == 10
+
+
 def test_saving_event_exclude_event_type(hass_recorder):
     """Test saving and restoring an event."""
     hass = hass_recorder({"exclude": {"event_types": "test"}})
@@ -245,7 +341,7 @@ def test_auto_purge(hass_recorder):
     test_time = tz.localize(datetime(2020, 1, 1, 4, 12, 0))
 
     with patch(
-        "homeassistant.components.recorder.purge.purge_old_data"
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
     ) as purge_old_data:
         for delta in (-1, 0, 1):
             hass.bus.fire(
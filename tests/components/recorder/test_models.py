@@ -1,11 +1,18 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import json
 import unittest
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from homeassistant.components.recorder.models import Base, Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Base,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.util import dt
@@ -44,6 +51,36 @@ class TestEvents(unittest.TestCase):
         event = ha.Event("test_event", {"some_data": 15})
         assert event == Events.from_event(event).to_native()
 
+    def test_from_state_changed_event(self):
+        """Test the states of a state_changed event are not stored with it."""
+        old_state = ha.State("sensor.temperature", "18", {"unit": "°C"})
+        new_state = ha.State("sensor.temperature", "19", {"unit": "°C"})
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.temperature",
+                "old_state": old_state,
+                "new_state": new_state,
+            },
+        )
+        db_event = Events.from_event(event)
+        assert json.loads(db_event.event_data) == {"entity_id": "sensor.temperature"}
+
+        # The missing state of a removed entity is kept
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.temperature",
+                "old_state": old_state,
+                "new_state": None,
+            },
+        )
+        db_event = Events.from_event(event)
+        assert json.loads(db_event.event_data) == {
+            "entity_id": "sensor.temperature",
+            "new_state": None,
+        }
+
 
 class TestStates(unittest.TestCase):
     """Test States model."""
@@ -79,6 +116,33 @@ class TestStates(unittest.TestCase):
         assert db_state.last_updated == event.time_fired
 
 
+class TestStateAttributes(unittest.TestCase):
+    """Test StateAttributes model."""
+
+    # pylint: disable=no-self-use
+
+    def test_from_event(self):
+        """Test converting event to db state attributes."""
+        attributes = {"friendly_name": "Temperature", "unit_of_measurement": "°C"}
+        state = ha.State("sensor.temperature", "18", attributes)
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+            context=state.context,
+        )
+        db_attributes = StateAttributes.from_event(event)
+
+        assert db_attributes.to_native() == attributes
+        assert db_attributes.hash == StateAttributes.hash_shared_attrs(
+            db_attributes.shared_attrs
+        )
+
+        db_state = States.from_event(event)
+        db_state.attributes = None
+        db_state.state_attributes = db_attributes
+        assert db_state.to_native() == state
+
+
 class TestRecorderRuns(unittest.TestCase):
     """Test recorder run model."""
 
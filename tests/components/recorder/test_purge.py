@@ -1,13 +1,18 @@
 """Test data purging."""
 from datetime import datetime, timedelta
 import json
+import threading
 import unittest
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, States
+from homeassistant.components.recorder.const import (
+    DATA_INSTANCE,
+    EVENT_RECORDER_PURGE_PROGRESS,
+)
+from homeassistant.components.recorder.models import Events, StateAttributes, States
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import callback
 
 from tests.async_mock import patch
 from tests.common import get_test_home_assistant, init_recorder_component
@@ -107,6 +112,46 @@ class TestRecorderPurge(unittest.TestCase):
             # we should only have 2 states left after purging
             assert states.count() == 2
 
+    def test_purge_old_state_attributes(self):
+        """Test deleting attributes that are no longer referenced."""
+        now = datetime.now()
+        eleven_days_ago = now - timedelta(days=11)
+
+        self.hass.block_till_done()
+        self.hass.data[DATA_INSTANCE].block_till_done()
+
+        with recorder.session_scope(hass=self.hass) as session:
+            for attributes_id, timestamp in ((1000, eleven_days_ago), (1001, now)):
+                shared_attrs = json.dumps({"attributes_id": attributes_id})
+                session.add(
+                    StateAttributes(
+                        attributes_id=attributes_id,
+                        hash=StateAttributes.hash_shared_attrs(shared_attrs),
+                        shared_attrs=shared_attrs,
+                    )
+                )
+                session.add(
+                    States(
+                        entity_id="test.recorder2",
+                        domain="sensor",
+                        state="on",
+                        last_changed=timestamp,
+                        last_updated=timestamp,
+                        created=timestamp,
+                        attributes_id=attributes_id,
+                    )
+                )
+
+        with session_scope(hass=self.hass) as session:
+            state_attributes = session.query(StateAttributes).filter(
+                StateAttributes.attributes_id >= 1000
+            )
+            assert state_attributes.count() == 2
+
+            purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
+
+            assert [row.attributes_id for row in state_attributes] == [1001]
+
     def test_purge_old_events(self):
         """Test deleting old events."""
         self._add_test_events()
@@ -121,6 +166,97 @@ class TestRecorderPurge(unittest.TestCase):
             # we should only have 2 events left
             assert events.count() == 2
 
+    def test_purge_old_data_in_batches(self):
+        """Test purging deletes a bounded batch per call."""
+        self._add_test_states()
+        self._add_test_events()
+
+        with session_scope(hass=self.hass) as session, patch(
+            "homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 1
+        ):
+            states = session.query(States)
+            events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+            instance = self.hass.data[DATA_INSTANCE]
+
+            assert not purge_old_data(instance, 4, repack=False)
+            assert states.count() == 5
+            assert events.count() == 5
+
+            for _ in range(3):
+                assert not purge_old_data(instance, 4, repack=False)
+
+            # Nothing left to purge in this batch
+            assert purge_old_data(instance, 4, repack=False)
+            assert states.count() == 2
+            assert events.count() == 2
+
+    def test_purge_commits_pending_states(self):
+        """Test pending states are committed before a purge batch runs."""
+        instance = self.hass.data[DATA_INSTANCE]
+        purge_started = threading.Event()
+        release_purge = threading.Event()
+        pending_at_purge = []
+
+        def mock_purge(instance, keep_days, repack, progress):
+            """Block the first purge, record pending states of the second."""
+            if not purge_started.is_set():
+                purge_started.set()
+                release_purge.wait(5)
+                return True
+            pending_at_purge.append(
+                bool(instance._pending_states or instance.event_session.new)
+            )
+            return True
+
+        with patch(
+            "homeassistant.components.recorder.purge.purge_old_data",
+            side_effect=mock_purge,
+        ):
+            # The state change and the next purge wait behind the first purge
+            instance.queue.put(recorder.PurgeTask(4, False, None))
+            purge_started.wait(5)
+            self.hass.states.set("test.recorder", "on", {"test_attr": 5})
+            self.hass.block_till_done()
+            instance.queue.put(recorder.PurgeTask(4, False, None))
+            release_purge.set()
+            instance.block_till_done()
+
+        assert pending_at_purge == [False]
+
+        with session_scope(hass=self.hass) as session:
+            state = (
+                session.query(States).filter(States.entity_id == "test.recorder").one()
+            )
+            assert state.attributes_id is not None
+
+    def test_purge_service_reports_progress(self):
+        """Test the purge service runs all batches and reports progress."""
+        self._add_test_states()
+        self._add_test_events()
+        progress = []
+
+        @callback
+        def progress_listener(event):
+            progress.append(event.data)
+
+        self.hass.bus.listen(EVENT_RECORDER_PURGE_PROGRESS, progress_listener)
+
+        with patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 2):
+            self.hass.services.call("recorder", "purge", {"keep_days": 4})
+            self.hass.block_till_done()
+            self.hass.data[DATA_INSTANCE].block_till_done()
+            self.hass.block_till_done()
+
+        with session_scope(hass=self.hass) as session:
+            assert session.query(States).count() == 2
+
+        assert [item["finished"] for item in progress] == [False, False, True]
+        assert progress[-1]["states_deleted"] == 4
+        assert progress[-1]["events_deleted"] == 4
+        assert progress[-1]["batches"] == 3
+        assert progress[-1]["keep_days"] == 4
+        assert progress[-1]["rows_per_second"] >= 0
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
@@ -174,6 +310,6 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 assert (
-                    mock_logger.debug.mock_calls[3][1][0]
+                    mock_logger.debug.mock_calls[5][1][0]
                     == "Vacuuming SQL DB to free space"
                 )
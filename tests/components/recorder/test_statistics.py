@@ -0,0 +1,114 @@
+"""The tests for the recorder statistics."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from homeassistant.components.recorder.models import Base, Statistics
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
+    StatisticsCollector,
+    purge_short_term_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, EVENT_STATE_CHANGED
+import homeassistant.core as ha
+from homeassistant.util import dt as dt_util
+
+ZERO = datetime(2020, 5, 1, 12, 0, 0, tzinfo=dt_util.UTC)
+
+
+@pytest.fixture
+def session():
+    """Return a session of an in-memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine))()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _state_changed(entity_id, state, point_in_time, unit="W"):
+    """Return a state_changed event."""
+    attributes = {ATTR_UNIT_OF_MEASUREMENT: unit} if unit else {}
+    new_state = ha.State(entity_id, state, attributes, point_in_time, point_in_time)
+    return ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+    )
+
+
+def _rows(session, period):
+    """Return the statistics of a period as dicts."""
+    return [
+        row.to_native()
+        for row in statistics_during_period(session, ZERO, period=period)
+    ]
+
+
+def test_compile_5minute_statistics(session):
+    """Test compiling time weighted 5 minute statistics."""
+    collector = StatisticsCollector()
+    assert not collector.period_ended(ZERO)
+
+    collector.add_state_change(_state_changed("sensor.power", "10", ZERO))
+    collector.add_state_change(
+        _state_changed("sensor.power", "40", ZERO + timedelta(minutes=4))
+    )
+    # No unit of measurement
+    collector.add_state_change(_state_changed("sensor.text", "5", ZERO, unit=None))
+    # Not numeric
+    collector.add_state_change(_state_changed("sensor.gone", "5", ZERO))
+    collector.add_state_change(_state_changed("sensor.gone", "unavailable", ZERO))
+
+    now = ZERO + timedelta(minutes=5)
+    assert not collector.period_ended(now - timedelta(seconds=1))
+    assert collector.period_ended(now)
+    collector.compile(session, now)
+    session.commit()
+
+    assert _rows(session, PERIOD_5MINUTE) == [
+        {"entity_id": "sensor.power", "start": ZERO, "mean": 16, "min": 10, "max": 40}
+    ]
+
+    # The last value is carried into the next period
+    now += timedelta(minutes=5)
+    assert collector.period_ended(now)
+    collector.compile(session, now)
+    session.commit()
+
+    assert _rows(session, PERIOD_5MINUTE)[-1] == {
+        "entity_id": "sensor.power",
+        "start": ZERO + timedelta(minutes=5),
+        "mean": 40,
+        "min": 40,
+        "max": 40,
+    }
+
+
+def test_compile_hourly_statistics(session):
+    """Test rolling up 5 minute statistics to hourly statistics."""
+    collector = StatisticsCollector()
+    collector.period_ended(ZERO)
+
+    now = ZERO
+    for value in range(12):
+        collector.add_state_change(_state_changed("sensor.power", str(value), now))
+        now += timedelta(minutes=5)
+        assert collector.period_ended(now)
+        collector.compile(session, now)
+
+    session.commit()
+
+    assert len(_rows(session, PERIOD_5MINUTE)) == 12
+    assert _rows(session, PERIOD_HOUR) == [
+        {"entity_id": "sensor.power", "start": ZERO, "mean": 5.5, "min": 0, "max": 11}
+    ]
+
+    assert purge_short_term_statistics(session, ZERO + timedelta(minutes=30)) == 6
+    assert len(_rows(session, PERIOD_5MINUTE)) == 6
+    assert len(_rows(session, PERIOD_HOUR)) == 1
+    assert session.query(Statistics).count() == 7
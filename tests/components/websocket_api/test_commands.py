@@ -1,4 +1,7 @@
 """Tests for WebSocket API commands."""
+from datetime import timedelta
+import logging
+
 from async_timeout import timeout
 
 from homeassistant.components.websocket_api import const
@@ -10,10 +13,12 @@ from homeassistant.components.websocket_api.auth import (
 from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
-from tests.common import async_mock_service
+from tests.common import MockEntity, async_fire_time_changed, async_mock_service
 
 
 async def test_call_service(hass, websocket_client):
@@ -200,7 +205,7 @@ async def test_get_states(hass, websocket_client):
 
     states = []
     for state in hass.states.async_all():
-        state = state.as_dict()
+        state = dict(state.as_dict())
         state["last_changed"] = state["last_changed"].isoformat()
         state["last_updated"] = state["last_updated"].isoformat()
         states.append(state)
@@ -388,6 +393,116 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe entities sends the states and then the changes."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {"light.permitted": True, "light.removed": True}
+            }
+        }
+    )
+    hass.states.async_set("light.permitted", "off", {"color": "red", "size": 1})
+    hass.states.async_set("light.not_permitted", "off")
+    hass.states.async_set("light.removed", "off")
+    state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.not_permitted", "light.removed"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red", "size": 1},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+            },
+            "light.removed": {
+                "s": "off",
+                "a": {},
+                "c": hass.states.get("light.removed").context.id,
+                "lc": hass.states.get("light.removed").last_changed.timestamp(),
+            },
+        }
+    }
+
+    # Changes of an entity within the delay are sent as one change
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "red", "size": 1})
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_remove("light.removed")
+    state = hass.states.get("light.permitted")
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"color": "blue"},
+                    "c": state.context.id,
+                    "lc": state.last_changed.timestamp(),
+                },
+                "-": {"a": ["size"]},
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.removed", "on")
+    state = hass.states.get("light.removed")
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert msg["event"] == {
+        "a": {
+            "light.removed": {
+                "s": "on",
+                "a": {},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    hass.states.async_set("light.permitted", "off")
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 9
+    assert msg["type"] == "pong"
+
+
 async def test_render_template_renders_template(
     hass, websocket_client, hass_admin_user
 ):
@@ -511,3 +626,66 @@ async def test_manifest_get(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert not msg["success"]
     assert msg["error"]["code"] == "not_found"
+
+
+async def test_setup_timeline(hass, websocket_client, hass_admin_user):
+    """Test getting the setup timeline of the integrations."""
+    await websocket_client.send_json({"id": 5, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    timeline = {item["domain"]: item for item in msg["result"]}
+    assert "websocket_api" in timeline
+    assert "setup" in [
+        phase["phase"] for phase in timeline["websocket_api"]["phases"]
+    ]
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "integration/setup_timeline", "format": "chrome_trace"}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert {event["name"] for event in msg["result"]["traceEvents"]} >= {
+        "thread_name",
+        "websocket_api",
+        "setup",
+    }
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_poll_stats(hass, hass_ws_client, hass_admin_user):
+    """Test getting the poll statistics of the entity platforms."""
+    component = EntityComponent(
+        logging.getLogger(__name__), "test_domain", hass, timedelta(seconds=20)
+    )
+    await component.async_add_entities([MockEntity(should_poll=True)])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json({"id": 5, "type": "entity/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    stats = msg["result"]["test_domain"]
+    assert len(stats) == 1
+    assert stats[0]["domain"] == "test_domain"
+    assert stats[0]["polls"] == 1
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 6, "type": "entity/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
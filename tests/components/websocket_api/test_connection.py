@@ -1,6 +1,7 @@
 """Test WebSocket Connection class."""
 from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api import const
+from homeassistant.core import callback
 
 
 async def test_send_big_result(hass, websocket_client):
@@ -20,3 +21,50 @@ async def test_send_big_result(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == {"big": "result"}
+
+
+async def test_send_big_message_keeps_order(hass, websocket_client):
+    """Test a message encoded in the executor is sent in order."""
+
+    @websocket_api.websocket_command({"type": "big_message"})
+    @callback
+    def send_big_message(hass, connection, msg):
+        connection.send_big_message(
+            websocket_api.result_message(msg["id"], {"big": "result"})
+        )
+        connection.send_message(websocket_api.event_message(msg["id"], "after"))
+
+    hass.components.websocket_api.async_register_command(send_big_message)
+
+    await websocket_client.send_json({"id": 5, "type": "big_message"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["result"] == {"big": "result"}
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert msg["event"] == "after"
+
+
+async def test_send_big_message_invalid_json(hass, websocket_client, caplog):
+    """Test a message that can't be encoded is reported."""
+
+    @websocket_api.websocket_command({"type": "big_message"})
+    @callback
+    def send_big_message(hass, connection, msg):
+        connection.send_big_message(
+            websocket_api.result_message(msg["id"], {"bad": object()})
+        )
+
+    hass.components.websocket_api.async_register_command(send_big_message)
+
+    await websocket_client.send_json({"id": 5, "type": "big_message"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert "Bad data found at $.result.bad" in caplog.text
@@ -50,6 +50,8 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
         websocket_client = await hass_ws_client()
 
     # Kill writer task and fill queue past peak
+    instance._to_write.put_nowait(None)
+    await instance._writer_task
     for _ in range(5):
         instance._to_write.put_nowait(None)
 
@@ -66,6 +68,85 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_pending_msg_peak_reading_client(
+    hass, mock_low_peak, hass_ws_client, caplog
+):
+    """Test a client that is behind but still reading is not disconnected."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    # Kill writer task and fill queue past peak
+    instance._to_write.put_nowait(None)
+    await instance._writer_task
+    for _ in range(5):
+        instance._to_write.put_nowait({})
+
+    # Trigger the peak check
+    instance._send_message({})
+
+    # The client reads a message
+    await instance._to_write.get()
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=const.PENDING_MSG_PEAK_TIME + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert "Client unable to keep up with pending messages" not in caplog.text
+    assert not websocket_client.closed
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=const.PENDING_MSG_PEAK_TIME * 2 + 2)
+    )
+
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.close
+
+    assert "Client unable to keep up with pending messages" in caplog.text
+
+
+async def test_coalesce_state_changed_events(hass, websocket_client):
+    """Test pending state changes of an entity are sent as the latest one."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "state_changed"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # The states change before the writer gets to send them
+    for value in range(10):
+        hass.states.async_set("light.kitchen", value)
+    hass.states.async_set("light.bedroom", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["entity_id"] == "light.kitchen"
+    assert msg["event"]["data"]["new_state"]["state"] == "9"
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["entity_id"] == "light.bedroom"
+
+    await websocket_client.send_json({"id": 6, "type": "websocket/connection_lag"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    assert msg["result"][0]["coalesced"] == 9
+    # Auth required, auth ok, the result and two events
+    assert msg["result"][0]["sent"] == 5
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialze non JSON objects."""
     bad_data = object()
@@ -0,0 +1,98 @@
+"""Test Websocket API messages module."""
+from datetime import timedelta
+import json
+
+from homeassistant.components.websocket_api import const, messages
+from homeassistant import core
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, State
+import homeassistant.util.dt as dt_util
+
+from tests.async_mock import patch
+
+
+def test_cached_event_message():
+    """Test an event message is encoded once for all subscriptions."""
+    state = State("light.kitchen", "on", {"brightness": 100})
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.kitchen", "old_state": None, "new_state": state},
+    )
+
+    with patch(
+        "homeassistant.core._json_encode", wraps=core._json_encode
+    ) as mock_encode:
+        message_1 = messages.cached_event_message(1, event)
+        message_2 = messages.cached_event_message(2, event)
+
+    assert mock_encode.call_count == 1
+    assert json.loads(message_1) == json.loads(
+        const.JSON_DUMP(messages.event_message(1, event))
+    )
+    assert json.loads(message_2)["id"] == 2
+    assert json.loads(message_2)["event"] == json.loads(message_1)["event"]
+
+    # An equal event is another event
+    other_event = Event(EVENT_STATE_CHANGED, event.data, time_fired=event.time_fired)
+    with patch(
+        "homeassistant.core._json_encode", wraps=core._json_encode
+    ) as mock_encode:
+        messages.cached_event_message(3, other_event)
+
+    assert mock_encode.call_count == 1
+
+
+def test_cached_event_message_invalid_json():
+    """Test an event that can't be encoded is returned as a message."""
+    event = Event("test_event", {"value": float("nan")})
+
+    assert messages.cached_event_message(5, event) == messages.event_message(5, event)
+
+
+def test_compressed_state_diff():
+    """Test only the changed fields of a state are in the diff."""
+    now = dt_util.utcnow()
+    attributes = {"brightness": 100, "color": "red"}
+    state = State("light.kitchen", "on", attributes, now, now)
+
+    assert messages.compressed_state_diff(state, state) is None
+
+    # Only updated
+    later = now + timedelta(seconds=1)
+    new_state = State(
+        "light.kitchen", "on", attributes, now, later, context=state.context
+    )
+    assert messages.compressed_state_diff(state, new_state) == {
+        "+": {"lu": later.timestamp()}
+    }
+
+    new_state = State(
+        "light.kitchen",
+        "off",
+        {"brightness": 100, "effect": "none"},
+        later,
+        later,
+        Context(user_id="abcd"),
+    )
+    assert messages.compressed_state_diff(state, new_state) == {
+        "+": {
+            "s": "off",
+            "lc": later.timestamp(),
+            "c": {"id": new_state.context.id, "parent_id": None, "user_id": "abcd"},
+            "a": {"effect": "none"},
+        },
+        "-": {"a": ["color"]},
+    }
+
+
+def test_states_result_message_json():
+    """Test a result of states is encoded with the JSON of the states."""
+    states = [
+        State("light.kitchen", "on", {"brightness": 100}),
+        State("light.bedroom", "off"),
+    ]
+    message = messages.result_message(5, states)
+
+    assert json.loads(messages.states_result_message_json(message)) == json.loads(
+        const.JSON_DUMP(message)
+    )
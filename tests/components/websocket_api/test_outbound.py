@@ -0,0 +1,54 @@
+"""Test the outbound queue of websocket connections."""
+import asyncio
+
+from homeassistant.components.websocket_api.outbound import OutboundQueue
+
+
+async def test_coalesce_pending_messages():
+    """Test a message replaces the pending message with the same key."""
+    queue = OutboundQueue()
+    queue.put_nowait("state 1", ("sub", "light.kitchen"))
+    queue.put_nowait("result")
+    queue.put_nowait("state 2", ("sub", "light.kitchen"))
+    queue.put_nowait("state 3", ("sub", "light.bedroom"))
+
+    assert queue.qsize() == 3
+    assert queue.coalesced == 1
+    assert await queue.get() == "result"
+    assert await queue.get() == "state 2"
+
+    # The key is not pending anymore
+    queue.put_nowait("state 4", ("sub", "light.kitchen"))
+    assert await queue.get() == "state 3"
+    assert await queue.get() == "state 4"
+    assert queue.qsize() == 0
+    assert queue.as_dict() == {
+        "pending": 0,
+        "peak": 3,
+        "sent": 4,
+        "coalesced": 1,
+        "lag": queue.as_dict()["lag"],
+        "oldest_pending_age": 0.0,
+    }
+
+
+async def test_drop_superseded_messages():
+    """Test superseded messages are dropped while the client is behind."""
+    queue = OutboundQueue()
+    for value in range(100):
+        queue.put_nowait(value, "key")
+
+    assert queue.qsize() == 1
+    assert len(queue._entries) <= 2
+    assert await queue.get() == 99
+
+
+async def test_wait_for_message():
+    """Test get waits until a message is added."""
+    queue = OutboundQueue()
+    task = asyncio.ensure_future(queue.get())
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    queue.put_nowait("message")
+    assert await task == "message"
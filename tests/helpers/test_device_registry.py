@@ -243,6 +243,50 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_lookups_follow_updates(registry):
+    """Test lookups by identifier, connection, area and config entry."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="456", identifiers={("bridgeid", "4567")}
+    )
+
+    entry = registry.async_update_device(
+        entry.id, area_id="kitchen", new_identifiers={("bridgeid", "8901")}
+    )
+    assert registry.async_get_device({("bridgeid", "0123")}, set()) is None
+    assert registry.async_get_device({("bridgeid", "8901")}, set()) == entry
+    assert (
+        registry.async_get_device(
+            set(),
+            {(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")},
+        )
+        == entry
+    )
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [entry]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        entry2
+    ]
+
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123", identifiers={("bridgeid", "4567")}
+    )
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry,
+        entry2,
+    ]
+
+    registry.async_clear_config_entry("123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == []
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+    assert registry.async_get_device({("bridgeid", "8901")}, set()) is None
+    entry2 = registry.async_get_device({("bridgeid", "4567")}, set())
+    assert entry2.config_entries == {"456"}
+
+
 async def test_specifying_via_device_create(registry):
     """Test specifying a via_device and updating."""
     via = registry.async_get_or_create(
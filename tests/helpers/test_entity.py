@@ -7,7 +7,13 @@ import threading
 import pytest
 
 from homeassistant.config import DATA_CUSTOMIZE
-from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_HIDDEN, STATE_UNAVAILABLE
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_HIDDEN,
+    ATTR_ICON,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
 from homeassistant.helpers.entity_values import EntityValues
@@ -707,3 +713,89 @@ async def test_warn_slow_write_state_custom_component(hass, caplog):
         "(<class 'custom_components.bla.sensor.test_warn_slow_write_state_custom_component.<locals>.CustomComponentEntity'>) "
         "took 10.000 seconds. Please report it to the custom component author."
     ) in caplog.text
+
+
+async def test_static_attributes_shared_between_states(hass):
+    """Test the attributes are shared if only the state changed."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    with patch.object(entity.Entity, "state", PropertyMock(return_value="on")):
+        ent.async_write_ha_state()
+    old_state = hass.states.get("hello.world")
+
+    with patch.object(entity.Entity, "state", PropertyMock(return_value="off")):
+        ent.async_write_ha_state()
+    new_state = hass.states.get("hello.world")
+
+    assert new_state.state == "off"
+    assert new_state.attributes is old_state.attributes
+
+
+async def test_static_attributes_follow_changes(hass):
+    """Test the cached attributes follow the registry, customize and properties."""
+    entry = entity_registry.RegistryEntry(
+        entity_id="hello.world", unique_id="test-unique-id", platform="test-platform"
+    )
+    registry = mock_registry(hass, {"hello.world": entry})
+
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.registry_entry = entry
+    await ent.async_internal_added_to_hass()
+    ent.async_write_ha_state()
+    assert ATTR_FRIENDLY_NAME not in hass.states.get("hello.world").attributes
+
+    registry.async_update_entity("hello.world", name="Registry name")
+    await hass.async_block_till_done()
+    assert (
+        hass.states.get("hello.world").attributes[ATTR_FRIENDLY_NAME]
+        == "Registry name"
+    )
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues(
+        {"hello.world": {ATTR_FRIENDLY_NAME: "Customized name"}}
+    )
+    ent.async_write_ha_state()
+    assert (
+        hass.states.get("hello.world").attributes[ATTR_FRIENDLY_NAME]
+        == "Customized name"
+    )
+
+    del hass.data[DATA_CUSTOMIZE]
+    with patch.object(entity.Entity, "icon", PropertyMock(return_value="mdi:test")):
+        ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Registry name"
+    assert state.attributes[ATTR_ICON] == "mdi:test"
+
+
+async def test_static_attributes_follow_overridden_properties(hass):
+    """Test the cached attributes follow the properties an entity overrides."""
+
+    class NamedEntity(entity.Entity):
+        """Entity with a name that changes."""
+
+        entity_name = "First"
+
+        @property
+        def name(self):
+            """Return the name of the entity."""
+            return self.entity_name
+
+    ent = NamedEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    ent.async_write_ha_state()
+    attributes = hass.states.get("hello.world").attributes
+    assert attributes[ATTR_FRIENDLY_NAME] == "First"
+
+    ent.async_write_ha_state()
+    assert ent._async_static_attributes() is attributes
+
+    ent.entity_name = "Second"
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_FRIENDLY_NAME] == "Second"
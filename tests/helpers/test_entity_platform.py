@@ -2,6 +2,8 @@
 import asyncio
 from datetime import timedelta
 import logging
+import threading
+import time
 
 import pytest
 
@@ -16,7 +18,7 @@ from homeassistant.helpers.entity_component import (
 )
 import homeassistant.util.dt as dt_util
 
-from tests.async_mock import Mock, patch
+from tests.async_mock import AsyncMock, Mock, patch
 from tests.common import (
     MockConfigEntry,
     MockEntity,
@@ -53,6 +55,28 @@ async def test_polling_only_updates_entities_it_should_poll(hass):
     assert poll_ent.async_update.called
 
 
+async def test_polling_entity_that_starts_polling_later(hass):
+    """Test an entity that did not poll when added is polled once it does."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+
+    ent = MockEntity(should_poll=False)
+    ent.async_update = Mock()
+
+    await platform.async_add_entities([ent])
+
+    assert ent.entity_id not in platform._poll_jobs
+
+    ent._values["should_poll"] = True
+    ent.async_write_ha_state()
+
+    assert ent.entity_id in platform._poll_jobs
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+
+    assert ent.async_update.called
+
+
 async def test_polling_updates_entities_with_exception(hass):
     """Test the updated entities that not break with an exception."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -90,6 +114,144 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_retries_slow_entity(hass, caplog):
+    """Test a slow entity is polled again without holding up the others."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    release = asyncio.Event()
+    slow_updates = 0
+
+    async def slow_update():
+        """Mock an update that takes longer than the scan interval."""
+        nonlocal slow_updates
+        slow_updates += 1
+        await release.wait()
+
+    slow_ent = MockEntity(should_poll=True)
+    slow_ent.async_update = slow_update
+    fast_ent = MockEntity(should_poll=True)
+    fast_ent.async_update = AsyncMock()
+
+    await component.async_add_entities([slow_ent, fast_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert slow_updates == 1
+    assert fast_ent.async_update.call_count == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert slow_updates == 1
+    assert fast_ent.async_update.call_count == 2
+    assert "took longer than the scheduled update interval" in caplog.text
+
+    release.set()
+    await hass.async_block_till_done()
+
+    assert slow_updates == 2
+    stats = entity_platform.async_get_poll_stats(hass)[DOMAIN][0]
+    assert stats["polls"] == 4
+    assert stats["retries"] == 1
+
+
+async def test_polling_executor_budget(hass):
+    """Test entities updating in the executor share a budget across platforms."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def update():
+        """Mock an update that blocks for a while."""
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    with patch.object(entity_platform, "EXECUTOR_POLL_BUDGET", 2):
+        for index in range(2):
+            platform = MockEntityPlatform(
+                hass,
+                platform_name=f"platform_{index}",
+                scan_interval=timedelta(seconds=20),
+            )
+            entities = [MockEntity(should_poll=True) for _ in range(4)]
+            for entity in entities:
+                entity.update = update
+            await platform.async_add_entities(entities)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert max_running == 2
+    stats = entity_platform.async_get_poll_stats(hass)
+    assert stats["platform_0"][0]["polls"] == 4
+    assert stats["platform_1"][0]["polls"] == 4
+
+
+async def test_polling_executor_budget_sequential_platform(hass):
+    """Test a platform updating one entity at a time leaves budget to others."""
+    started = threading.Event()
+    release = threading.Event()
+    fast_updates = 0
+
+    def slow_update():
+        """Mock an update that blocks until released."""
+        started.set()
+        release.wait(5)
+
+    def fast_update():
+        """Mock an update that is done right away."""
+        nonlocal fast_updates
+        fast_updates += 1
+
+    with patch.object(entity_platform, "EXECUTOR_POLL_BUDGET", 2):
+        slow_platform = MockEntityPlatform(
+            hass,
+            platform_name="slow",
+            platform=Mock(PARALLEL_UPDATES=1),
+            scan_interval=timedelta(seconds=20),
+        )
+        slow_entities = [MockEntity(should_poll=True) for _ in range(4)]
+        for entity in slow_entities:
+            entity.update = slow_update
+        await slow_platform.async_add_entities(slow_entities)
+
+    try:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_add_executor_job(started.wait, 5)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        fast_platform = MockEntityPlatform(
+            hass, platform_name="fast", scan_interval=timedelta(seconds=20)
+        )
+        fast_entities = [MockEntity(should_poll=True) for _ in range(2)]
+        for entity in fast_entities:
+            entity.update = fast_update
+        await fast_platform.async_add_entities(fast_entities)
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        for _ in range(100):
+            if fast_updates == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert fast_updates == 2
+    finally:
+        release.set()
+
+    await hass.async_block_till_done()
+
+    stats = entity_platform.async_get_poll_stats(hass)
+    assert stats["fast"][0]["polls"] == 2
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -135,7 +297,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_point_in_utc_time")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -154,7 +316,13 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    first_poll = mock_track.call_args[0][2] - dt_util.utcnow()
+    assert timedelta(0) < first_poll <= timedelta(seconds=30)
+
+    mock_track.call_args[0][1](dt_util.utcnow())
+    await hass.async_block_till_done()
+    next_poll = mock_track.call_args[0][2] - dt_util.utcnow()
+    assert timedelta(seconds=29) < next_poll <= timedelta(seconds=30)
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -883,3 +1051,29 @@ async def test_platforms_sharing_services(hass):
     assert len(entities) == 2
     assert entity1 in entities
     assert entity2 in entities
+
+
+async def test_domain_entities_follow_platforms(hass):
+    """Test entities of all platforms of a domain are kept by entity_id."""
+    entity_platform1 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = MockEntity(entity_id="mock_integration.entity_1")
+    await entity_platform1.async_add_entities([entity1])
+
+    entity_platform2 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="other_platform", platform=None
+    )
+    entity2 = MockEntity(entity_id="mock_integration.entity_2")
+    await entity_platform2.async_add_entities([entity2])
+
+    assert entity_platform1.domain_entities is entity_platform2.domain_entities
+    assert entity_platform1.domain_entities == {
+        "mock_integration.entity_1": entity1,
+        "mock_integration.entity_2": entity2,
+    }
+
+    await entity_platform1.async_reset()
+
+    assert entity_platform2.domain_entities == {"mock_integration.entity_2": entity2}
+    assert entity_platform2.entities == {"mock_integration.entity_2": entity2}
@@ -285,6 +285,46 @@ def test_async_get_entity_id(registry):
     assert registry.async_get_entity_id("light", "hue", "123") is None
 
 
+async def test_lookups_follow_updates(registry):
+    """Test lookups by unique id, device and config entry follow updates."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config, device_id="device-1"
+    )
+    registry.async_get_or_create("light", "hue", "5678", device_id="device-1")
+
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [
+        entry,
+        registry.async_get("light.hue_5678"),
+    ]
+    assert entity_registry.async_entries_for_config_entry(
+        registry, "mock-id-1"
+    ) == [entry]
+
+    registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", new_unique_id="abcd"
+    )
+    assert registry.async_get_entity_id("light", "hue", "1234") is None
+    assert registry.async_get_entity_id("light", "hue", "abcd") == "light.renamed"
+    assert [
+        entry.entity_id
+        for entry in entity_registry.async_entries_for_config_entry(
+            registry, "mock-id-1"
+        )
+    ] == ["light.renamed"]
+
+    registry.async_get_or_create("light", "hue", "abcd", device_id="device-2")
+    assert [
+        entry.entity_id
+        for entry in entity_registry.async_entries_for_device(registry, "device-1")
+    ] == ["light.hue_5678"]
+
+    registry.async_clear_config_entry("mock-id-1")
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == []
+    assert entity_registry.async_entries_for_device(registry, "device-2") == []
+    assert registry.async_get_entity_id("light", "hue", "abcd") is None
+
+
 async def test_updating_config_entry_id(hass, registry, update_events):
     """Test that we update config entry id in registry."""
     mock_config_1 = MockConfigEntry(domain="light", entry_id="mock-id-1")
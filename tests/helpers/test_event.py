@@ -1,5 +1,6 @@
 """Test event helpers."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import datetime, timedelta
 
 from astral import Astral
@@ -10,11 +11,13 @@ from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.helpers.event import (
+    TRACK_TIME_SCHEDULER,
     async_call_later,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
     async_track_state_change,
+    async_track_state_change_event,
     async_track_sunrise,
     async_track_sunset,
     async_track_template,
@@ -163,6 +166,100 @@ async def test_track_state_change(hass):
     assert len(wildercard_runs) == 6
 
 
+async def test_track_state_change_event(hass):
+    """Test async_track_state_change_event."""
+    single_entity_id_tracker = []
+    multiple_entity_id_tracker = []
+
+    @ha.callback
+    def single_run_callback(event):
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+
+        single_entity_id_tracker.append((old_state, new_state))
+
+    @ha.callback
+    def multiple_run_callback(event):
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+
+        multiple_entity_id_tracker.append((old_state, new_state))
+
+    @ha.callback
+    def callback_that_throws(event):
+        raise ValueError
+
+    unsub_single = async_track_state_change_event(
+        hass, ["light.Bowl"], single_run_callback
+    )
+    unsub_multi = async_track_state_change_event(
+        hass, ["light.Bowl", "switch.kitchen"], multiple_run_callback
+    )
+    unsub_throws = async_track_state_change_event(
+        hass, ["light.Bowl", "switch.kitchen"], callback_that_throws
+    )
+
+    # Adding state to state machine
+    hass.states.async_set("light.Bowl", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 1
+    assert single_entity_id_tracker[-1][0] is None
+    assert single_entity_id_tracker[-1][1] is not None
+    assert len(multiple_entity_id_tracker) == 1
+    assert multiple_entity_id_tracker[-1][0] is None
+    assert multiple_entity_id_tracker[-1][1] is not None
+
+    # Set same state should not trigger a state change/listener
+    hass.states.async_set("light.Bowl", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 1
+    assert len(multiple_entity_id_tracker) == 1
+
+    # State change off -> on
+    hass.states.async_set("light.Bowl", "off")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 2
+    assert len(multiple_entity_id_tracker) == 2
+
+    # Untracked entities do not wake any listener
+    hass.states.async_set("light.other", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 2
+    assert len(multiple_entity_id_tracker) == 2
+
+    # Only the listener that tracks the entity is called
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 2
+    assert len(multiple_entity_id_tracker) == 3
+
+    # Entity removed
+    hass.states.async_remove("light.bowl")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 3
+    assert single_entity_id_tracker[-1][1] is None
+    assert len(multiple_entity_id_tracker) == 4
+
+    unsub_single()
+    hass.states.async_set("light.Bowl", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 3
+    assert len(multiple_entity_id_tracker) == 5
+
+    # The shared bus listener is removed with the last tracker
+    assert hass.bus.async_listeners().get(ha.EVENT_STATE_CHANGED) == 1
+    unsub_multi()
+    unsub_throws()
+    assert ha.EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+
+
+async def test_track_state_change_event_empty_entity_ids(hass):
+    """Test async_track_state_change_event without entity ids."""
+    unsub = async_track_state_change_event(hass, [], ha.callback(lambda event: None))
+    assert ha.EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+    unsub()
+
+
 async def test_track_template(hass):
     """Test tracking template."""
     specific_runs = []
@@ -230,6 +327,105 @@ async def test_track_template(hass):
     assert len(wildercard_runs) == 2
 
 
+async def test_track_template_refreshes_dependencies(hass):
+    """Test the entities a template depends on are refreshed on every render."""
+    runs = []
+    template = Template(
+        "{% if is_state('switch.a', 'on') %}{{ is_state('switch.b', 'on') }}"
+        "{% else %}false{% endif %}",
+        hass,
+    )
+    hass.states.async_set("switch.a", "off")
+    hass.states.async_set("switch.b", "off")
+
+    @ha.callback
+    def run_callback(entity_id, old_state, new_state):
+        runs.append(entity_id)
+
+    unsub = async_track_template(hass, template, run_callback)
+
+    with patch.object(
+        template, "async_render_to_info", wraps=template.async_render_to_info
+    ) as mock_render:
+        hass.states.async_set("switch.b", "on")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 0
+
+        hass.states.async_set("switch.a", "on")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+        assert runs == ["switch.a"]
+
+        hass.states.async_set("switch.b", "off")
+        await hass.async_block_till_done()
+        hass.states.async_set("switch.b", "on")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+        assert runs == ["switch.a", "switch.b"]
+
+    unsub()
+    assert ha.EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+
+
+async def test_track_template_domain(hass):
+    """Test a template iterating a domain ignores other domains."""
+    runs = []
+    template = Template("{{ states.sensor | count > 1 }}", hass)
+    hass.states.async_set("sensor.one", "1")
+
+    @ha.callback
+    def run_callback(entity_id, old_state, new_state):
+        runs.append(entity_id)
+
+    unsub = async_track_template(hass, template, run_callback)
+
+    with patch.object(
+        template, "async_render_to_info", wraps=template.async_render_to_info
+    ) as mock_render:
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_set("sensor.one", "2")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 0
+
+        hass.states.async_set("sensor.two", "1")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+        assert runs == ["sensor.two"]
+
+    unsub()
+    assert ha.EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+
+
+async def test_track_template_without_states(hass):
+    """Test a template that reads no states is rendered on every change."""
+    runs = []
+    template = Template("{{ now().year < 2000 }}", hass)
+    error_template = Template("{{ states.Invalid }}", hass)
+
+    @ha.callback
+    def run_callback(entity_id, old_state, new_state):
+        runs.append(entity_id)
+
+    async_track_template(hass, Template("true", hass), run_callback)
+    async_track_template(hass, template, run_callback)
+    async_track_template(hass, error_template, run_callback)
+
+    with patch.object(
+        template, "async_render_to_info", wraps=template.async_render_to_info
+    ) as mock_render, patch.object(
+        error_template,
+        "async_render_to_info",
+        wraps=error_template.async_render_to_info,
+    ) as mock_error_render:
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+        assert mock_error_render.call_count == 1
+
+    assert runs == []
+
+
 async def test_track_same_state_simple_trigger(hass):
     """Test track_same_change with trigger simple."""
     thread_runs = []
@@ -837,3 +1033,88 @@ async def test_async_call_later(hass):
     assert p_action is action
     assert p_point == now + timedelta(seconds=3)
     assert remove is mock()
+
+
+async def test_time_trackers_share_one_listener(hass):
+    """Test time trackers do not add a time_changed listener each."""
+    runs = []
+    point = datetime(2017, 12, 19, 15, 40, 0, tzinfo=dt_util.UTC)
+
+    @callback
+    def action(now):
+        runs.append(now)
+
+    for _ in range(10):
+        async_track_point_in_utc_time(hass, action, point)
+        async_track_utc_time_change(hass, action, second=30)
+
+    assert hass.bus.async_listeners()[ha.EVENT_TIME_CHANGED] == 1
+
+    _send_time_changed(hass, point + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert len(runs) == 20
+
+
+async def test_time_scheduler_loop_timer(hass):
+    """Test the loop timer runs due jobs while the timer of hass runs."""
+    runs = []
+
+    @callback
+    def action(now):
+        runs.append(now)
+
+    async_call_later(hass, 0.01, action)
+    await asyncio.sleep(0.05)
+    # Without the timer only time_changed events run jobs
+    assert len(runs) == 0
+
+    # The job that is overdue runs once the timer runs
+    hass.timer_running = True
+    async_call_later(hass, 0.01, action)
+    async_call_later(hass, 0.01, action)()
+    await asyncio.sleep(0.05)
+    assert len(runs) == 2
+    assert runs[0] < runs[1]
+
+    # The armed timer is cancelled when the timer of hass stops
+    async_call_later(hass, 0.01, action)
+    hass.timer_running = False
+    hass.bus.async_fire(ha.EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    await asyncio.sleep(0.05)
+    assert len(runs) == 2
+
+
+async def test_time_pattern_loop_timer_fires_once_per_second(hass):
+    """Test a pattern run by the loop timer does not run again in the second."""
+    runs = []
+
+    @callback
+    def action(now):
+        runs.append(now)
+
+    hass.timer_running = True
+    unsub = async_track_utc_time_change(hass, action, second="*")
+
+    # The time_changed events of the timer of hass arrive in between
+    for _ in range(15):
+        await asyncio.sleep(0.1)
+        _send_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+
+    unsub()
+    hass.timer_running = False
+
+    assert runs
+    seconds = [run.replace(microsecond=0) for run in runs]
+    assert len(seconds) == len(set(seconds))
+
+
+async def test_time_scheduler_compacts_cancelled_jobs(hass):
+    """Test cancelled jobs do not pile up in the scheduler."""
+    for _ in range(1000):
+        async_call_later(hass, 3600, callback(lambda now: None))()
+
+    scheduler = hass.data[TRACK_TIME_SCHEDULER]
+    assert len(scheduler._by_when) <= 101
+    assert len(scheduler._by_deadline) <= 101
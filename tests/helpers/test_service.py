@@ -382,6 +382,26 @@ async def test_call_with_one_of_required_features(hass, mock_entities):
     assert all(entity in actual for entity in expected)
 
 
+async def test_call_with_domain_entities(hass, mock_entities):
+    """Test entities are resolved against a dictionary of domain entities."""
+    test_service_mock = AsyncMock(return_value=None)
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.bedroom", "light.missing"]},
+        ),
+    )
+
+    assert test_service_mock.call_count == 2
+    actual = [call[0][0] for call in test_service_mock.call_args_list]
+    assert mock_entities["light.kitchen"] in actual
+    assert mock_entities["light.bedroom"] in actual
+
+
 async def test_call_with_sync_func(hass, mock_entities):
     """Test invoking sync service calls."""
     test_service_mock = Mock(return_value=None)
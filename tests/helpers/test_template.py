@@ -50,6 +50,9 @@ def assert_result_info(info, result, entities=None, domains=None, all_states=Fal
     # pylint: disable=protected-access
     assert info._all_states == all_states
     assert info.filter_lifecycle("invalid_entity_name.somewhere") == all_states
+    assert info.all_states == all_states
+    assert info.entities == frozenset(entities or ())
+    assert info.domains == frozenset(domains or ())
     if entities is not None:
         assert info._entities == frozenset(entities)
         assert all([info.filter(entity) for entity in entities])
@@ -63,6 +66,13 @@ def assert_result_info(info, result, entities=None, domains=None, all_states=Fal
         assert not hasattr(info, "_domains")
 
 
+def test_template_is_static():
+    """Test a template without Jinja is static."""
+    assert template.Template("mdi:water").is_static
+    assert not template.Template("{{ states('sensor.test') }}").is_static
+    assert not template.Template("{% if true %}on{% endif %}").is_static
+
+
 def test_template_equality():
     """Test template comparison and hashing."""
     template_one = template.Template("{{ template_one }}")
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -32,6 +33,7 @@ from homeassistant.const import (
 )
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError, InvalidStateError
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -518,6 +520,52 @@ def test_state_dict_conversion():
     assert state == ha.State.from_dict(state.as_dict())
 
 
+def test_state_as_dict_cached():
+    """Test the dictionary of a state is created once and read only."""
+    state = ha.State("domain.hello", "world", {"some": "attr"})
+    as_dict = state.as_dict()
+
+    assert state.as_dict() is as_dict
+    assert as_dict["attributes"] is state.attributes
+    with pytest.raises(RuntimeError):
+        as_dict["state"] = "universe"
+    with pytest.raises(RuntimeError):
+        as_dict["context"]["user_id"] = "abcd"
+
+
+def test_state_as_json():
+    """Test the JSON of a state is the JSON of its dictionary."""
+    state = ha.State(
+        "domain.hello", "world", {"some": "attr", "at": datetime(2020, 1, 1)}
+    )
+
+    assert state.as_json() == json.dumps(state.as_dict(), cls=JSONEncoder)
+    assert state.attributes_json() == '{"some": "attr", "at": "2020-01-01T00:00:00"}'
+    assert state.as_json() is state.as_json()
+
+    with pytest.raises(ValueError):
+        ha.State("domain.hello", "world", {"nan": float("nan")}).as_json()
+
+
+def test_event_as_json():
+    """Test the JSON of an event is the JSON of its dictionary."""
+    event = ha.Event("some_type", {"some": "attr", "at": datetime(2020, 1, 1)})
+
+    assert event.as_json() == json.dumps(event.as_dict(), cls=JSONEncoder)
+    assert event.as_json() is event.as_json()
+
+    with pytest.raises(ValueError):
+        ha.Event("some_type", {"nan": float("nan")}).as_json()
+
+
+def test_state_attributes_read_only():
+    """Test the attributes of a state can't be changed."""
+    state = ha.State("domain.hello", "world", {"some": "attr"})
+
+    with pytest.raises(RuntimeError):
+        state.attributes["some"] = "other"
+
+
 def test_state_dict_conversion_with_wrong_data():
     """Test conversion with wrong data."""
     assert ha.State.from_dict(None) is None
@@ -668,6 +716,17 @@ class TestStateMachine(unittest.TestCase):
         self.hass.block_till_done()
         assert len(events) == 1
 
+    def test_unchanged_attributes_shared(self):
+        """Test a new state shares unchanged attributes with the old state."""
+        self.states.set("light.bowl", "off", {"brightness": 100})
+        old_state = self.states.get("light.bowl")
+
+        self.states.set("light.bowl", "on", {"brightness": 100})
+        assert self.states.get("light.bowl").attributes is old_state.attributes
+
+        self.states.set("light.bowl", "on", {"brightness": 50})
+        assert self.states.get("light.bowl").attributes == {"brightness": 50}
+
 
 def test_service_call_repr():
     """Test ServiceCall repr."""
@@ -1194,6 +1253,19 @@ def test_context():
     assert c.id is not None
 
 
+def test_context_lazy_id():
+    """Test the id of a context is created when used."""
+    c = ha.Context()
+    assert c._id is None
+    assert c.id == c.id
+    assert c._id == c.id
+
+    assert ha.Context(id="abcd") == ha.Context(id="abcd")
+    assert ha.Context(id="abcd") != ha.Context(id="abcd", user_id="efgh")
+    assert ha.Context() != ha.Context()
+    assert len({ha.Context(id="abcd"), ha.Context(id="abcd")}) == 1
+
+
 async def test_async_functions_with_callback(hass):
     """Test we deal with async functions accidentally marked as callback."""
     runs = []
@@ -1,4 +1,8 @@
 """Test to verify that we can load components."""
+import asyncio
+import json
+import pathlib
+
 import pytest
 
 from homeassistant.components import http, hue
@@ -126,6 +130,62 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test built-in integrations are resolved without reading the manifest."""
+    with patch.object(
+        loader.Integration,
+        "resolve_from_root",
+        wraps=loader.Integration.resolve_from_root,
+    ) as mock_resolve:
+        integration = await loader.async_get_integration(hass, "http")
+
+    # Only the custom components are resolved from their manifest
+    assert "http" not in [call[0][2] for call in mock_resolve.call_args_list]
+    assert integration.pkg_path == "homeassistant.components.http"
+    assert integration.file_path == pathlib.Path(http.__file__).parent
+    assert integration.manifest == {
+        **json.loads((integration.file_path / "manifest.json").read_text()),
+        "is_built_in": True,
+    }
+
+
+async def test_get_integration_not_in_index(hass):
+    """Test integrations missing from the index are resolved from the manifest."""
+    hass.data[loader.DATA_MANIFEST_INDEX] = {}
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.domain == "hue"
+    assert hue == integration.get_component()
+
+
+async def test_import_in_executor(hass):
+    """Test components and platforms are imported in the executor."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        assert await integration.async_get_component() is hue
+        assert await integration.async_get_platform("light") is hue_light
+        assert await integration.async_get_component() is hue
+
+    assert len(mock_executor.mock_calls) == 2
+    assert set(hass.data[loader.DATA_IMPORT_TIMES]) == {"hue", "hue.light"}
+
+
+async def test_import_in_event_loop_fallback(hass):
+    """Test modules that can not be imported in the executor are imported."""
+    integration = await loader.async_get_integration(hass, "hue")
+    get_component = integration.get_component
+
+    def import_in_loop():
+        """Create a lock like module level code, needs the event loop thread."""
+        asyncio.Lock()
+        return get_component()
+
+    with patch.object(integration, "get_component", import_in_loop):
+        assert await integration.async_get_component() is hue
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
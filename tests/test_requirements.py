@@ -1,10 +1,11 @@
 """Test requirements module."""
+from datetime import timedelta
 import os
 from pathlib import Path
 
 import pytest
 
-from homeassistant import loader, setup
+from homeassistant import loader, requirements, setup
 from homeassistant.requirements import (
     CONSTRAINT_FILE,
     PROGRESS_FILE,
@@ -13,9 +14,10 @@ from homeassistant.requirements import (
     async_get_integration_with_requirements,
     async_process_requirements,
 )
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import call, patch
-from tests.common import MockModule, mock_integration
+from tests.common import MockModule, async_fire_time_changed, mock_integration
 
 
 def env_without_wheel_links():
@@ -245,3 +247,65 @@ async def test_discovery_requirements_zeroconf(hass, partial_manifest):
 
     assert len(mock_process.mock_calls) == 2  # zeroconf also depends on http
     assert mock_process.mock_calls[0][1][2] == zeroconf.requirements
+
+
+async def test_requirements_cache(hass, hass_storage):
+    """Test satisfied requirements are not checked while the packages are the same."""
+    hass_storage[requirements.STORAGE_KEY] = {
+        "version": requirements.STORAGE_VERSION,
+        "key": requirements.STORAGE_KEY,
+        "data": {"environment": "unchanged", "satisfied": ["hello==1.0.0"]},
+    }
+
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="unchanged"
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+        await async_process_requirements(hass, "test_component", ["world==1.0.0"])
+        await async_process_requirements(hass, "test_component", ["world==1.0.0"])
+
+    assert [mock_call[1][0] for mock_call in mock_is_installed.mock_calls] == [
+        "world==1.0.0"
+    ]
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=requirements.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[requirements.STORAGE_KEY]["data"] == {
+        "environment": "unchanged",
+        "satisfied": ["hello==1.0.0", "world==1.0.0"],
+    }
+
+
+async def test_requirements_cache_changed_environment(hass, hass_storage):
+    """Test requirements are checked again after the packages changed."""
+    hass_storage[requirements.STORAGE_KEY] = {
+        "version": requirements.STORAGE_VERSION,
+        "key": requirements.STORAGE_KEY,
+        "data": {"environment": "old", "satisfied": ["hello==1.0.0"]},
+    }
+
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="new"
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=False
+    ) as mock_is_installed, patch(
+        "homeassistant.util.package.install_package", return_value=True
+    ) as mock_inst:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+    assert len(mock_inst.mock_calls) == 1
+
+    # Installing changes the packages, the next start checks them again
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=requirements.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[requirements.STORAGE_KEY]["data"] == {
+        "environment": None,
+        "satisfied": ["hello==1.0.0"],
+    }
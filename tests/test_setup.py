@@ -567,3 +567,54 @@ async def test_parallel_entry_setup(hass):
     await setup.async_setup_component(hass, "comp", {})
 
     assert calls == [1, 2, 1, 2]
+
+
+async def test_setup_timings(hass):
+    """Test the import and setup time of integrations is recorded."""
+    mock_integration(hass, MockModule("comp"))
+    assert await setup.async_setup_component(hass, "comp", {})
+    assert await setup.async_setup_component(hass, "sun", {})
+
+    timings = setup.async_get_setup_timings(hass)
+
+    # Mocked integrations are not imported
+    assert timings["comp"]["import"] == 0
+    assert timings["comp"]["setup"] >= 0
+    assert timings["sun"]["import"] > 0
+    assert timings["sun"]["setup"] > 0
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of setting up integrations are recorded."""
+    setup_called = asyncio.Event()
+
+    async def async_setup_dep(hass, config):
+        """Set up the dependency after the dependent integration waited."""
+        await setup_called.wait()
+        return True
+
+    mock_integration(hass, MockModule("dep", async_setup=async_setup_dep))
+    mock_integration(hass, MockModule("comp", dependencies=["dep"]))
+
+    task = hass.async_create_task(setup.async_setup_component(hass, "comp", {}))
+    await asyncio.sleep(0.01)
+    setup_called.set()
+    assert await task
+
+    timeline = {item["domain"]: item for item in setup.async_get_setup_timeline(hass)}
+
+    assert timeline["comp"]["dependencies"] >= 0.01
+    assert [phase["phase"] for phase in timeline["comp"]["phases"]] == [
+        setup.PHASE_DEPENDENCIES,
+        setup.PHASE_IMPORT,
+        setup.PHASE_CONFIG,
+        setup.PHASE_SETUP,
+        setup.PHASE_CONFIG_ENTRIES,
+    ]
+    assert timeline["dep"]["start"] >= timeline["comp"]["start"]
+    assert timeline["dep"]["end"] <= timeline["comp"]["end"]
+
+    trace = setup.async_get_setup_chrome_trace(hass)
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert {event["name"] for event in spans} >= {"comp", "dep", "dependencies"}
+    assert all(event["dur"] >= 0 for event in spans)
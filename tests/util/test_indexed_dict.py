@@ -0,0 +1,66 @@
+"""Test indexed dictionary."""
+import copy
+
+import pytest
+
+from homeassistant.util.indexed_dict import IndexedDict
+
+
+class ColorDict(IndexedDict):
+    """Index values by their colors."""
+
+    def _index_keys(self, value):
+        """Index a value under each of its colors."""
+        for color in value["colors"]:
+            yield "color", color
+
+
+def test_indexed_dict():
+    """Test the indexes follow all mutations."""
+    data = ColorDict(apple={"colors": ["red", "green"]})
+    data["banana"] = {"colors": ["yellow"]}
+    data.setdefault("cherry", {"colors": ["red"]})
+    data.update(lemon={"colors": ["yellow"]})
+
+    assert data.get_keys("color", "red") == ["apple", "cherry"]
+    assert data.get_values("color", "yellow") == [
+        {"colors": ["yellow"]},
+        {"colors": ["yellow"]},
+    ]
+    assert data.get_keys("color", "blue") == []
+    assert data.get_keys("size", "large") == []
+
+    data["apple"] = {"colors": ["green"]}
+    assert data.get_keys("color", "red") == ["cherry"]
+    assert data.get_keys("color", "green") == ["apple"]
+
+    del data["cherry"]
+    assert data.get_keys("color", "red") == []
+
+    assert data.pop("banana") == {"colors": ["yellow"]}
+    assert data.pop("banana", None) is None
+    with pytest.raises(KeyError):
+        data.pop("banana")
+    assert data.get_keys("color", "yellow") == ["lemon"]
+
+    assert data.popitem() == ("lemon", {"colors": ["yellow"]})
+    assert data.get_keys("color", "yellow") == []
+
+    copied = copy.deepcopy(data)
+    assert copied.get_keys("color", "green") == ["apple"]
+
+    data.clear()
+    assert data.get_keys("color", "green") == []
+    assert copied.get_keys("color", "green") == ["apple"]
+
+
+def test_indexed_dict_keeps_position_when_key_unchanged():
+    """Test replacing a value keeps its position in an unchanged index."""
+    data = ColorDict(
+        apple={"colors": ["red"]}, cherry={"colors": ["red"]}, plum={"colors": []}
+    )
+
+    data["apple"] = {"colors": ["red"], "ripe": True}
+
+    assert data.get_keys("color", "red") == ["apple", "cherry"]
+    assert list(data) == ["apple", "cherry", "plum"]
@@ -248,3 +248,30 @@ def test_check_package_global():
 def test_check_package_zip():
     """Test for an installed zip package."""
     assert not package.is_installed(TEST_ZIP_REQ)
+
+
+def test_environment_fingerprint(tmp_path):
+    """Test the fingerprint changes when a package is installed."""
+    with patch("homeassistant.util.package.sys.path", [str(tmp_path)]):
+        fingerprint = package.environment_fingerprint()
+        assert package.environment_fingerprint() == fingerprint
+
+        (tmp_path / "test_package-1.0.0.dist-info").mkdir()
+        installed = package.environment_fingerprint()
+        assert installed != fingerprint
+
+        (tmp_path / "test_package-1.0.0.dist-info").rename(
+            tmp_path / "test_package-1.1.0.dist-info"
+        )
+        assert package.environment_fingerprint() not in (fingerprint, installed)
+
+
+def test_environment_fingerprint_other_files(tmp_path):
+    """Test the fingerprint ignores files that are not package metadata."""
+    with patch("homeassistant.util.package.sys.path", [str(tmp_path)]):
+        fingerprint = package.environment_fingerprint()
+
+        (tmp_path / "home-assistant_v2.db-wal").write_text("")
+        (tmp_path / ".HA_VERSION").write_text("0.110.2")
+        os.utime(tmp_path, ns=(0, 0))
+        assert package.environment_fingerprint() == fingerprint